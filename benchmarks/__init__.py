@@ -0,0 +1 @@
+"""Benchmarks of mimesis_stats providers and schemas, run with `python -m benchmarks`"""
@@ -0,0 +1,44 @@
+"""
+Run the benchmark suite.
+
+python -m benchmarks [--sizes 1000 100000 1000000] [--filter NAME] [--json PATH]
+"""
+import argparse
+import fnmatch
+import sys
+
+import benchmarks.bench_providers  # noqa: F401
+import benchmarks.bench_schema  # noqa: F401
+import benchmarks.bench_startup  # noqa: F401
+from benchmarks.harness import BENCHMARKS
+from benchmarks.harness import measure
+from benchmarks.harness import report
+from benchmarks.harness import save
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1000, 100000, 1000000], help="rows per run")
+    parser.add_argument("--filter", default="*", help="glob pattern of benchmark names to run")
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    args = parser.parse_args()
+
+    names = [name for name in BENCHMARKS if fnmatch.fnmatchcase(name, args.filter)]
+    if not names:
+        sys.exit(f"No benchmarks match {args.filter}")
+
+    results = []
+    for rows in args.sizes:
+        for name in names:
+            results.append(measure(name, rows))
+            print(f"{name}: {results[-1].rows} rows in {results[-1].seconds:.3f}s", flush=True)
+
+    print()
+    print(report(results))
+    if args.json:
+        save(results, args.json)
+
+
+if __name__ == "__main__":
+    main()
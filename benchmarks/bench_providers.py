@@ -0,0 +1,89 @@
+"""Benchmarks of individual provider methods"""
+import datetime
+
+from benchmarks.harness import benchmark
+from mimesis_stats.providers.base_stats import BaseStatsDataProvider
+from mimesis_stats.providers.distribution import Distribution
+from mimesis_stats.providers.multivariable import MultiVariable
+from mimesis_stats.providers.time import TimeDistribution
+from mimesis_stats.stats_schema import StatsSchema
+
+SEED = 42
+
+POPULATION = [f"category_{i}" for i in range(50)]
+WEIGHTS = [1 / len(POPULATION)] * len(POPULATION)
+
+VARIABLE_NAMES = ["consent", "count", "fruit"]
+OPTIONS = [("Yes", 1, "Apple"), ("Yes", 2, "Banana"), ("No", None, None)]
+OPTION_WEIGHTS = [0.4, 0.4, 0.2]
+
+START = datetime.datetime(2015, 1, 1)
+END = datetime.datetime(2020, 12, 31)
+
+
+@benchmark("discrete_distribution")
+def discrete_distribution(rows):
+    provider = Distribution(seed=SEED)
+    return lambda: [provider.discrete_distribution(POPULATION, WEIGHTS, null_prop=0.1) for _ in range(rows)]
+
+
+@benchmark("discrete_distribution_batch")
+def discrete_distribution_batch(rows):
+    provider = Distribution(seed=SEED)
+    return lambda: provider.discrete_distribution_batch(POPULATION, WEIGHTS, size=rows, null_prop=0.1)
+
+
+@benchmark("generic_distribution")
+def generic_distribution(rows):
+    provider = Distribution(seed=SEED)
+    return lambda: [provider.generic_distribution("pareto", a=3) for _ in range(rows)]
+
+
+@benchmark("dependent_variables")
+def dependent_variables(rows):
+    provider = MultiVariable(seed=SEED)
+    return lambda: [
+        provider.dependent_variables(VARIABLE_NAMES, OPTIONS, OPTION_WEIGHTS, null_props=[0, 0.1, 0.1])
+        for _ in range(rows)
+    ]
+
+
+@benchmark("generate_time")
+def generate_time(rows):
+    provider = TimeDistribution(seed=SEED)
+    return lambda: [
+        provider.generate_time(START, END, output_type=str, output_format="%Y-%m-%d") for _ in range(rows)
+    ]
+
+
+@benchmark("generate_time_batch")
+def generate_time_batch(rows):
+    provider = TimeDistribution(seed=SEED)
+    return lambda: provider.generate_time_batch(START, END, size=rows, output_type=str, output_format="%Y-%m-%d")
+
+
+@benchmark("generate_time_batch.granularity")
+def generate_time_batch_granularity(rows):
+    provider = TimeDistribution(seed=SEED)
+    return lambda: provider.generate_time_batch(
+        START, END, size=rows, output_type=str, output_format="%d/%m/%Y", granularity="D"
+    )
+
+
+@benchmark("_replace")
+def replace(rows):
+    provider = BaseStatsDataProvider(seed=SEED)
+    return lambda: [provider._replace(i, 0.1) for i in range(rows)]
+
+
+@benchmark("_replace_multiple")
+def replace_multiple(rows):
+    provider = BaseStatsDataProvider(seed=SEED)
+    return lambda: [provider._replace_multiple((i, i, i), [0.1, 0.1, 0.1], None) for i in range(rows)]
+
+
+@benchmark("_unnest")
+def unnest(rows):
+    schema = StatsSchema()
+    record = {"id": 1, "name": "A", "survey": {"consent": "Yes", "count": 1, "fruit": "Apple"}}
+    return lambda: [schema._unnest(record) for _ in range(rows)]
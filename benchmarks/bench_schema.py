@@ -0,0 +1,69 @@
+"""Benchmarks of end to end schema generation, for narrow and wide schemas"""
+from benchmarks.bench_providers import OPTION_WEIGHTS
+from benchmarks.bench_providers import OPTIONS
+from benchmarks.bench_providers import POPULATION
+from benchmarks.bench_providers import SEED
+from benchmarks.bench_providers import VARIABLE_NAMES
+from benchmarks.bench_providers import WEIGHTS
+from benchmarks.harness import benchmark
+from mimesis_stats.stats_schema import FieldSpec
+from mimesis_stats.stats_schema import StatsField
+from mimesis_stats.stats_schema import StatsSchema
+
+# number of categorical and numeric columns in each schema
+WIDTHS = {"narrow": 2, "wide": 50}
+
+
+def specs(width):
+    """Blueprint of an ID, a multi-variable and width categorical and numeric variables."""
+    blueprint = {
+        "ID": FieldSpec("random.custom_code", mask="SCHL#####", digit="#"),
+        "survey": FieldSpec(
+            "dependent_variables", variable_names=VARIABLE_NAMES, options=OPTIONS, weights=OPTION_WEIGHTS
+        ),
+    }
+    for i in range(width):
+        blueprint[f"category_{i}"] = FieldSpec(
+            "discrete_distribution", population=POPULATION, weights=WEIGHTS, null_prop=0.1
+        )
+        blueprint[f"number_{i}"] = FieldSpec("generic_distribution", func="normal", loc=10, scale=2)
+    return blueprint
+
+
+def lambda_schema(width):
+    """The same blueprint as specs, written as a lambda as in the README."""
+    field = StatsField(seed=SEED)
+    blueprint = specs(width)
+    return StatsSchema(lambda: {name: field(spec.name, **spec.kwargs) for name, spec in blueprint.items()})
+
+
+def compiled_schema(width):
+    return StatsSchema.from_specs(specs(width), field=StatsField(seed=SEED))
+
+
+for label, width in WIDTHS.items():
+
+    @benchmark(f"StatsSchema.create[{label}]")
+    def create(rows, width=width):
+        schema = lambda_schema(width)
+        return lambda: schema.create(iterations=rows)
+
+    @benchmark(f"StatsSchema.iterator[{label}]")
+    def iterator(rows, width=width):
+        schema = lambda_schema(width)
+        return lambda: [record for record in schema.iterator(iterations=rows)]
+
+    @benchmark(f"StatsSchema.from_specs.create[{label}]")
+    def create_compiled(rows, width=width):
+        schema = compiled_schema(width)
+        return lambda: schema.create(iterations=rows)
+
+    @benchmark(f"StatsSchema.create_columns[{label}]")
+    def create_columns(rows, width=width):
+        schema = lambda_schema(width)
+        return lambda: schema.create_columns(iterations=rows)
+
+    @benchmark(f"StatsSchema.create_columns.workers[{label}]")
+    def create_columns_workers(rows, width=width):
+        schema = lambda_schema(width)
+        return lambda: schema.create_columns(iterations=rows, categorical=True, workers=4)
@@ -0,0 +1,30 @@
+"""Benchmarks of import and StatsField set up, the start up cost of short lived jobs"""
+import os
+import subprocess
+import sys
+
+from benchmarks.bench_providers import POPULATION
+from benchmarks.bench_providers import SEED
+from benchmarks.bench_providers import WEIGHTS
+from benchmarks.harness import benchmark
+from mimesis_stats.stats_schema import StatsField
+
+
+@benchmark("startup.import", max_rows=20)
+def import_schema(rows):
+    """Each row is a new interpreter importing mimesis_stats.stats_schema, including interpreter start up."""
+    command = [sys.executable, "-c", "import mimesis_stats.stats_schema"]
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    return lambda: [subprocess.run(command, env=env, check=True) for _ in range(rows)]
+
+
+@benchmark("startup.StatsField", max_rows=10000)
+def create_field(rows):
+    return lambda: [StatsField(seed=SEED) for _ in range(rows)]
+
+
+@benchmark("startup.StatsField.first_value", max_rows=10000)
+def first_value(rows):
+    return lambda: [
+        StatsField(seed=SEED)("discrete_distribution", population=POPULATION, weights=WEIGHTS) for _ in range(rows)
+    ]
@@ -0,0 +1,93 @@
+"""Registration, timing and reporting of benchmarks"""
+import gc
+import json
+import time
+import tracemalloc
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+
+# benchmark name: setup(rows) returning a zero argument function that generates rows values
+BENCHMARKS: Dict[str, Callable[[int], Callable[[], Any]]] = {}
+
+# benchmark name: most rows to run, for benchmarks too slow to run at every size
+LIMITS: Dict[str, int] = {}
+
+
+class Result(NamedTuple):
+    """Measurements of a single benchmark run."""
+
+    name: str
+    rows: int
+    seconds: float
+    rows_per_second: float
+    peak_mib: float
+
+
+def benchmark(name: str, max_rows: Optional[int] = None) -> Callable:
+    """
+    Register a benchmark setup function under name.
+
+    The setup function takes the number of rows and returns a function,
+    taking no arguments, that generates that many rows. Runs are capped
+    at max_rows rows where given.
+    """
+
+    def decorator(setup: Callable[[int], Callable[[], Any]]) -> Callable[[int], Callable[[], Any]]:
+        if name in BENCHMARKS:
+            raise KeyError(f"{name} benchmark already registered")
+        BENCHMARKS[name] = setup
+        if max_rows is not None:
+            LIMITS[name] = max_rows
+        return setup
+
+    return decorator
+
+
+def measure(name: str, rows: int) -> Result:
+    """
+    Time one run of a benchmark, then measure peak memory in a second run.
+
+    Both runs use a freshly set up (and so identically seeded) benchmark.
+    Peak memory is of Python allocations, traced with tracemalloc.
+    """
+    setup = BENCHMARKS[name]
+    rows = min(rows, LIMITS.get(name, rows))
+
+    run = setup(rows)
+    gc.collect()
+    start = time.perf_counter()
+    run()
+    seconds = time.perf_counter() - start
+
+    run = setup(rows)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Result(name, rows, seconds, rows / seconds if seconds else float("inf"), peak / 2 ** 20)
+
+
+def report(results: List[Result]) -> str:
+    """Format results as a fixed width table."""
+    width = max([len("benchmark")] + [len(result.name) for result in results])
+    lines = [f"{'benchmark':<{width}} {'rows':>9} {'seconds':>9} {'rows/sec':>12} {'peak MiB':>9}"]
+    for result in results:
+        lines.append(
+            f"{result.name:<{width}} {result.rows:>9} {result.seconds:>9.3f} "
+            f"{result.rows_per_second:>12.0f} {result.peak_mib:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+def save(results: List[Result], path: str) -> None:
+    """Write results as JSON, for comparison between runs."""
+    with open(path, "w") as f:
+        json.dump([result._asdict() for result in results], f, indent=2)
@@ -1,5 +1,6 @@
 from typing import Any
 
+import numpy as np
 import pytest
 from mimesis_stats.providers.base_stats import BaseStatsDataProvider
 from mimesis_stats.stats_schema import StatsField
@@ -25,6 +26,8 @@ def dummy_provider():
         -------
         one
             returns 1
+        one_batch
+            returns array of 1s
         characters
             returns "ABC"
         dictionary
@@ -42,6 +45,10 @@ def dummy_provider():
         def one():
             return 1
 
+        @staticmethod
+        def one_batch(size):
+            return np.ones(size, dtype=int)
+
         @staticmethod
         def characters():
             return "ABC"
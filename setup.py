@@ -3,7 +3,7 @@ import setuptools
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
-install_requires = ["mimesis>=4.1.3", "numpy>=1.19.5"]
+install_requires = ["mimesis>=4.1.3,<5", "numpy>=1.19.5"]
 
 dev_specific_install_requires = [
     "pre-commit==2.12.1",
@@ -11,8 +11,11 @@ dev_specific_install_requires = [
     "pytest>=3.6,<4",
     "pytest-regressions==2.2.0",
     "scipy>=1.5.4",
+    "pyarrow>=3.0.0",
 ]
 
+arrow_install_requires = ["pyarrow>=3.0.0"]
+
 dev_install_requires = dev_specific_install_requires + install_requires
 
 setuptools.setup(
@@ -40,5 +43,5 @@ setuptools.setup(
     package_dir={"": "src"},
     python_requires=">=3.6.8",
     install_requires=install_requires,
-    extras_require={"dev": dev_install_requires, "ci": dev_install_requires},
+    extras_require={"dev": dev_install_requires, "ci": dev_install_requires, "arrow": arrow_install_requires},
 )
@@ -0,0 +1,247 @@
+"""Provides dictionary encoded columns of generated categories"""
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+import numpy as np
+
+
+def _code_dtype(n_categories: int) -> np.dtype:
+    """Smallest signed integer type holding codes of n_categories and -1 for null."""
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_categories <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+def _merge_positions(values: Iterable[Any]) -> Optional[Dict[Any, int]]:
+    """
+    Position of each distinct non-null value, in order of first appearance.
+
+    None when the values cannot be merged, being unhashable, or equal but of
+    different types, such as 1 and True.
+    """
+    positions: Dict[Any, int] = {}
+    types: Dict[int, type] = {}
+    try:
+        for value in values:
+            if value is None:
+                continue
+            position = positions.setdefault(value, len(positions))
+            if types.setdefault(position, type(value)) is not type(value):
+                return None
+    except TypeError:
+        return None
+    return positions
+
+
+class CategoricalColumn:
+    """
+    Class holding a column of categories as integer codes into a table of
+    unique categories, so values are never stored per row.
+
+    Null values (None) are held as the code -1.
+
+    Methods
+    -------
+    from_population
+        Encode a column from indices into a population with possible repeats.
+    concatenate
+        Join columns end to end, merging their categories.
+    replace
+        Replace the values under a mask.
+    decode
+        Values as an object array.
+    to_pandas
+        Convert to a pandas Categorical.
+    to_arrow
+        Convert to a pyarrow DictionaryArray.
+
+    Examples
+    --------
+    >>>column = CategoricalColumn(codes=[1, 0, -1], categories=["Yes", "No"])
+    >>>column.tolist()
+    ["No", "Yes", None]
+    """
+
+    __slots__ = ("codes", "categories")
+
+    def __init__(self, codes: Union[Sequence[int], np.ndarray], categories: Sequence[Any]) -> None:
+        """
+        Parameters
+        ----------
+        codes
+            Index into categories of each value, -1 for null
+        categories
+            Unique values of the column
+        """
+        self.categories = list(categories)
+        self.codes = np.asarray(codes, dtype=_code_dtype(len(self.categories)))
+
+    @classmethod
+    def from_population(cls, indices: np.ndarray, population: Union[Sequence[Any], np.ndarray]) -> "CategoricalColumn":
+        """
+        Encode a column of population[indices], merging repeated population values.
+
+        Parameters
+        ----------
+        indices
+            Index into population of each value
+        population
+            Values sampled from, which may repeat, None is treated as null
+
+        Returns
+        -------
+        CategoricalColumn of the sampled values
+
+        Notes
+        -----
+        Populations that cannot be merged, holding unhashable values or equal values of
+        different types such as 1 and True, have one category per population index.
+        """
+        positions = _merge_positions(population)
+        if positions is None:
+            lookup = [index if value is not None else -1 for index, value in enumerate(population)]
+            categories = list(population)
+        else:
+            lookup = [positions[value] if value is not None else -1 for value in population]
+            categories = list(positions)
+
+        return cls(np.asarray(lookup, dtype=_code_dtype(len(categories)))[indices], categories)
+
+    @classmethod
+    def concatenate(cls, columns: Sequence["CategoricalColumn"]) -> "CategoricalColumn":
+        """
+        Join columns end to end, with the categories of all of them.
+
+        Parameters
+        ----------
+        columns
+            CategoricalColumns to join, in order
+
+        Returns
+        -------
+        CategoricalColumn of every value, categories in order of first appearance
+
+        Notes
+        -----
+        Categories that cannot be merged, see from_population, are kept for each column.
+        """
+        positions = _merge_positions(category for column in columns for category in column.categories)
+        if positions is None:
+            categories = [category for column in columns for category in column.categories]
+        else:
+            categories = list(positions)
+
+        dtype = _code_dtype(len(categories))
+        codes = []
+        offset = 0
+        for column in columns:
+            if positions is None:
+                mapped = list(range(offset, offset + len(column.categories)))
+                offset += len(column.categories)
+            else:
+                mapped = [positions[category] if category is not None else -1 for category in column.categories]
+            # trailing -1 keeps null codes null
+            lookup = np.array(mapped + [-1], dtype=dtype)
+            codes.append(lookup[column.codes])
+
+        return cls(np.concatenate(codes) if codes else np.array([], dtype=dtype), categories)
+
+    def __len__(self) -> int:
+
+        return len(self.codes)
+
+    def __iter__(self) -> Iterator[Any]:
+
+        return iter(self.tolist())
+
+    def __getitem__(self, key: Any) -> Union[Any, "CategoricalColumn"]:
+
+        codes = self.codes[key]
+        if np.ndim(codes):
+            return CategoricalColumn(codes, self.categories)
+        return self.categories[codes] if codes >= 0 else None
+
+    def __array__(self, dtype: Any = None) -> np.ndarray:
+
+        return self.decode() if dtype is None else self.decode().astype(dtype)
+
+    def __repr__(self) -> str:
+
+        return f"CategoricalColumn(codes={self.codes!r}, categories={self.categories!r})"
+
+    def replace(self, mask: np.ndarray, value: Any = None) -> "CategoricalColumn":
+        """
+        Replace values where mask is True, adding value as a category if needed.
+
+        Parameters
+        ----------
+        mask
+            Boolean array, True where the value is replaced
+        value
+            Replacement, None gives the null code
+
+        Returns
+        -------
+        New CategoricalColumn, sharing no codes with this one
+        """
+        categories = self.categories
+        if value is None:
+            code = -1
+        elif value in categories:
+            code = categories.index(value)
+        else:
+            categories = categories + [value]
+            code = len(self.categories)
+
+        codes = self.codes.astype(_code_dtype(len(categories)))
+        codes[mask] = code
+        return CategoricalColumn(codes, categories)
+
+    def decode(self) -> np.ndarray:
+        """
+        Values of the column as an object array, with None for nulls.
+        """
+        table = np.empty(len(self.categories) + 1, dtype=object)
+        table[:-1] = self.categories
+        # code -1 reads the trailing None
+        return table[self.codes]
+
+    def tolist(self) -> List[Any]:
+        """
+        Values of the column as a list, with None for nulls.
+        """
+        return self.decode().tolist()
+
+    def to_pandas(self) -> Any:
+        """
+        Convert to a pandas Categorical, sharing the codes.
+
+        Requires pandas.
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError("pandas is required to convert to a Categorical: pip install pandas")
+
+        return pd.Categorical.from_codes(self.codes, categories=self.categories)
+
+    def to_arrow(self) -> Any:
+        """
+        Convert to a pyarrow DictionaryArray, nulls being masked codes.
+
+        Requires the optional pyarrow dependency.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("pyarrow is required for Arrow / Parquet output: pip install mimesis_stats[arrow]")
+
+        indices = pa.array(self.codes, mask=self.codes < 0)
+        return pa.DictionaryArray.from_arrays(indices, pa.array(self.categories))
@@ -0,0 +1,159 @@
+"""Provides vectorised null injection for columns of generated data"""
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import numpy as np
+from mimesis_stats.categorical import CategoricalColumn
+
+
+class Missingness:
+    """
+    Class for adding missing values to a batch of columns in bulk.
+
+    One mask is drawn per column for the whole batch, supporting
+
+    * missing completely at random (MCAR) values at a rate per column
+    * correlated missingness, where cells in the same row tend to be missing together
+    * row-wise missingness, where a whole row is missing (unit non-response)
+
+    Methods
+    -------
+    masks
+        Draw the boolean missing value masks for a batch.
+    apply
+        Replace the masked values of a batch of columns with their null value.
+
+    Examples
+    --------
+    >>>missingness = Missingness(
+        null_props={"income": 0.2, "occupation": 0.1},
+        null_values={"occupation": "Unknown"},
+        correlation=0.5,
+        row_prop=0.05,
+        seed=42,
+    )
+    >>>schema.create_columns(iterations=10**6, missingness=missingness)
+    """
+
+    def __init__(
+        self,
+        null_props: Dict[str, float],
+        null_values: Optional[Dict[str, Any]] = None,
+        correlation: float = 0,
+        row_prop: float = 0,
+        row_columns: Optional[List[str]] = None,
+        seed: Any = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        null_props
+            Proportion of values to replace as null, for each column name
+        null_values
+            The (null) value to replace a sample with for each column name, None by default
+        correlation
+            Probability, in [0, 1], that a cell shares its row's random draw rather than
+            taking its own. 0 gives independent (MCAR) columns, 1 nests the missing
+            values of columns with lower proportions within those with higher.
+            Proportions of each column are unaffected.
+        row_prop
+            Proportion of rows where every column in row_columns is null
+        row_columns
+            Columns nulled by row_prop, by default all the columns of the batch
+        seed
+            Seed for the masks' numpy Generator
+        """
+        for name, proportion in list(null_props.items()) + [("correlation", correlation), ("row_prop", row_prop)]:
+            if not 0 <= proportion <= 1:
+                raise ValueError(f"{name} proportion must be within [0, 1], it is {proportion}")
+
+        self.null_props = null_props
+        self.null_values = null_values or {}
+        self.correlation = correlation
+        self.row_prop = row_prop
+        self.row_columns = row_columns
+        self.rng = np.random.default_rng(seed)
+
+    def masks(self, size: int, columns: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        Draw the missing value masks for a batch.
+
+        Parameters
+        ----------
+        size
+            Number of rows in the batch
+        columns
+            Names of all columns in the batch, for row-wise missingness
+
+        Returns
+        -------
+        Dictionary of column name: boolean array, True where missing
+        """
+        row_columns = self.row_columns if self.row_columns is not None else columns or []
+        names = list(self.null_props) + [name for name in row_columns if name not in self.null_props]
+
+        shared = self.rng.random(size) if self.correlation else None
+        rows = self.rng.random(size) < self.row_prop if self.row_prop else None
+
+        masks = {}
+        for name in names:
+            proportion = self.null_props.get(name, 0)
+            if proportion:
+                draws = self.rng.random(size)
+                if shared is not None:
+                    draws = np.where(self.rng.random(size) < self.correlation, shared, draws)
+                mask = draws < proportion
+            else:
+                mask = np.zeros(size, dtype=bool)
+            if rows is not None and name in row_columns:
+                mask |= rows
+            masks[name] = mask
+
+        return masks
+
+    def apply(self, columns: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Replace masked values in a batch of columns.
+
+        Parameters
+        ----------
+        columns
+            Dictionary of column name: array, CategoricalColumn or list of values,
+            as from StatsSchema.create_columns
+
+        Returns
+        -------
+        Dictionary of column name: array, CategoricalColumn or list of values, with nulls added
+
+        Raises
+        ------
+        KeyError
+            If a column given null proportions is not in the batch.
+        """
+        missing = [name for name in self.null_props if name not in columns]
+        if missing:
+            raise KeyError(f"{missing} not in generated columns")
+
+        size = len(next(iter(columns.values()))) if columns else 0
+        columns = dict(columns)
+
+        for name, mask in self.masks(size, list(columns)).items():
+            if not mask.any():
+                continue
+            replacement = self.null_values.get(name)
+            column = columns[name]
+            if isinstance(column, CategoricalColumn):
+                column = column.replace(mask, replacement)
+            elif isinstance(column, np.ndarray):
+                column = column.astype(object)
+                # fill an object array first, so sequence replacements are not broadcast
+                filler = np.empty(mask.sum(), dtype=object)
+                filler.fill(replacement)
+                column[mask] = filler
+            else:
+                column = [replacement if masked else value for value, masked in zip(column, mask)]
+            columns[name] = column
+
+        return columns
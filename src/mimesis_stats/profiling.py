@@ -0,0 +1,110 @@
+"""Provides timing of provider methods used in schema generation"""
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+
+
+class FieldProfile(NamedTuple):
+    """Cumulative timing of one provider method."""
+
+    name: str
+    calls: int
+    values: int
+    seconds: float
+
+    @property
+    def seconds_per_value(self) -> float:
+        return self.seconds / self.values if self.values else 0.0
+
+
+class ProfileReport:
+    """
+    Class collecting per provider method timings from StatsFields.
+
+    Times are inclusive: a method calling other fields while it runs, such as
+    the lazy options of dependent_variables, includes the time of those calls,
+    which are also reported separately.
+
+    Methods
+    -------
+    record
+        Add the timing of one call.
+    fields
+        Timings of each method, slowest first.
+    to_dict
+        Timings as a dictionary, e.g. for a DataFrame.
+
+    Examples
+    --------
+    >>>with schema.profile() as report:
+    ...    schema.create(iterations=10000)
+    >>>print(report)
+    field                        calls     values   seconds  % time
+    person.full_name             10000      10000     0.912    81.4
+    discrete_distribution        10000      10000     0.208    18.6
+    """
+
+    def __init__(self) -> None:
+
+        # name: [calls, values, seconds]
+        self._totals: Dict[str, List[float]] = {}
+
+    def record(self, name: str, seconds: float, values: int = 1) -> None:
+        """
+        Add the timing of one call.
+
+        Parameters
+        ----------
+        name
+            Provider method name, as given to the StatsField
+        seconds
+            Time taken by the call
+        values
+            Number of values the call produced, above 1 for batch methods
+        """
+        totals = self._totals.get(name)
+        if totals is None:
+            totals = self._totals[name] = [0, 0, 0.0]
+        totals[0] += 1
+        totals[1] += values
+        totals[2] += seconds
+
+    def fields(self) -> List[FieldProfile]:
+        """
+        Timings of each provider method, slowest first.
+        """
+        profiles = [self[name] for name in self._totals]
+        return sorted(profiles, key=lambda profile: profile.seconds, reverse=True)
+
+    def __getitem__(self, name: str) -> FieldProfile:
+
+        calls, values, seconds = self._totals[name]
+        return FieldProfile(name, int(calls), int(values), seconds)
+
+    def __contains__(self, name: str) -> bool:
+
+        return name in self._totals
+
+    @property
+    def seconds(self) -> float:
+        """Total time recorded, which double counts nested field calls."""
+        return sum(totals[2] for totals in self._totals.values())
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """
+        Timings as a dictionary of name: {"calls", "values", "seconds"}, slowest first.
+        """
+        return {profile.name: profile._asdict() for profile in self.fields()}
+
+    def __str__(self) -> str:
+
+        profiles = self.fields()
+        total = self.seconds or 1.0
+        width = max([len("field")] + [len(profile.name) for profile in profiles])
+        lines = [f"{'field':<{width}} {'calls':>10} {'values':>10} {'seconds':>9} {'% time':>7}"]
+        for profile in profiles:
+            lines.append(
+                f"{profile.name:<{width}} {profile.calls:>10} {profile.values:>10} "
+                f"{profile.seconds:>9.3f} {100 * profile.seconds / total:>7.1f}"
+            )
+        return "\n".join(lines)
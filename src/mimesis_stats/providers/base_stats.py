@@ -1,36 +1,378 @@
+import functools
+import inspect
+import zlib
+from collections import OrderedDict
 from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Iterator
 from typing import List
+from typing import Optional
+from typing import overload
+from typing import Sequence
 from typing import Tuple
 from typing import Union
 
 import numpy as np
 from mimesis.providers.base import BaseDataProvider
+from mimesis_stats.categorical import CategoricalColumn
+from mimesis_stats.sampling import AliasSampler
+
+
+def _accepts_size(func: Callable) -> Optional[bool]:
+    """
+    Whether func takes a `size` keyword according to its signature.
+    None when this cannot be told, for builtins and functions taking **kwargs.
+    """
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return None
+
+    if any(parameter.name == "size" for parameter in parameters):
+        return True
+    if any(parameter.kind == parameter.VAR_KEYWORD for parameter in parameters):
+        return None
+    return False
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Hashable equivalent of value for use in cache keys, lists and dicts becoming tuples.
+
+    Raises
+    ------
+    TypeError
+        If value holds something unhashable, such as an array.
+    """
+    if isinstance(value, (list, tuple)):
+        frozen = tuple(value)
+        try:
+            # flat sequences of hashable values, such as weights, need no recursion
+            hash(frozen)
+        except TypeError:
+            frozen = tuple(_freeze(element) for element in value)
+        return frozen
+    if isinstance(value, dict):
+        return tuple((k, _freeze(v)) for k, v in value.items())
+    hash(value)
+    return value
+
+
+def _store(cache: Dict, key: Hashable, value: Any, limit: int) -> Any:
+    """Add value to cache, first dropping the oldest entry if cache holds limit entries."""
+    if len(cache) >= limit:
+        del cache[next(iter(cache))]
+    cache[key] = value
+    return value
+
+
+def _population_array(population: Sequence[Any]) -> np.ndarray:
+    """
+    1-D array of the elements of population, to index samples from.
+
+    Populations of a single numeric or string type keep their numpy dtype, others are
+    held as objects so mixed types are not coerced and sequences are kept as elements.
+    """
+    kinds = {type(element) for element in population}
+    if len(kinds) == 1 and issubclass(kinds.pop(), (bool, int, float, str, np.number, np.bool_)):
+        return np.asarray(population)
+
+    array = np.empty(len(population), dtype=object)
+    array[:] = population
+    return array
+
+
+def buffered(method: Callable) -> Callable:
+    """
+    Decorator serving a scalar provider method from its `<method>_batch`
+    counterpart, through a buffer, when the provider's buffer_size is set.
+
+    Values are buffered per set of arguments, calls with arguments that
+    cannot be hashed are passed straight to the method.
+    """
+    batch_name = f"{method.__name__}_batch"
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self: "BaseStatsDataProvider", *args: Any, **kwargs: Any) -> Any:
+        if self.buffer_size <= 0:
+            return method(self, *args, **kwargs)
+
+        if args:
+            # batch methods take size after the positional parameters, so pass everything by keyword
+            bound = signature.bind(self, *args, **kwargs)
+            kwargs = {
+                name: value
+                for name, value in bound.arguments.items()
+                if name != "self" and signature.parameters[name].kind != inspect.Parameter.VAR_KEYWORD
+            }
+            kwargs.update(bound.arguments.get("kwargs", {}))
+
+        try:
+            key = (method.__name__, _freeze(kwargs))
+        except TypeError:
+            return method(self, **kwargs)
+
+        batch = getattr(self, batch_name)
+        return self._buffered(key, lambda size: batch(size=size, **kwargs), self.buffer_size)
+
+    return wrapper
 
 
 class BaseStatsDataProvider(BaseDataProvider):
     """
     Class for all mimesis_stats providers to inherit.
 
-    Allows access to generic _replace() across all providers and
-    consistent random seeding.
+    Allows access to generic _replace() across all providers,
+    consistent random seeding and cached samplers for fixed weights.
+
+    Attributes
+    ----------
+    rng
+        numpy Generator (PCG64) owned by the provider, seeded from the provider seed.
+    buffer_size
+        When above 0, scalar methods decorated with @buffered draw up to this many values
+        at a time from their batch counterpart and return them one per call.
+        Output is deterministic for a given seed and buffer_size.
+    max_buffers
+        Number of buffers, one per method and set of arguments, to keep.
+        The least recently used buffer is dropped beyond this.
 
 
     Notes
     -----
-    Sets global seed for numpy.
+    Each provider holds its own numpy random state, the global numpy
+    seed is never set. Providers sharing a seed draw from independent
+    streams, separated by their Meta.name.
     """
 
     class Meta:
         name = "base_stats"
 
+    # number of entries to keep in each of the provider's caches
+    _max_cached = 128
+
+    buffer_size = 0
+    max_buffers = 128
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
 
+        self._samplers: Dict[Tuple[float, ...], AliasSampler] = {}
+        self._sampler_ids: Dict[int, Tuple[Sequence[float], AliasSampler]] = {}
+        self._size_support: Dict[Callable, bool] = {}
+        self._compiled: Dict[Tuple[int, Callable], Tuple[Any, Any]] = {}
+        # buffer iterator and the number of values it was filled with
+        self._buffers: "OrderedDict[Hashable, Tuple[Iterator[Any], int]]" = OrderedDict()
+
         super().__init__(*args, **kwargs)
 
-        np.random.seed(self.seed)
+        # seeded providers are set up by reseed() during super().__init__
+        if self.seed is None:
+            self._seed_generator(None)
+
+    def reseed(self, seed: Any = None) -> None:
+        """
+        Reseed the mimesis random generator and the numpy Generator.
+
+        Parameters
+        ----------
+        seed
+            Seed for random, when None fresh entropy from the OS is used.
+        """
+        super().reseed(seed)
+        self._seed_generator(seed)
+
+    def _seed_generator(self, seed: Any) -> None:
+        """
+        Create the numpy Generator for seed, salted by the provider name.
+        """
+        self._seed_sequence = np.random.SeedSequence(seed, spawn_key=(zlib.crc32(self.Meta.name.encode()),))
+        self.rng = np.random.Generator(np.random.PCG64(self._seed_sequence))
+        # values drawn before reseeding must not be handed out after
+        self._buffers.clear()
+
+    def spawn(self, n_children: int) -> List[np.random.Generator]:
+        """
+        Create independent child Generators from the provider's seed.
+
+        Parameters
+        ----------
+        n_children
+            Number of Generators to create
+
+        Returns
+        -------
+        List of numpy Generators
+
+        Notes
+        -----
+        Children are derived with numpy SeedSequence.spawn, so are reproducible
+        for a given seed and statistically independent of the provider and
+        each other. Suitable for handing to threads or worker processes.
+        """
+        return [np.random.Generator(np.random.PCG64(child)) for child in self._seed_sequence.spawn(n_children)]
 
-    @staticmethod
-    def _replace(value: Any, proportion: float = 0.0, replacement: Any = None) -> Any:
+    def _as_function(self, func: Union[Callable, str]) -> Callable:
+        """
+        Allow a distribution to be given by the name of a provider rng method.
+        e.g. "normal" for self.rng.normal
+        """
+        if isinstance(func, str):
+            return getattr(self.rng, func)
+        return func
+
+    def _get_sampler(self, weights: Sequence[float]) -> AliasSampler:
+        """
+        Fetch the alias sampler for weights, building it on first use.
+
+        Parameters
+        ----------
+        weights
+            Probabilities to weight the sampling
+
+        Returns
+        -------
+        AliasSampler drawing indices of weights
+
+        Notes
+        -----
+        Samplers are looked up first on the identity of weights, so reusing a
+        weights object costs the same however many weights there are, and it
+        must not be changed once used. They are also cached on the weight values,
+        so a blueprint that rebuilds the same weights list every row still
+        validates them only once. The oldest sampler is dropped once _max_cached are held.
+        """
+        cached = self._sampler_ids.get(id(weights))
+        # holding the weights means their id cannot be reused while cached
+        if cached is not None and cached[0] is weights:
+            return cached[1]
+
+        key = tuple(weights)
+        sampler = self._samplers.get(key)
+
+        if sampler is None:
+            sampler = _store(self._samplers, key, AliasSampler(weights), self._max_cached)
+
+        _store(self._sampler_ids, id(weights), (weights, sampler), self._max_cached)
+        return sampler
+
+    def _compile(self, definition: Any, builder: Callable[[Any], Any]) -> Any:
+        """
+        Build and cache an object derived from a definition, such as a network of tables.
+
+        Parameters
+        ----------
+        definition
+            Object to build from, cached on its identity so need not be hashable
+        builder
+            Function taking the definition and returning the derived object
+
+        Returns
+        -------
+        Result of builder(definition), built on first use
+
+        Notes
+        -----
+        The definition must not be changed once used. Definitions created anew
+        on every call (e.g. written inside a schema blueprint) are rebuilt every call.
+        """
+        key = (id(definition), builder)
+        cached = self._compiled.get(key)
+
+        # holding the definition means its id cannot be reused while cached
+        if cached is None or cached[0] is not definition:
+            cached = _store(self._compiled, key, (definition, builder(definition)), self._max_cached)
+
+        return cached[1]
+
+    def _draw_batch(self, func: Union[Callable, str], size: int, **kwargs: Any) -> np.ndarray:
+        """
+        Draw size values from a distribution function in a single call where possible.
+
+        Functions accepting a `size` keyword (numpy, scipy rvs) are called once,
+        others are called once per value.
+
+        Notes
+        -----
+        Support for size is read from the function signature. Where that is
+        not conclusive the function is tried with size, and the outcome cached.
+        """
+        func = self._as_function(func)
+
+        try:
+            supports_size = self._size_support.get(func)
+        except TypeError:
+            supports_size = False
+
+        if supports_size is None:
+            supports_size = _accepts_size(func)
+
+        values = None
+        if supports_size is not False:
+            try:
+                values = np.asarray(func(size=size, **kwargs))
+            except TypeError:
+                if supports_size:
+                    raise
+            # a function swallowing size in **kwargs may still give a single value
+            if values is not None and values.shape[:1] != (size,):
+                values = None
+            try:
+                _store(self._size_support, func, values is not None, self._max_cached)
+            except TypeError:
+                pass
+
+        if values is None:
+            values = np.array([func(**kwargs) for _ in range(size)])
+        return values
+
+    def _buffered(self, key: Hashable, refill: Callable[[int], Any], buffer_size: int) -> Any:
+        """
+        Hand out values one at a time from a buffer of pre-drawn values.
+
+        Parameters
+        ----------
+        key
+            Identifies the buffer, a method name and its arguments
+        refill
+            Function drawing a given number of values, called when the buffer is empty
+        buffer_size
+            Maximum number of values to draw at a time
+
+        Returns
+        -------
+        Next value from the buffer
+
+        Notes
+        -----
+        A new buffer first draws a single value, doubling on each refill up to
+        buffer_size. Holds at most max_buffers buffers, dropping the least recently used.
+        """
+        buffer, size = self._buffers.get(key, (None, 0))
+        if buffer is not None:
+            self._buffers.move_to_end(key)
+            try:
+                return next(buffer)
+            except StopIteration:
+                pass
+
+        # start small and double, so arguments that differ on every call waste little
+        size = min(max(2 * size, 1), buffer_size)
+        values = refill(size)
+        if isinstance(values, dict):
+            # multi-variable batches become one dict per value
+            values = [dict(zip(values, row)) for row in zip(*values.values())]
+        elif isinstance(values, np.ndarray):
+            values = values.tolist()
+
+        buffer = iter(values)
+        self._buffers.pop(key, None)
+        _store(self._buffers, key, (buffer, size), self.max_buffers)
+        return next(buffer)
+
+    def _replace(self, value: Any, proportion: float = 0.0, replacement: Any = None) -> Any:
         """
         Replace value with given probability.
         Normally used with a None replacement.
@@ -57,11 +399,69 @@ class BaseStatsDataProvider(BaseDataProvider):
         if not proportion:
             return value
 
-        if np.random.uniform(size=None) < proportion:
+        if self.rng.random() < proportion:
             return replacement
         else:
             return value
 
+    @overload
+    def _replace_batch(self, values: np.ndarray, proportion: float = 0.0, replacement: Any = None) -> np.ndarray:
+        ...
+
+    @overload
+    def _replace_batch(
+        self, values: CategoricalColumn, proportion: float = 0.0, replacement: Any = None
+    ) -> CategoricalColumn:
+        ...
+
+    def _replace_batch(
+        self, values: Union[np.ndarray, CategoricalColumn], proportion: float = 0.0, replacement: Any = None
+    ) -> Union[np.ndarray, CategoricalColumn]:
+        """
+        Vectorised self._replace() for an array of values.
+
+        Replace each value with given probability, drawing a single mask
+        for the whole array.
+
+        Parameters
+        ----------
+        values
+            Values that may be replaced with Null value
+        proportion
+            Probability of individual replacement with null
+            Matches overall proportion null desired at large sample size
+        replacement
+            The null or otherwise value that will replace the input given
+            the probability.
+
+        Returns
+        -------
+        Array of value or null
+
+        Notes
+        -----
+        Defaults cause no replacement.
+        The array is converted to object dtype when replacements are made, so
+        that the replacement (typically None) can be held. CategoricalColumns
+        instead hold the replacement as a code.
+        """
+        if not proportion:
+            return values
+
+        mask = self.rng.random(size=len(values)) < proportion
+        if not mask.any():
+            return values
+
+        if isinstance(values, CategoricalColumn):
+            return values.replace(mask, replacement)
+
+        values = np.asarray(values).astype(object)
+        # fill an object array first, so sequence replacements are not broadcast
+        filler = np.empty(mask.sum(), dtype=object)
+        filler.fill(replacement)
+        values[mask] = filler
+        return values
+
     def _replace_multiple(
         self, values: Tuple[Any], proportions: Union[List[float], int], replacements: Any
     ) -> Tuple[Any, ...]:
@@ -0,0 +1,220 @@
+"""Provides correlated numeric variables"""
+import functools
+import math
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Union
+
+import numpy as np
+from mimesis_stats.providers.base_stats import BaseStatsDataProvider
+
+# keep uniforms strictly within (0, 1) so inverse CDFs stay finite
+_LOWEST = np.nextafter(0, 1)
+_HIGHEST = np.nextafter(1, 0)
+
+
+@functools.lru_cache(maxsize=None)
+def _normal_cdf() -> Callable[[np.ndarray], np.ndarray]:
+    """Vectorised standard normal CDF, from scipy where installed."""
+    try:
+        from scipy.special import ndtr
+    except ImportError:
+        erf = np.vectorize(math.erf, otypes=[float])
+        return lambda x: 0.5 * (1 + erf(np.asarray(x) / math.sqrt(2)))
+    return ndtr
+
+
+def _factorise(correlation: Sequence[Sequence[float]]) -> np.ndarray:
+    """
+    Lower triangular Cholesky factor of a correlation matrix.
+
+    Raises
+    ------
+    ValueError
+        If correlation is not a valid correlation matrix.
+    """
+    matrix = np.asarray(correlation, dtype=float)
+
+    if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+        raise ValueError("correlation must be a square matrix")
+    if not np.allclose(matrix, matrix.T) or not np.allclose(np.diag(matrix), 1):
+        raise ValueError("correlation must be symmetric with a unit diagonal")
+    try:
+        return np.linalg.cholesky(matrix)
+    except np.linalg.LinAlgError:
+        raise ValueError("correlation must be positive definite")
+
+
+class GaussianCopula(BaseStatsDataProvider):
+    """
+    Class for producing multiple numeric variables correlated with one another.
+
+    Correlated standard normal values are mapped through the normal CDF to
+    correlated uniforms, then through each variable's inverse CDF (marginal).
+
+    Returns a dictionary of name: value pairs, for later unpacking.
+
+    Methods
+    -------
+    correlated_variables
+        Sample one value of each variable.
+    correlated_variables_batch
+        Sample arrays of each variable.
+    """
+
+    class Meta:
+        name = "gaussian_copula"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+
+        super().__init__(*args, **kwargs)
+
+    def correlated_variables(
+        self,
+        variable_names: List[str],
+        correlation: Sequence[Sequence[float]],
+        marginals: Sequence[Optional[Callable]],
+        null_props: Union[List[float], int] = 0,
+        null_values: List[Any] = None,
+    ) -> dict:
+        """
+        Sample correlated variables with given marginal distributions.
+
+        Parameters
+        ----------
+        variable_names
+            Name of each variable, becomes the keys in returned dictionary.
+        correlation
+            Correlation matrix of the underlying normal variables, one row and column per variable.
+            Must be symmetric and positive definite with ones on the diagonal.
+        marginals
+            Inverse CDF (percent point function) of each variable, taking a probability
+            in (0, 1), e.g. scipy.stats.lognorm(0.5).ppf. None leaves a standard normal value.
+        null_props
+            Proportion of each element to be nulled
+        null_values
+            Value to replace if value nulled
+
+        Returns
+        -------
+        Dictionary of variable name: value
+
+        Notes
+        -----
+        Rank correlations of the output match those of the normals for any marginals,
+        Pearson correlations only match for normal marginals.
+        The correlation matrix is factorised on first use and cached, so define it once
+        outside the schema blueprint rather than inside it.
+
+        Examples
+        --------
+        >>>from scipy.stats import norm, lognorm
+        >>>GaussianCopula.correlated_variables(
+            ["age", "income"],
+            correlation=[[1, 0.6], [0.6, 1]],
+            marginals=[norm(40, 12).ppf, lognorm(0.5, scale=30000).ppf],
+        )
+        {"age": 47.31..., "income": 38021.5...}
+        """
+        factor = self._factor(variable_names, correlation, marginals)
+
+        normals = factor @ self.rng.standard_normal(len(variable_names))
+
+        values = []
+        for z, marginal in zip(normals.tolist(), marginals):
+            if marginal is None:
+                values.append(z)
+            else:
+                u = min(max(0.5 * (1 + math.erf(z / math.sqrt(2))), _LOWEST), _HIGHEST)
+                values.append(marginal(u))
+
+        values = self._replace_multiple(tuple(values), null_props, null_values)  # type: ignore
+
+        return dict(zip(variable_names, values))
+
+    def correlated_variables_batch(
+        self,
+        variable_names: List[str],
+        correlation: Sequence[Sequence[float]],
+        marginals: Sequence[Optional[Callable]],
+        size: int,
+        null_props: Union[List[float], int] = 0,
+        null_values: List[Any] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Sample arrays of correlated variables with given marginal distributions.
+
+        Batched equivalent of correlated_variables. Each marginal is called once
+        with the array of probabilities where it accepts one, and otherwise once per row.
+
+        Parameters
+        ----------
+        variable_names
+            Name of each variable, becomes the keys in returned dictionary.
+        correlation
+            Correlation matrix of the underlying normal variables, see correlated_variables
+        marginals
+            Inverse CDF (percent point function) of each variable, see correlated_variables
+        size
+            Number of samples to draw
+        null_props
+            Proportion of each element to be nulled
+        null_values
+            Value to replace if value nulled
+
+        Returns
+        -------
+        Dictionary of variable name: array of values
+        """
+        factor = self._factor(variable_names, correlation, marginals)
+
+        normals = self.rng.standard_normal((size, len(variable_names))) @ factor.T
+        uniforms = np.clip(_normal_cdf()(normals), _LOWEST, _HIGHEST)
+
+        columns = [
+            normals[:, j] if marginal is None else self._apply_marginal(marginal, uniforms[:, j])
+            for j, marginal in enumerate(marginals)
+        ]
+
+        if null_props:
+            if null_values is None:
+                null_values = [None] * len(columns)
+            columns = [
+                self._replace_batch(column, proportion, replacement)
+                for column, proportion, replacement in zip(columns, null_props, null_values)  # type: ignore
+            ]
+
+        return dict(zip(variable_names, columns))
+
+    def _factor(
+        self,
+        variable_names: List[str],
+        correlation: Sequence[Sequence[float]],
+        marginals: Sequence[Optional[Callable]],
+    ) -> np.ndarray:
+        """
+        Cached Cholesky factor of the correlation matrix, checked against the variables.
+        """
+        factor = self._compile(correlation, _factorise)
+
+        if not len(variable_names) == len(marginals) == len(factor):
+            raise ValueError("variable_names, marginals and correlation must have same size")
+
+        return factor
+
+    @staticmethod
+    def _apply_marginal(marginal: Callable, uniforms: np.ndarray) -> np.ndarray:
+        """
+        Map uniforms through an inverse CDF, vectorised where the marginal supports arrays.
+        """
+        try:
+            values = marginal(uniforms)
+        except (TypeError, ValueError):
+            values = None
+        if np.shape(values) != uniforms.shape:
+            values = [marginal(u) for u in uniforms.tolist()]
+        return np.asarray(values)
@@ -1,10 +1,21 @@
 """Provides a random choice from a given distribution"""
+from collections import Counter
 from typing import Any
 from typing import Callable
+from typing import Iterable
 from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
 
 import numpy as np
+from mimesis_stats.categorical import CategoricalColumn
 from mimesis_stats.providers.base_stats import BaseStatsDataProvider
+from mimesis_stats.providers.base_stats import _freeze
+from mimesis_stats.providers.base_stats import _population_array
+from mimesis_stats.providers.base_stats import buffered
+from mimesis_stats.sampling import AliasSampler
 
 
 class Distribution(BaseStatsDataProvider):
@@ -15,8 +26,12 @@ class Distribution(BaseStatsDataProvider):
     -------
     discrete_distribution
         Discrete choices (categorical-type) variables
+    discrete_distribution_batch
+        Array of discrete choices (categorical-type) variables
     generic_distribution
         Accepts functions for custom distribution.
+    generic_distribution_batch
+        Array from functions for custom distribution.
     """
 
     class Meta:
@@ -26,7 +41,25 @@ class Distribution(BaseStatsDataProvider):
 
         super().__init__(*args, **kwargs)
 
-    def generic_distribution(self, func: Callable, null_prop: float = 0, null_value: Any = None, **kwargs: Any) -> Any:
+    def _sample_index(self, population: List[Any], weights: List[float], size: int = None) -> Any:
+        """
+        Draw index(es) of population using the cached sampler for weights.
+        """
+        sampler = self._get_sampler(weights)
+
+        if len(population) != sampler.size:
+            raise ValueError("population and weights must have same size")
+
+        return sampler.sample(self.rng, size=size)
+
+    def generic_distribution(
+        self,
+        func: Union[Callable, str],
+        null_prop: float = 0,
+        null_value: Any = None,
+        buffer_size: int = None,
+        **kwargs: Any,
+    ) -> Any:
         """
         Draw from any distribution passed by a function.
         Replace a proportion with None values.
@@ -36,10 +69,17 @@ class Distribution(BaseStatsDataProvider):
         func
             Function defining the distribution
             Expected to return a single value
+            A string is taken as the name of a numpy Generator method,
+            drawn from the provider's own seeded Generator.
         null_prop
             Proportion of values to replace as null
         null_value
             The (null) value to replace a sample with
+        buffer_size
+            When above 0, draw this many values at a time with generic_distribution_batch
+            and return them one per call. Greatly reduces the cost per value of
+            functions with high call overhead, such as scipy rvs.
+            By default the provider's buffer_size.
         **kwargs
             Keyword arguments needed for func distribution
 
@@ -47,6 +87,11 @@ class Distribution(BaseStatsDataProvider):
         -------
         Single value from func call with kwargs
 
+        Notes
+        -----
+        Buffered values are kept for each func and set of arguments, arguments
+        that cannot be hashed (such as arrays) are not buffered.
+
         Examples
         --------
         >>>Distribution.generic_distribution(func=np.random.normal, loc=1, null_prop=0.0)
@@ -54,9 +99,72 @@ class Distribution(BaseStatsDataProvider):
 
         >>>Distribution.generic_distribution(func=stats.bernoulli.rvs, p=0.3, loc=2)
         2
+
+        >>>Distribution.generic_distribution(func="normal", loc=1)
+        0.97
+
+        >>>Distribution.generic_distribution(func=stats.lognorm.rvs, s=0.5, buffer_size=4096)
+        1.32
+        """
+        if buffer_size is None:
+            buffer_size = self.buffer_size
+
+        if buffer_size > 0:
+            try:
+                key = _freeze(("generic_distribution", func, null_prop, null_value, kwargs))
+            except TypeError:
+                pass
+            else:
+                return self._buffered(
+                    key,
+                    lambda size: self.generic_distribution_batch(func, size, null_prop, null_value, **kwargs),
+                    buffer_size,
+                )
+
+        return self._replace(self._as_function(func)(**kwargs), null_prop, replacement=null_value)
+
+    def generic_distribution_batch(
+        self, func: Union[Callable, str], size: int, null_prop: float = 0, null_value: Any = None, **kwargs: Any
+    ) -> np.ndarray:
         """
-        return self._replace(func(**kwargs), null_prop, replacement=null_value)
+        Draw an array from any distribution passed by a function.
+        Replace a proportion with None values.
+
+        Batched equivalent of generic_distribution. Functions accepting a
+        `size` argument (numpy, scipy rvs) are called only once.
 
+        Parameters
+        ----------
+        func
+            Function defining the distribution
+            Expected to return a single value, or size values if it takes a size argument
+            A string is taken as the name of a numpy Generator method,
+            drawn from the provider's own seeded Generator.
+        size
+            Number of values to draw
+        null_prop
+            Proportion of values to replace as null
+        null_value
+            The (null) value to replace a sample with
+        **kwargs
+            Keyword arguments needed for func distribution
+
+        Returns
+        -------
+        Array of values from func calls with kwargs
+
+        Notes
+        -----
+        Functions without a size argument are called once per value.
+
+        Examples
+        --------
+        >>>Distribution.generic_distribution_batch(func=stats.bernoulli.rvs, size=3, p=0.3, loc=2)
+        array([2, 3, 2])
+        """
+        return self._replace_batch(self._draw_batch(func, size, **kwargs), null_prop, replacement=null_value)
+
+    @buffered
     def discrete_distribution(
         self, population: List[Any], weights: List[float], null_prop: float = 0, null_value: Any = None
     ) -> Any:
@@ -84,6 +192,479 @@ class Distribution(BaseStatsDataProvider):
         >>>Distribution.distrete_distribution(population=["one", "two", "three"], weights=[0.01, 0.01, 0.98])
         "three"
         """
-        return self._replace(
-            np.random.choice(population, size=None, p=weights, replace=False), null_prop, replacement=null_value
+        index = self._sample_index(population, weights)
+
+        return self._replace(population[index], null_prop, replacement=null_value)
+
+    def discrete_distribution_batch(
+        self,
+        population: List[Any],
+        weights: List[float],
+        size: int,
+        null_prop: float = 0,
+        null_value: Any = None,
+        as_categorical: bool = False,
+    ) -> Union[np.ndarray, CategoricalColumn]:
+        """
+        Draw an array of samples from discrete fix-proportion distribution.
+        Replace a proportion with null_value.
+
+        Batched equivalent of discrete_distribution, the weights are validated
+        and sampled from once for all values.
+
+        Parameters
+        ----------
+        population
+            The values to sample from
+        weights
+            Probabilities to weight the sampling, index matched with population
+        size
+            Number of values to draw
+        null_prop
+            Proportion of values to replace as null
+        null_value
+            The (null) value to replace a sample with
+        as_categorical
+            Return integer codes into the population, rather than its values
+
+        Returns
+        -------
+        Array of elements from population or null_value, or a CategoricalColumn
+
+        Examples
+        --------
+        >>>Distribution.discrete_distribution_batch(population=["one", "two"], weights=[0.5, 0.5], size=3)
+        array(['two', 'one', 'two'], dtype='<U3')
+        >>>Distribution.discrete_distribution_batch(["one", "two"], [0.5, 0.5], size=3, as_categorical=True)
+        CategoricalColumn(codes=array([1, 0, 1], dtype=int8), categories=['one', 'two'])
+        """
+        indices = self._sample_index(population, weights, size=size)
+
+        if as_categorical:
+            return self._replace_batch(CategoricalColumn.from_population(indices, population), null_prop, null_value)
+
+        return self._replace_batch(_population_array(population)[indices], null_prop, replacement=null_value)
+
+
+def _null_mask(values: np.ndarray) -> np.ndarray:
+    """Mask of the null values of an array, None or NaN."""
+    if values.dtype.kind == "f":
+        return np.isnan(values)
+    if values.dtype.kind == "O":
+        return np.equal(values, np.array(None)) | np.not_equal(values, values)
+    return np.zeros(len(values), dtype=bool)
+
+
+def _column(values: Any) -> np.ndarray:
+    """1-D array of the values of a column, or of a single column DataFrame."""
+    if hasattr(values, "columns"):
+        if len(values.columns) != 1:
+            raise TypeError(f"DataFrames must hold a single column to fit, this holds {list(values.columns)}")
+        values = values.iloc[:, 0]
+    return np.asarray(values).ravel()
+
+
+class EmpiricalTable:
+    """
+    Class holding a compact summary of the distribution of a column of data,
+    fitted in one pass over chunks of the column, for EmpiricalDistribution to sample.
+
+    Numeric columns are held as at most `resolution` weighted points, the
+    distinct values while there are few enough, otherwise quantiles between
+    the exact minimum and maximum. Other columns are held as a frequency
+    table of their distinct values. The proportion of null values is kept.
+
+    Methods
+    -------
+    fit
+        Summarise a column, or an iterable of chunks of a column.
+    update
+        Summary including a further chunk of the column.
+    sample
+        Draw an array of values with a numpy Generator.
+
+    Examples
+    --------
+    >>>table = EmpiricalTable.fit(pd.read_csv("incomes.csv", usecols=["income"], chunksize=10 ** 6))
+    >>>table.sample(np.random.default_rng(42), size=3)
+    array([23813.2, 41022.9, 18200.0])
+    """
+
+    __slots__ = (
+        "values",
+        "counts",
+        "nulls",
+        "categorical",
+        "integer",
+        "resolution",
+        "minimum",
+        "maximum",
+        "_population",
+        "_sampler",
+    )
+
+    def __init__(
+        self,
+        values: Union[Sequence[Any], np.ndarray],
+        counts: Union[Sequence[float], np.ndarray],
+        nulls: int = 0,
+        categorical: bool = False,
+        integer: bool = False,
+        resolution: int = 1000,
+        minimum: float = None,
+        maximum: float = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        values
+            Distinct values, or for numeric columns sorted points of the distribution
+        counts
+            Number of (non-null) values each point represents
+        nulls
+            Number of null values seen
+        categorical
+            Whether values are categories sampled with their frequencies,
+            rather than points of a numeric distribution
+        integer
+            Whether sampled numeric values are rounded to integers
+        resolution
+            Most points held for a numeric column
+        minimum, maximum
+            Range of a numeric column, where points are quantiles rather than distinct values
+        """
+        self.values: Union[List[Any], np.ndarray] = list(values) if categorical else np.asarray(values, dtype=float)
+        self.counts = np.asarray(counts, dtype=float)
+        self.nulls = nulls
+        self.categorical = categorical
+        self.integer = integer
+        self.resolution = resolution
+        self.minimum = minimum
+        self.maximum = maximum
+        self._sampler: Optional[AliasSampler] = None
+
+        self._population = np.empty(len(self.values), dtype=object) if categorical else np.asarray(self.values)
+        if categorical:
+            self._population[:] = self.values
+
+    @property
+    def count(self) -> int:
+        """Number of values summarised, including nulls."""
+        return int(round(self.counts.sum())) + self.nulls
+
+    @property
+    def null_prop(self) -> float:
+        """Proportion of values summarised that were null."""
+        return self.nulls / self.count if self.count else 0.0
+
+    @classmethod
+    def fit(
+        cls,
+        data: Union[np.ndarray, Iterable[np.ndarray]],
+        categorical: bool = None,
+        resolution: int = 1000,
+        chunk_size: int = 10 ** 6,
+    ) -> "EmpiricalTable":
+        """
+        Summarise the distribution of a column in one pass.
+
+        Parameters
+        ----------
+        data
+            Column of values, as an array, list, pandas Series or single column
+            DataFrame, or an iterator of chunks of the column, such as
+            pandas.read_csv with a chunksize
+        categorical
+            Whether to treat values as categories, by default when the first
+            chunk is not of a numeric type
+        resolution
+            Most points to hold for a numeric column
+        chunk_size
+            Number of values of an array or Series to summarise at a time
+
+        Returns
+        -------
+        EmpiricalTable of the column
+
+        Notes
+        -----
+        Counts are accumulated over the chunks and the table built once at the end.
+        """
+        if resolution < 2:
+            raise ValueError(f"resolution must be at least 2, it is {resolution}")
+
+        if hasattr(data, "dtype") or hasattr(data, "columns") or isinstance(data, (list, tuple)):
+            column = _column(data)
+            chunks: Iterable = np.array_split(column, range(chunk_size, len(column), chunk_size))
+        else:
+            chunks = data
+
+        integer = None
+        nulls = 0
+        frequencies: Counter = Counter()
+        values, counts = np.empty(0), np.empty(0)
+        minimum = maximum = None
+        for chunk in chunks:
+            chunk = _column(chunk)
+            if integer is None:
+                if categorical is None:
+                    categorical = chunk.dtype.kind not in "iuf"
+                integer = chunk.dtype.kind in "iu"
+
+            mask = _null_mask(chunk)
+            nulls += int(mask.sum())
+            chunk = chunk[~mask]
+            if categorical:
+                frequencies.update(chunk.tolist())
+            elif len(chunk):
+                integer = integer and chunk.dtype.kind in "iu"
+                values, counts, minimum, maximum = cls._merge(values, counts, chunk, resolution, minimum, maximum)
+
+        if integer is None:
+            raise ValueError("data must hold at least one chunk of values")
+
+        if categorical:
+            return cls(list(frequencies), list(frequencies.values()), nulls, categorical=True, resolution=resolution)
+
+        return cls(values, counts, nulls, False, integer, resolution, minimum, maximum)
+
+    @staticmethod
+    def _merge(
+        values: np.ndarray,
+        counts: np.ndarray,
+        chunk: np.ndarray,
+        resolution: int,
+        minimum: Optional[float] = None,
+        maximum: Optional[float] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, Optional[float], Optional[float]]:
+        """
+        Method to merge non-null numeric values into weighted points,
+        summarised as quantiles once there are more than resolution of them.
+        """
+        chunk = chunk.astype(float)
+        values, inverse = np.unique(np.concatenate([values, chunk]), return_inverse=True)
+        counts = np.bincount(inverse, weights=np.concatenate([counts, np.ones(len(chunk))]))
+
+        minimum = min(chunk.min(), minimum) if minimum is not None else None
+        maximum = max(chunk.max(), maximum) if maximum is not None else None
+        if len(values) > resolution:
+            # quantiles at the midpoints of resolution equal shares of the values
+            if minimum is None:
+                minimum, maximum = values[0], values[-1]
+            total = counts.sum()
+            cumulative = (np.cumsum(counts) - counts / 2) / total
+            shares = (np.arange(resolution) + 0.5) / resolution
+            values = np.interp(shares, cumulative, values)
+            counts = np.full(resolution, total / resolution)
+
+        return values, counts, minimum, maximum
+
+    def update(self, chunk: np.ndarray) -> "EmpiricalTable":
+        """
+        Summary of the values in this table and a further chunk of the column.
+
+        Parameters
+        ----------
+        chunk
+            Array of values of the column
+
+        Returns
+        -------
+        New EmpiricalTable, this table is unchanged
+        """
+        chunk = _column(chunk)
+        mask = _null_mask(chunk)
+        nulls = self.nulls + int(mask.sum())
+        chunk = chunk[~mask]
+
+        if self.categorical:
+            frequencies = Counter(dict(zip(self.values, self.counts.tolist())))
+            frequencies.update(chunk.tolist())
+            return EmpiricalTable(
+                list(frequencies), list(frequencies.values()), nulls, categorical=True, resolution=self.resolution
+            )
+
+        if not len(chunk):
+            return EmpiricalTable(
+                self.values, self.counts, nulls, False, self.integer, self.resolution, self.minimum, self.maximum
+            )
+
+        integer = self.integer and chunk.dtype.kind in "iu"
+        values, counts, minimum, maximum = self._merge(
+            self._population, self.counts, chunk, self.resolution, self.minimum, self.maximum
         )
+        return EmpiricalTable(values, counts, nulls, False, integer, self.resolution, minimum, maximum)
+
+    def _alias(self) -> AliasSampler:
+        """
+        Method to get the sampler of the table's points, built on first use.
+        """
+        if self._sampler is None:
+            if not len(self.counts):
+                raise ValueError("EmpiricalTable holds no non-null values to sample")
+            self._sampler = AliasSampler(self.counts / self.counts.sum())
+        return self._sampler
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        """
+        Draw non-null values from the summarised distribution.
+
+        Parameters
+        ----------
+        rng
+            numpy Generator to draw with
+        size
+            Number of values to draw
+
+        Returns
+        -------
+        Array of values
+
+        Notes
+        -----
+        Categories and the distinct values of numeric columns are drawn with
+        their frequencies. Quantile summaries are sampled by interpolating the
+        inverse of their cumulative distribution at uniform draws.
+        """
+        if self.categorical:
+            return self._population[self._alias().sample(rng, size=size)]
+
+        if self.minimum is None:
+            values = self._population[self._alias().sample(rng, size=size)]
+        else:
+            cumulative = (np.arange(len(self.values)) + 0.5) / len(self.values)
+            values = np.interp(
+                rng.random(size),
+                np.concatenate([[0], cumulative, [1]]),
+                np.concatenate([[self.minimum], self.values, [self.maximum]]),
+            )
+
+        return np.round(values).astype(np.int64) if self.integer else values
+
+
+class EmpiricalDistribution(BaseStatsDataProvider):
+    """
+    Class for sampling from the distributions of existing data.
+
+    Methods
+    -------
+    fit
+        Summarise a column of data as an EmpiricalTable.
+    empirical_distribution
+        Sample a value like those of the fitted column.
+    empirical_distribution_batch
+        Sample an array of values like those of the fitted column.
+    """
+
+    class Meta:
+        name = "empirical_distribution"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+
+        super().__init__(*args, **kwargs)
+
+    def fit(
+        self,
+        data: Union[np.ndarray, Iterable[np.ndarray]],
+        categorical: bool = None,
+        resolution: int = 1000,
+        chunk_size: int = 10 ** 6,
+    ) -> EmpiricalTable:
+        """
+        Summarise the distribution of a column in one pass, see EmpiricalTable.fit.
+
+        Parameters
+        ----------
+        data
+            Column of values, as an array, list or pandas Series, or an iterator of chunks of the column
+        categorical
+            Whether to treat values as categories, by default when they are not numeric
+        resolution
+            Most points to hold for a numeric column
+        chunk_size
+            Number of values of an array or Series to summarise at a time
+
+        Returns
+        -------
+        EmpiricalTable of the column
+
+        Examples
+        --------
+        >>>table = EmpiricalDistribution().fit(np.array(["a", "b", "b", None], dtype=object))
+        >>>table.values, table.counts, table.null_prop
+        (['a', 'b'], array([1., 2.]), 0.25)
+        """
+        return EmpiricalTable.fit(data, categorical, resolution, chunk_size)
+
+    @buffered
+    def empirical_distribution(self, table: EmpiricalTable, null_prop: float = None, null_value: Any = None) -> Any:
+        """
+        Draw a value from the distribution of a fitted column.
+
+        Parameters
+        ----------
+        table
+            Summary of the column, from fit
+        null_prop
+            Proportion of values to replace as null, by default that of the fitted column
+        null_value
+            The (null) value to replace a sample with
+
+        Returns
+        -------
+        Single value distributed as the fitted column, or null_value
+
+        Examples
+        --------
+        >>>EmpiricalDistribution().empirical_distribution(table)
+        'b'
+        """
+        if null_prop is None:
+            null_prop = table.null_prop
+
+        return self._replace(table.sample(self.rng, size=1).tolist()[0], null_prop, replacement=null_value)
+
+    def empirical_distribution_batch(
+        self,
+        table: EmpiricalTable,
+        size: int,
+        null_prop: float = None,
+        null_value: Any = None,
+        as_categorical: bool = False,
+    ) -> Union[np.ndarray, CategoricalColumn]:
+        """
+        Draw an array of values from the distribution of a fitted column.
+
+        Batched equivalent of empirical_distribution.
+
+        Parameters
+        ----------
+        table
+            Summary of the column, from fit
+        size
+            Number of values to draw
+        null_prop
+            Proportion of values to replace as null, by default that of the fitted column
+        null_value
+            The (null) value to replace a sample with
+        as_categorical
+            Return a CategoricalColumn of integer codes into the categories,
+            for categorical tables
+
+        Returns
+        -------
+        Array of values distributed as the fitted column, or a CategoricalColumn
+
+        Examples
+        --------
+        >>>EmpiricalDistribution().empirical_distribution_batch(table, size=3)
+        array(['b', 'a', 'b'], dtype=object)
+        """
+        if null_prop is None:
+            null_prop = table.null_prop
+
+        if as_categorical and table.categorical:
+            indices = table._alias().sample(self.rng, size=size)
+            return self._replace_batch(CategoricalColumn.from_population(indices, table.values), null_prop, null_value)
+
+        return self._replace_batch(table.sample(self.rng, size), null_prop, replacement=null_value)
@@ -1,11 +1,14 @@
 """Provides dependent variables"""
 from typing import Any
+from typing import Dict
 from typing import List
 from typing import Tuple
 from typing import Union
 
 import numpy as np
+from mimesis_stats.categorical import CategoricalColumn
 from mimesis_stats.providers.base_stats import BaseStatsDataProvider
+from mimesis_stats.providers.base_stats import buffered
 
 
 class MultiVariable(BaseStatsDataProvider):
@@ -13,6 +16,13 @@ class MultiVariable(BaseStatsDataProvider):
     Class for producing multiple variables that are related to one another.
 
     Returns a dictionary of name: value pairs, for later unpacking.
+
+    Methods
+    -------
+    dependent_variables
+        Sample one combination of variable values.
+    dependent_variables_batch
+        Sample arrays of combinations of variable values.
     """
 
     class Meta:
@@ -22,6 +32,7 @@ class MultiVariable(BaseStatsDataProvider):
 
         super().__init__(*args, **kwargs)
 
+    @buffered
     def dependent_variables(
         self,
         variable_names: List[str],
@@ -41,6 +52,8 @@ class MultiVariable(BaseStatsDataProvider):
             Becomes the keys in returned dictionary.
         options
             Possible combinations of variable values.
+            Callable elements are called, with no arguments, only when their
+            combination is selected.
         weights
             Weighting of probability for each combination of variables.
         null_props
@@ -52,6 +65,7 @@ class MultiVariable(BaseStatsDataProvider):
         -----
         Combinations can contain null values, for a more strictly missing value regime
         Combination elements can be other mimesis-like provider methods.
+        Wrap them in a lambda to only generate values for the selected combination.
 
         Examples
         --------
@@ -64,11 +78,105 @@ class MultiVariable(BaseStatsDataProvider):
 
         >>>MultiVariable.dependent_variables(names, combinations, weights=[1, 0])
         {"response": "Yes", "count": "Sometimes"}
+
+        # Only the selected option's distribution is sampled
+        >>>combinations = [("Yes", lambda: np.random.poisson(5)), ("No", None)]
+        >>>MultiVariable.dependent_variables(names, combinations, weights=[1, 0])
+        {"response": "Yes", "count": 3}
         """
-        random_index = np.random.choice(len(options), p=weights, size=None, replace=False)
+        random_index = self._get_sampler(weights).sample(self.rng)
 
-        selection = options[random_index]
+        selection = tuple(value() if callable(value) else value for value in options[random_index])
 
         selection_nulled = self._replace_multiple(selection, null_props, null_values)
 
         return dict(zip(variable_names, selection_nulled))
+
+    def dependent_variables_batch(
+        self,
+        variable_names: List[str],
+        options: List[Tuple[Any]],
+        weights: List[float],
+        size: int,
+        null_props: Union[List[float], int] = 0,
+        null_values: List[Any] = None,
+        as_categorical: bool = False,
+    ) -> Dict[str, Union[np.ndarray, CategoricalColumn]]:
+        """
+        Make arrays of discrete samples from possible variable combinations.
+
+        Batched equivalent of dependent_variables. Rows are grouped by their
+        selected combination, so each callable element is evaluated for its
+        group of rows in one call.
+
+        Parameters
+        ----------
+        variable_names
+            Name of each variable corresponding element-wise to each option.
+            Becomes the keys in returned dictionary.
+        options
+            Possible combinations of variable values.
+            Callable elements are called with a `size` keyword, for the number of
+            rows selecting their combination, where they accept it, and otherwise
+            once per row.
+        weights
+            Weighting of probability for each combination of variables.
+        size
+            Number of samples to draw
+        null_props
+            Proportion of each element to be nulled
+        null_value
+            Value to replace if value nulled
+        as_categorical
+            Return variables without callable elements as CategoricalColumns,
+            integer codes into their distinct values
+
+        Returns
+        -------
+        Dictionary of variable name: array of values, or CategoricalColumn
+
+        Examples
+        --------
+        >>>names = ["response", "count"]
+        >>>combinations = [("Yes", lambda size=None: np.random.poisson(5, size=size)), ("No", None)]
+        >>>MultiVariable.dependent_variables_batch(names, combinations, weights=[0.5, 0.5], size=3)
+        {"response": array(["Yes", "No", "Yes"], dtype=object), "count": array([4, None, 6], dtype=object)}
+        """
+        indices = self._get_sampler(weights).sample(self.rng, size=size)
+
+        # constant elements are looked up for all rows at once
+        table = np.empty((len(options), len(variable_names)), dtype=object)
+        generators = []
+        for i, option in enumerate(options):
+            for j, value in enumerate(option):
+                if callable(value):
+                    generators.append((i, j, value))
+                else:
+                    table[i, j] = value
+        callable_columns = set(j for _, j, _ in generators)
+        # callable columns are never categorical, so can be filled in by index below
+        columns: List[Any] = [
+            (
+                CategoricalColumn.from_population(indices, table[:, j].tolist())
+                if as_categorical and j not in callable_columns
+                else table[indices, j]
+            )
+            for j in range(len(variable_names))
+        ]
+
+        if generators:
+            order = np.argsort(indices, kind="stable")
+            groups = np.split(order, np.cumsum(np.bincount(indices, minlength=len(options)))[:-1])
+            for i, j, generator in generators:
+                if len(groups[i]):
+                    columns[j][groups[i]] = self._draw_batch(generator, len(groups[i]))
+
+        if null_props:
+            if null_values is None:
+                null_values = [None] * len(columns)
+            columns = [
+                self._replace_batch(column, proportion, replacement)
+                for column, proportion, replacement in zip(columns, null_props, null_values)  # type: ignore
+            ]
+
+        return dict(zip(variable_names, columns))
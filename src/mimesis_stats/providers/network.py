@@ -0,0 +1,241 @@
+"""Provides variables sampled from a Bayesian network"""
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Union
+
+import numpy as np
+from mimesis_stats.categorical import CategoricalColumn
+from mimesis_stats.providers.base_stats import BaseStatsDataProvider
+from mimesis_stats.providers.base_stats import _population_array
+from mimesis_stats.sampling import AliasSampler
+
+
+class _Node:
+    """
+    Compiled conditional probability table of one network variable.
+    """
+
+    __slots__ = ("name", "parents", "population", "samplers", "strides")
+
+    def __init__(self, name: str, definition: Dict[str, Any], populations: Dict[str, List[Any]]) -> None:
+
+        self.name = name
+        self.parents: List[str] = list(definition.get("parents", []))
+        self.population = list(definition["population"])
+
+        weights = definition["weights"]
+        if not self.parents:
+            weights = {(): weights}
+
+        # parent value tuple: sampler, and combination code: sampler for batches
+        self.samplers: Dict[Any, AliasSampler] = {}
+        # mixed radix over the parents' population indices
+        self.strides: List[int] = []
+        stride = 1
+        for parent in reversed(self.parents):
+            self.strides.insert(0, stride)
+            stride *= len(populations[parent])
+        for parent_values, node_weights in weights.items():
+            if not isinstance(parent_values, tuple):
+                parent_values = (parent_values,)
+            if len(parent_values) != len(self.parents):
+                raise ValueError(f"{name} weights for {parent_values} do not match parents {self.parents}")
+
+            sampler = AliasSampler(node_weights)
+            if sampler.size != len(self.population):
+                raise ValueError(f"{name} population and weights for {parent_values} must have same size")
+
+            combination = 0
+            for parent, value, stride in zip(self.parents, parent_values, self.strides):
+                if value not in populations[parent]:
+                    raise ValueError(f"{name} weights given for {value}, not in the population of {parent}")
+                combination += populations[parent].index(value) * stride
+            self.samplers[parent_values] = sampler
+            self.samplers[combination] = sampler
+
+    def sampler(self, key: Any) -> AliasSampler:
+
+        try:
+            return self.samplers[key]
+        except KeyError:
+            raise KeyError(f"{self.name} has no weights for parent values {key}")
+
+
+def _compile_network(network: Dict[str, Dict[str, Any]]) -> List[_Node]:
+    """
+    Order the network's variables so parents come before children, and
+    compile their probability tables.
+
+    Raises
+    ------
+    ValueError
+        If a parent is not in the network, or the network has a cycle.
+    """
+    populations = {name: list(definition["population"]) for name, definition in network.items()}
+
+    order: List[str] = []
+    remaining = {name: set(definition.get("parents", [])) for name, definition in network.items()}
+    for name, parents in remaining.items():
+        unknown = parents - set(network)
+        if unknown:
+            raise ValueError(f"{name} has parents {unknown} not in the network")
+
+    while remaining:
+        ready = [name for name, parents in remaining.items() if not parents - set(order)]
+        if not ready:
+            raise ValueError(f"network has a cycle between {sorted(remaining)}")
+        order.extend(ready)
+        for name in ready:
+            del remaining[name]
+
+    return [_Node(name, network[name], populations) for name in order]
+
+
+class BayesianNetwork(BaseStatsDataProvider):
+    """
+    Class for producing multiple discrete variables from a Bayesian network,
+    a directed acyclic graph of conditional probability tables.
+
+    Returns a dictionary of name: value pairs, for later unpacking.
+
+    Methods
+    -------
+    network_variables
+        Sample one value of every variable in the network.
+    network_variables_batch
+        Sample arrays of every variable in the network.
+    """
+
+    class Meta:
+        name = "bayesian_network"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+
+        super().__init__(*args, **kwargs)
+
+    def network_variables(
+        self,
+        network: Dict[str, Dict[str, Any]],
+        null_props: Optional[Dict[str, float]] = None,
+        null_values: Optional[Dict[str, Any]] = None,
+    ) -> dict:
+        """
+        Sample every variable of a Bayesian network, parents before children.
+
+        Parameters
+        ----------
+        network
+            Dictionary of variable name: definition, where each definition has
+            "population" - the values of the variable,
+            "parents" - optional, names of the variables it depends on,
+            "weights" - probabilities index matched with population. With parents,
+            a dictionary of parent values (tuple, or single value for one parent): weights.
+        null_props
+            Proportion of each variable to be nulled, by variable name
+        null_values
+            Value to replace if value nulled, by variable name
+
+        Returns
+        -------
+        Dictionary of variable name: value, in network order
+
+        Notes
+        -----
+        Memory and time per sample grow with the size of the tables, rather than
+        the number of combinations of all variables as for MultiVariable.
+        The network is compiled on first use and cached, so define it once
+        outside the schema blueprint rather than inside it.
+        Nulls are added after sampling, so children depend on un-nulled parent values.
+
+        Examples
+        --------
+        >>>network = {
+            "employed": {"population": [True, False], "weights": [0.6, 0.4]},
+            "income": {
+                "parents": ["employed"],
+                "population": ["low", "high"],
+                "weights": {True: [0.3, 0.7], False: [0.9, 0.1]},
+            },
+        }
+        >>>BayesianNetwork.network_variables(network)
+        {"employed": True, "income": "high"}
+        """
+        values: Dict[str, Any] = {}
+        for node in self._compile(network, _compile_network):
+            key = tuple(values[parent] for parent in node.parents)
+            values[node.name] = node.population[node.sampler(key).sample(self.rng)]
+
+        null_props = null_props or {}
+        null_values = null_values or {}
+        return {
+            name: self._replace(values[name], null_props.get(name, 0), null_values.get(name)) for name in network
+        }
+
+    def network_variables_batch(
+        self,
+        network: Dict[str, Dict[str, Any]],
+        size: int,
+        null_props: Optional[Dict[str, float]] = None,
+        null_values: Optional[Dict[str, Any]] = None,
+        as_categorical: bool = False,
+    ) -> Dict[str, Union[np.ndarray, CategoricalColumn]]:
+        """
+        Sample arrays of every variable of a Bayesian network, parents before children.
+
+        Batched equivalent of network_variables. Rows are grouped by their
+        parents' values so each table entry is sampled in one call.
+
+        Parameters
+        ----------
+        network
+            Dictionary of variable name: definition, see network_variables
+        size
+            Number of samples to draw
+        null_props
+            Proportion of each variable to be nulled, by variable name
+        null_values
+            Value to replace if value nulled, by variable name
+        as_categorical
+            Return CategoricalColumns, integer codes into each population, rather than values
+
+        Returns
+        -------
+        Dictionary of variable name: array of values or CategoricalColumn, in network order
+        """
+        codes: Dict[str, np.ndarray] = {}
+        for node in self._compile(network, _compile_network):
+            codes[node.name] = self._sample_codes(node, codes, size)
+
+        null_props = null_props or {}
+        null_values = null_values or {}
+        columns = {
+            name: (
+                CategoricalColumn.from_population(codes[name], network[name]["population"])
+                if as_categorical
+                else _population_array(network[name]["population"])[codes[name]]
+            )
+            for name in network
+        }
+        return {
+            name: self._replace_batch(column, null_props.get(name, 0), null_values.get(name))
+            for name, column in columns.items()
+        }
+
+    def _sample_codes(self, node: _Node, codes: Dict[str, np.ndarray], size: int) -> np.ndarray:
+        """
+        Sample population indices of a node given the indices of its parents.
+        """
+        if not node.parents:
+            return node.sampler(0).sample(self.rng, size=size)
+
+        strides = zip(node.parents, node.strides)
+        combinations = sum((codes[parent] * stride for parent, stride in strides), np.zeros(size, dtype=np.intp))
+        order = np.argsort(combinations, kind="stable")
+        groups, starts = np.unique(combinations[order], return_index=True)
+
+        node_codes = np.empty(size, dtype=np.intp)
+        for combination, rows in zip(groups.tolist(), np.split(order, starts[1:])):
+            node_codes[rows] = node.sampler(combination).sample(self.rng, size=len(rows))
+        return node_codes
@@ -1,10 +1,16 @@
 """Provides a random choice from a datetime type"""
 import datetime
+import functools
 from typing import Any
 from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import Optional
 from typing import Union
 
 import numpy as np
+from mimesis_stats.categorical import CategoricalColumn
+from mimesis_stats.providers.base_stats import buffered
 from mimesis_stats.providers.distribution import Distribution
 
 
@@ -16,8 +22,22 @@ class TimeDistribution(Distribution):
     -------
     generate_time
         Sample time in range from a defined distribution.
+    generate_time_batch
+        Sample array of times in range from a defined distribution.
+    time_sequence
+        Stream sorted times in range, in chunks.
     """
 
+    # strftime formats numpy can produce directly, with the matching datetime64 unit
+    _numpy_formats: Dict[str, Any] = {
+        "%Y": "Y",
+        "%Y-%m": "M",
+        "%Y-%m-%d": "D",
+        "%Y-%m-%dT%H": "h",
+        "%Y-%m-%dT%H:%M": "m",
+        "%Y-%m-%dT%H:%M:%S": "s",
+    }
+
     class Meta:
         name = "time"
 
@@ -52,6 +72,7 @@ class TimeDistribution(Distribution):
 
         return rtime
 
+    @buffered
     def generate_time(
         self,
         start: Union[str, datetime.datetime],
@@ -59,9 +80,10 @@ class TimeDistribution(Distribution):
         input_format: str = None,
         output_format: str = None,
         output_type: Union[datetime.datetime, datetime.date, datetime.time, str] = datetime.datetime,  # type: ignore
-        distribution: Callable = np.random.uniform,
+        distribution: Union[Callable, str] = "uniform",
         null_prop: float = 0,
         null_value: Any = None,
+        granularity: str = None,
         **kwargs,
     ) -> Union[datetime.datetime, datetime.date, datetime.time, str]:
         """
@@ -83,10 +105,15 @@ class TimeDistribution(Distribution):
             Can be used to control granularity.
         distribution
             Function defining the distribution of dates, must be bound by [0, 1].
+            A string is taken as the name of a method of the provider's numpy Generator,
+            by default uniform.
         null_prop
             Proportion of values to replace as null
         null_value
             The (null) value to replace a sample with
+        granularity
+            Truncate the time to a numpy datetime unit, one of "Y", "M", "D", "h", "m", "s".
+            The output for each unit is then converted once and cached.
         **kwargs
             Keyword arguments needed for func distribution
 
@@ -100,7 +127,7 @@ class TimeDistribution(Distribution):
             start=datetime.datetime(1985, 10, 20),
             end=datetime.datetime(1985, 10, 25),
             output_type=datetime.date,
-            distribution=np.random.uniform
+            distribution="uniform"
         )
         datetime.date(1985, 10, 23)
         """
@@ -109,7 +136,15 @@ class TimeDistribution(Distribution):
         edatetime = self._load_time(end, input_format)
 
         # sample value
-        pdatetime = self._sample_time(start=sdatetime, end=edatetime, distribution=distribution, **kwargs)
+        pdatetime = self._sample_time(
+            start=sdatetime, end=edatetime, distribution=self._as_function(distribution), **kwargs
+        )
+
+        if granularity is not None:
+            self._check_granularity(granularity)
+            granule = np.datetime64(pdatetime, granularity).astype(np.int64).item()
+            value = self._convert_granule(granule, granularity, output_type, output_format)
+            return self._replace(value, null_prop, null_value)
 
         # add missingness
         pdatetime = self._replace(pdatetime, null_prop, null_value)
@@ -125,3 +160,297 @@ class TimeDistribution(Distribution):
             return pdatetime.time()
         else:
             raise TypeError(f"Issue with output_type as: {output_type}")
+
+    @classmethod
+    def _convert_batch(
+        cls,
+        values: np.ndarray,
+        output_type: Union[datetime.datetime, datetime.date, datetime.time, str],  # type: ignore
+        output_format: str = None,
+    ) -> np.ndarray:
+        """
+        Method to convert an array of datetime64 values to the output type.
+        """
+        if output_type == datetime.datetime:
+            return values.astype(object)
+        if output_type == str:
+            if output_format in cls._numpy_formats:
+                return np.datetime_as_string(values, unit=cls._numpy_formats[output_format])
+            return np.array([value.strftime(output_format) for value in values.astype(object)])
+        if output_type == datetime.date:
+            return values.astype("datetime64[D]").astype(object)
+        if output_type == datetime.time:
+            microseconds = (values - values.astype("datetime64[D]")).astype(np.int64)
+            seconds, microsecond = np.divmod(microseconds, 10 ** 6)
+            minutes, second = np.divmod(seconds, 60)
+            hour, minute = np.divmod(minutes, 60)
+            times = np.empty(len(values), dtype=object)
+            times[:] = list(map(datetime.time, hour.tolist(), minute.tolist(), second.tolist(), microsecond.tolist()))
+            return times
+        else:
+            raise TypeError(f"Issue with output_type as: {output_type}")
+
+    @classmethod
+    def _check_granularity(cls, granularity: str) -> None:
+        """
+        Method to check granularity is a datetime unit with a numpy format.
+        """
+        if granularity not in cls._numpy_formats.values():
+            raise ValueError(f"granularity must be one of {list(cls._numpy_formats.values())}, it is {granularity}")
+
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _convert_granule(
+        cls,
+        granule: int,
+        granularity: str,
+        output_type: Union[datetime.datetime, datetime.date, datetime.time, str],  # type: ignore
+        output_format: str = None,
+    ) -> Union[datetime.datetime, datetime.date, datetime.time, str]:
+        """
+        Method to convert one granularity unit, counted from the epoch, to the output type.
+        Cached, so repeated units are converted once.
+        """
+        granules = np.array([granule], dtype=f"datetime64[{granularity}]").astype("datetime64[us]")
+        return cls._convert_batch(granules, output_type, output_format).item(0)
+
+    def generate_time_batch(
+        self,
+        start: Union[str, datetime.datetime],
+        end: Union[str, datetime.datetime],
+        size: int,
+        input_format: str = None,
+        output_format: str = None,
+        output_type: Union[datetime.datetime, datetime.date, datetime.time, str] = datetime.datetime,  # type: ignore
+        distribution: Union[Callable, str] = "uniform",
+        null_prop: float = 0,
+        null_value: Any = None,
+        granularity: str = None,
+        as_categorical: bool = False,
+        **kwargs,
+    ) -> Union[np.ndarray, CategoricalColumn]:
+        """
+        Draw an array from a datetime range defined by a start and end period and probability distribution.
+
+        Batched equivalent of generate_time, the range is parsed once and the
+        times are calculated as numpy datetime64 values in one operation.
+
+        Parameters
+        ----------
+        start
+            Earliest time point to sample above of (inclusive).
+        end
+            Final time point to sample below from (inclusive).
+        size
+            Number of values to draw
+        input_format
+            For string start, end types what format to parse to datetime.
+        output_format
+            For string sample outputs types what format to provide output.
+            Can be used to control granularity.
+        output_type
+            Which data type to output the sampled values as.
+            Can be used to control granularity.
+        distribution
+            Function defining the distribution of dates, must be bound by [0, 1].
+            Called once with a `size` keyword if it accepts one, otherwise once per value.
+            A string is taken as the name of a method of the provider's numpy Generator,
+            by default uniform.
+        null_prop
+            Proportion of values to replace as null
+        null_value
+            The (null) value to replace a sample with
+        granularity
+            Truncate times to a numpy datetime unit, one of "Y", "M", "D", "h", "m", "s".
+            Only the distinct units sampled are then converted, rather than every value.
+        as_categorical
+            Return a CategoricalColumn, integer codes into the distinct outputs,
+            where granularity is given
+        **kwargs
+            Keyword arguments needed for func distribution
+
+        Returns
+        -------
+        Array of date time formatted values within defined range, or CategoricalColumn
+
+        Notes
+        -----
+        Times are calculated to microsecond precision.
+        ISO formats such as "%Y-%m-%d" are formatted by numpy, others through strftime.
+        With granularity the conversion is done once per distinct unit, so strftime
+        formats of coarse units cost little more than ISO formats.
+
+        Examples
+        --------
+        >>>TimeDistribution.generate_time_batch(
+            start=datetime.datetime(1985, 10, 20),
+            end=datetime.datetime(1985, 10, 25),
+            size=2,
+            output_type=str,
+            output_format="%Y-%m-%d",
+        )
+        array(['1985-10-23', '1985-10-21'], dtype='<U10')
+        """
+        # convert to datetime64
+        sdatetime = np.datetime64(self._load_time(start, input_format), "us")
+        edatetime = np.datetime64(self._load_time(end, input_format), "us")
+
+        # sample values
+        proportions = self._draw_batch(distribution, size, **kwargs).astype(float)
+
+        assert (
+            (0 <= proportions) & (proportions <= 1)
+        ).all(), "distribution must be a probability density function bound by [0, 1]"
+
+        offsets = np.round(proportions * (edatetime - sdatetime).astype(np.int64)).astype("timedelta64[us]")
+
+        if granularity is not None:
+            self._check_granularity(granularity)
+            times = (sdatetime + offsets).astype(f"datetime64[{granularity}]")
+            granules, codes = np.unique(times, return_inverse=True)
+            converted = self._convert_batch(granules.astype("datetime64[us]"), output_type, output_format)
+            if as_categorical:
+                column = CategoricalColumn.from_population(codes, converted.tolist())
+                return self._replace_batch(column, null_prop, null_value)
+            return self._replace_batch(converted[codes], null_prop, null_value)
+
+        # convert to desired output, then add missingness
+        return self._replace_batch(
+            self._convert_batch(sdatetime + offsets, output_type, output_format), null_prop, null_value
+        )
+
+    def _sorted_offsets(self, size: int, chunk_size: int) -> Iterator[np.ndarray]:
+        """
+        Method to stream the sorted order statistics of `size` uniform draws on [0, 1].
+
+        Uses the exponential spacings representation, the log survival of the
+        k-th smallest of n uniforms is minus the cumulative sum of E_i / (n - i + 1),
+        for independent standard exponentials E_i. Each chunk carries on from the last.
+        """
+        total = 0.0
+        for first in range(0, size, chunk_size):
+            remaining = np.arange(size - first, max(size - first - chunk_size, 0), -1, dtype=float)
+            spacings = self.rng.standard_exponential(len(remaining)) / remaining
+            cumulative = total + np.cumsum(spacings)
+            total = cumulative[-1]
+            yield -np.expm1(-cumulative)
+
+    def _poisson_offsets(
+        self, span: int, rate: float, seasonality: Optional[Callable], chunk_size: int
+    ) -> Iterator[np.ndarray]:
+        """
+        Method to stream the arrival times, in microseconds, of a Poisson process on [0, span].
+
+        A non-constant rate is sampled by thinning, arrivals at the peak rate are
+        kept with probability given by seasonality.
+        """
+        current = 0.0
+        while current <= span:
+            arrivals = current + np.cumsum(self.rng.exponential(1 / rate, size=chunk_size))
+            current = arrivals[-1]
+            arrivals = arrivals[arrivals <= span]
+            if seasonality is not None:
+                intensity = np.asarray(seasonality(arrivals / max(span, 1)), dtype=float)
+                assert (
+                    (0 <= intensity) & (intensity <= 1)
+                ).all(), "seasonality must give a relative rate bound by [0, 1]"
+                arrivals = arrivals[self.rng.random(len(arrivals)) < intensity]
+            if len(arrivals):
+                yield arrivals
+
+    def time_sequence(
+        self,
+        start: Union[str, datetime.datetime],
+        end: Union[str, datetime.datetime],
+        size: int = None,
+        rate: float = None,
+        rate_period: datetime.timedelta = datetime.timedelta(days=1),
+        seasonality: Callable = None,
+        chunk_size: int = 10000,
+        input_format: str = None,
+        output_format: str = None,
+        output_type: Union[datetime.datetime, datetime.date, datetime.time, str] = datetime.datetime,  # type: ignore
+    ) -> Iterator[np.ndarray]:
+        """
+        Stream sorted times from a datetime range defined by a start and end period.
+
+        Times are generated in ascending order, so event logs can be written one
+        chunk at a time without sorting or holding every value in memory.
+        Either a fixed number of times, uniformly distributed over the range, or
+        the arrivals of a Poisson process with a given rate are produced.
+
+        Parameters
+        ----------
+        start
+            Earliest time point of the sequence (inclusive).
+        end
+            Final time point of the sequence (inclusive).
+        size
+            Number of times to generate, distributed uniformly over the range.
+        rate
+            Expected number of times per `rate_period`, for Poisson process arrivals.
+            The number of times generated is random.
+        rate_period
+            Period of time that `rate` is given for, by default one day.
+        seasonality
+            Function scaling the Poisson rate over the range, must be bound by [0, 1].
+            Called with an array of the proportions of the range each time is at.
+        chunk_size
+            Most times in each yielded array.
+        input_format
+            For string start, end types what format to parse to datetime.
+        output_format
+            For string outputs types what format to provide output.
+        output_type
+            Which data type to output the times as.
+
+        Yields
+        ------
+        Arrays of date time formatted values, in ascending order across arrays
+
+        Notes
+        -----
+        Generation takes O(N) time and O(chunk_size) memory. Fixed size sequences
+        are the sorted order statistics of `size` uniform draws, produced through
+        exponential spacings. Times are calculated to microsecond precision.
+
+        Examples
+        --------
+        >>>chunks = TimeDistribution().time_sequence(
+            start=datetime.datetime(1985, 10, 20),
+            end=datetime.datetime(1985, 10, 21),
+            rate=4,
+            seasonality=lambda proportion: np.sin(np.pi * proportion) ** 2,
+            output_type=str,
+            output_format="%Y-%m-%dT%H:%M",
+        )
+        >>>list(chunks)
+        [array(['1985-10-20T09:14', '1985-10-20T13:52'], dtype='<U16')]
+        """
+        if (size is None) == (rate is None):
+            raise ValueError("Exactly one of size and rate must be given")
+        if seasonality is not None and rate is None:
+            raise ValueError("seasonality is only supported with a rate")
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be a positive integer, it is {chunk_size}")
+
+        sdatetime = np.datetime64(self._load_time(start, input_format), "us")
+        edatetime = np.datetime64(self._load_time(end, input_format), "us")
+        span = int((edatetime - sdatetime).astype(np.int64))
+        if span < 0:
+            raise ValueError("end must not be before start")
+
+        offsets: Iterator[np.ndarray]
+        if size is not None:
+            offsets = (proportions * span for proportions in self._sorted_offsets(size, chunk_size))
+        elif rate is not None:
+            if rate <= 0:
+                raise ValueError(f"rate must be positive, it is {rate}")
+            microsecond_rate = rate / (rate_period / datetime.timedelta(microseconds=1))
+            offsets = self._poisson_offsets(span, microsecond_rate, seasonality, chunk_size)
+
+        # arguments are checked above, when called, rather than when first iterated
+        return (
+            self._convert_batch(sdatetime + np.round(offset).astype("timedelta64[us]"), output_type, output_format)
+            for offset in offsets
+        )
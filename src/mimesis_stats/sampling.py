@@ -0,0 +1,105 @@
+"""Provides precompiled samplers for fixed discrete distributions"""
+from typing import overload
+from typing import Sequence
+from typing import Union
+
+import numpy as np
+
+
+class AliasSampler:
+    """
+    Class for repeated sampling of indices from a fixed discrete distribution.
+
+    Uses Vose's alias method: the alias table is built once in O(k) for k
+    weights, after which each draw is O(1) regardless of k.
+
+    Methods
+    -------
+    sample
+        Draw one index, or an array of indices.
+
+    Examples
+    --------
+    >>>sampler = AliasSampler([0.2, 0.8])
+    >>>rng = np.random.default_rng(42)
+    >>>sampler.sample(rng)
+    1
+    >>>sampler.sample(rng, size=4)
+    array([1, 1, 0, 1])
+    """
+
+    def __init__(self, weights: Sequence[float]) -> None:
+        """
+        Parameters
+        ----------
+        weights
+            Probabilities of each index, must be non-negative and sum to 1.
+
+        Raises
+        ------
+        ValueError
+            If the weights are not a valid probability distribution.
+        """
+        probabilities = np.asarray(weights, dtype=float)
+
+        if probabilities.ndim != 1 or not len(probabilities):
+            raise ValueError("weights must be a non-empty 1-dimensional sequence")
+        if not np.isfinite(probabilities).all() or (probabilities < 0).any():
+            raise ValueError("weights must be non-negative")
+        # same tolerance as numpy.random.choice
+        if abs(probabilities.sum() - 1) > np.sqrt(np.finfo(float).eps):
+            raise ValueError("weights do not sum to 1")
+
+        self.size = len(probabilities)
+
+        scaled = (probabilities * self.size / probabilities.sum()).tolist()
+        accept = [1.0] * self.size
+        alias = list(range(self.size))
+
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+
+        while small and large:
+            less, more = small.pop(), large.pop()
+            accept[less] = scaled[less]
+            alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1
+            (small if scaled[more] < 1 else large).append(more)
+        # anything left over is within rounding of 1, so always accepted
+
+        self._accept = accept
+        self._alias = alias
+        self._accept_array = np.array(accept)
+        self._alias_array = np.array(alias, dtype=np.intp)
+
+    @overload
+    def sample(self, rng: np.random.Generator, size: None = None) -> int:
+        ...
+
+    @overload
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        ...
+
+    def sample(self, rng: np.random.Generator, size: int = None) -> Union[int, np.ndarray]:
+        """
+        Draw index(es) from the distribution.
+
+        Parameters
+        ----------
+        rng
+            numpy Generator to draw with
+        size
+            Number of indices to draw, a single int is returned when None.
+
+        Returns
+        -------
+        Index or array of indices into the weights
+        """
+        if size is None:
+            u = rng.random() * self.size
+            index = min(int(u), self.size - 1)
+            return index if u - index < self._accept[index] else self._alias[index]
+
+        draws = rng.random(size) * self.size
+        indices = np.minimum(draws.astype(np.intp), self.size - 1)
+        return np.where(draws - indices < self._accept_array[indices], indices, self._alias_array[indices])
@@ -1,13 +1,569 @@
+import collections
+import contextlib
+import functools
+import importlib
+import inspect
+import mmap
+import operator
+import threading
+import time
 from typing import Any
+from typing import AsyncIterator
 from typing import Callable
 from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
 from typing import Iterator
 from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Type
+from typing import Union
 
+import numpy as np
+from mimesis.exceptions import UnacceptableField
+from mimesis.exceptions import UndefinedField
+from mimesis.exceptions import UnsupportedField
+from mimesis.providers.base import BaseDataProvider
+from mimesis.providers.base import BaseProvider
+from mimesis.providers.generic import Generic
 from mimesis.schema import Field
-from mimesis_stats.providers.distribution import Distribution
-from mimesis_stats.providers.multivariable import MultiVariable
-from mimesis_stats.providers.time import TimeDistribution
+from mimesis_stats.categorical import CategoricalColumn
+from mimesis_stats.missingness import Missingness
+from mimesis_stats.profiling import ProfileReport
+from mimesis_stats.providers.base_stats import BaseStatsDataProvider
+
+# Set while a blueprint is evaluated for columnar generation, see StatsSchema.create_columns
+_capture = threading.local()
+
+# Schema inherited by forked worker processes, see StatsSchema.chunk_iterator
+_worker_schema: Optional["StatsSchema"] = None
+
+# Shared column arrays inherited by forked worker processes, see StatsSchema.create_columns
+_worker_columns: Dict[str, Tuple[np.ndarray, bool]] = {}
+
+# numpy dtype kinds of columns written to shared memory by workers, rather than pickled
+_SHARED_KINDS = "biufcmM"
+
+# Providers of every StatsField as (Meta.name, module, class), imported and created on first use
+_DEFAULT_PROVIDERS = (
+    ("distribution", "mimesis_stats.providers.distribution", "Distribution"),
+    ("time", "mimesis_stats.providers.time", "TimeDistribution"),
+    ("multi_variable", "mimesis_stats.providers.multivariable", "MultiVariable"),
+    ("bayesian_network", "mimesis_stats.providers.network", "BayesianNetwork"),
+    ("gaussian_copula", "mimesis_stats.providers.copula", "GaussianCopula"),
+    ("empirical_distribution", "mimesis_stats.providers.distribution", "EmpiricalDistribution"),
+)
+
+
+class _LazyProvider:
+    """
+    Provider registered with a mimesis Generic without importing or creating it.
+
+    Generic creates providers held in attributes named `_<Meta.name>` on first
+    access of `<Meta.name>`, by calling them with its locale and seed.
+    """
+
+    __slots__ = ("module", "name", "options")
+
+    def __init__(self, module: str, name: str, **options: Any) -> None:
+
+        self.module = module
+        self.name = name
+        # attributes set on the provider once created
+        self.options = options
+
+    @property
+    def provider(self) -> type:
+        """The provider class, imported on first use."""
+        return getattr(importlib.import_module(self.module), self.name)
+
+    def __call__(self, locale: str, seed: Any) -> BaseProvider:
+
+        # as Generic.add_provider, the field's locale is not passed on
+        provider = self.provider(seed=seed)
+        for attribute, value in self.options.items():
+            setattr(provider, attribute, value)
+        return provider
+
+
+@functools.lru_cache(maxsize=None)
+def _generic_providers() -> Tuple[Tuple[str, Any], ...]:
+    """
+    The providers of mimesis Generic as lazy `_<name>` attributes, in Generic's order.
+
+    Found once from a Generic instance, as Generic creates most of its providers,
+    loading their data files, when it is created.
+    """
+    providers: List[Tuple[str, Any]] = []
+    for name, value in vars(Generic()).items():
+        if isinstance(value, BaseProvider):
+            providers.append((f"_{name}", _LazyProvider(type(value).__module__, type(value).__name__)))
+        elif inspect.isclass(value) and issubclass(value, BaseProvider):
+            providers.append((name, value))
+    return tuple(providers)
+
+
+class _LazyGeneric(Generic):
+    """
+    mimesis Generic that creates each of its providers on first use.
+    """
+
+    def __init__(self, locale: str = "en", seed: Any = None) -> None:
+
+        BaseDataProvider.__init__(self, locale, seed)
+        for name, provider in _generic_providers():
+            setattr(self, name, provider)
+
+
+class _FieldCall:
+    """
+    Deferred StatsField call recorded while a schema blueprint is captured.
+
+    Calling the object evaluates it for a single row, resolving any nested
+    field calls in its keyword arguments first.
+    """
+
+    __slots__ = ("field", "name", "key", "kwargs")
+
+    def __init__(self, field: "StatsField", name: str, key: Optional[Callable], kwargs: Dict[str, Any]) -> None:
+
+        self.field = field
+        self.name = name
+        self.key = key
+        self.kwargs = kwargs
+
+    def __call__(self) -> Any:
+
+        return self.field(self.name, key=self.key, **_materialise(self.kwargs))
+
+
+class FieldSpec:
+    """
+    Declarative specification of a single field call, for StatsSchema.from_specs.
+
+    Takes the same arguments as calling a StatsField, but only records them.
+    FieldSpecs may be nested in the keyword arguments of other FieldSpecs.
+
+    Examples
+    --------
+    >>>FieldSpec("discrete_distribution", population=["A", "B"], weights=[0.4, 0.6])
+    """
+
+    __slots__ = ("name", "key", "kwargs")
+
+    def __init__(self, name: str, key: Optional[Callable] = None, **kwargs: Any) -> None:
+
+        self.name = name
+        self.key = key
+        self.kwargs = kwargs
+
+    def __repr__(self) -> str:
+
+        return f"FieldSpec({self.name!r}, key={self.key!r}, **{self.kwargs!r})"
+
+
+def _bind(value: Any, field: "StatsField") -> Any:
+    """
+    Turn every FieldSpec in value into a deferred call on field.
+    Searches through lists, tuples and dicts.
+    """
+    if isinstance(value, FieldSpec):
+        return _FieldCall(field, value.name, value.key, _bind(value.kwargs, field))
+    if type(value) in (list, tuple):
+        return type(value)(_bind(element, field) for element in value)
+    if type(value) is dict:
+        return {k: _bind(v, field) for k, v in value.items()}
+    return value
+
+
+def _materialise(value: Any) -> Any:
+    """
+    Evaluate every deferred field call found in value for a single row.
+    Searches through lists, tuples and dicts.
+    """
+    if isinstance(value, _FieldCall):
+        return value()
+    if type(value) in (list, tuple):
+        return type(value)(_materialise(element) for element in value)
+    if type(value) is dict:
+        return {k: _materialise(v) for k, v in value.items()}
+    return value
+
+
+def _iter_calls(value: Any) -> Iterator[_FieldCall]:
+    """Yield every deferred field call in value, including those nested in other calls."""
+    if isinstance(value, _FieldCall):
+        yield value
+        value = value.kwargs
+    if type(value) in (list, tuple):
+        for element in value:
+            yield from _iter_calls(element)
+    elif type(value) is dict:
+        for element in value.values():
+            yield from _iter_calls(element)
+
+
+def _import_pyarrow() -> Any:
+    """Import the optional pyarrow dependency, with a helpful error if missing."""
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("pyarrow is required for Arrow / Parquet output: pip install mimesis_stats[arrow]")
+    return pyarrow
+
+
+def _create_shard(task: Tuple[Sequence[int], int, "_Exclusion"]) -> List[Any]:
+    """Worker process entry point, generates one shard of the inherited schema."""
+    return _worker_schema._create_shard(*task)  # type: ignore
+
+
+def _create_column_shard(task: Tuple[int, Sequence[int], int, int, "UnnestPlan", bool]) -> Tuple[int, Dict, Dict]:
+    """Worker process entry point, generates one shard of columns into the inherited shared arrays."""
+    shard, seeds, iterations, start, plan, categorical = task
+    columns = _worker_schema._create_column_shard(seeds, iterations, plan, categorical)  # type: ignore
+    return (shard,) + _store_shard(columns, start, _worker_columns)
+
+
+def _bounded_imap(pool: Any, func: Callable[[Any], Any], tasks: Iterable[Any], limit: int) -> Iterator[Any]:
+    """
+    Results of func over tasks from a process pool, in order, with at most
+    limit tasks submitted ahead of those yielded, unlike Pool.imap which submits all.
+    """
+    pending: collections.deque = collections.deque()
+    for task in tasks:
+        pending.append(pool.apply_async(func, (task,)))
+        if len(pending) >= limit:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def _shared_array(shape: Tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+    """
+    Array in anonymous shared memory, writes made by processes forked after
+    its creation are seen by this process. Freed with the array.
+    """
+    dtype = np.dtype(dtype)
+    size = int(np.prod(shape)) * dtype.itemsize
+    return np.frombuffer(mmap.mmap(-1, max(size, 1)), dtype=dtype, count=int(np.prod(shape))).reshape(shape)
+
+
+def _store_shard(columns: Dict[str, Any], start: int, shared: Dict[str, Tuple[np.ndarray, bool]]) -> Tuple[Dict, Dict]:
+    """
+    Write the columns of a shard into the shared arrays of matching type, from row start.
+
+    Returns the categories of categorical columns written, and the columns
+    that could not be written, to be passed back to the parent process.
+    """
+    categories = {}
+    values = {}
+    for name, column in columns.items():
+        target, is_categorical = shared.get(name, (None, False))
+        codes = column.codes if isinstance(column, CategoricalColumn) else column
+        if (
+            target is not None
+            and isinstance(column, CategoricalColumn) == is_categorical
+            and isinstance(codes, np.ndarray)
+            and codes.dtype == target.dtype
+            and codes.shape[1:] == target.shape[1:]
+        ):
+            stop = start + len(codes)
+            target[start:stop] = codes
+            if is_categorical:
+                categories[name] = column.categories
+        else:
+            values[name] = column
+    return categories, values
+
+
+def _concatenate(pieces: List[Any]) -> Union[np.ndarray, CategoricalColumn, List[Any]]:
+    """
+    Join the shards of a column, as an array, CategoricalColumn or list, whichever holds every shard.
+    """
+    if all(isinstance(piece, CategoricalColumn) for piece in pieces):
+        return CategoricalColumn.concatenate(pieces)
+    if all(isinstance(piece, np.ndarray) for piece in pieces):
+        return np.concatenate(pieces)
+    return [value for piece in pieces for value in (piece.tolist() if hasattr(piece, "tolist") else piece)]
+
+
+def _profiled(value: Any, generate: Callable[[], Any]) -> Callable[[], Any]:
+    """
+    Wrap a compiled step of a field call to record its time in the field's report.
+    """
+    # steps with nested calls go through StatsField.__call__, which records them
+    if not isinstance(value, _FieldCall) or _contains_call(value.kwargs):
+        return generate
+
+    field, name = value.field, str(value.name)
+
+    def step() -> Any:
+        report = field.report
+        if report is None:
+            return generate()
+        start = time.perf_counter()
+        try:
+            return generate()
+        finally:
+            report.record(name, time.perf_counter() - start)
+
+    return step
+
+
+def _contains_call(value: Any) -> bool:
+    """Whether value holds a deferred field call, at any depth of lists, tuples and dicts."""
+    if isinstance(value, _FieldCall):
+        return True
+    if type(value) in (list, tuple):
+        return any(_contains_call(element) for element in value)
+    if type(value) is dict:
+        return any(_contains_call(v) for v in value.values())
+    return False
+
+
+def _getter(keys: List[Any]) -> Callable[[Dict], Tuple[Any, ...]]:
+    """Fetch the values of keys from a dict as a tuple."""
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda record: (record[key],)
+    return operator.itemgetter(*keys)
+
+
+class UnnestPlan(NamedTuple):
+    """
+    Frozen rules for unnesting generated dictionaries into columns.
+
+    Attributes
+    ----------
+    exclude
+        Names of dict variables to keep as dicts, at any depth
+    depth
+        Levels of nested dicts to unnest, 0 keeps every dict as is
+    collisions
+        "raise" a KeyError when two variables share a name, or "prefix"
+        nested variables sharing a name with their parents' names
+    separator
+        Joins the names of a variable and its parents, for prefixes and rename
+    rename
+        Pairs of (variable name, column name), where nested variables are named
+        with their parents joined by separator, e.g. "household.count"
+
+    Examples
+    --------
+    >>>plan = UnnestPlan.create(exclude=["address"], depth=2, collisions="prefix")
+    >>>schema.create(iterations=1000, exclude_from_unnesting=plan)
+    """
+
+    exclude: FrozenSet[str] = frozenset()
+    depth: int = 1
+    collisions: str = "raise"
+    separator: str = "."
+    rename: Tuple[Tuple[str, str], ...] = ()
+
+    @classmethod
+    def create(
+        cls,
+        exclude: Optional[Iterable[str]] = None,
+        depth: int = 1,
+        collisions: str = "raise",
+        separator: str = ".",
+        rename: Optional[Dict[str, str]] = None,
+    ) -> "UnnestPlan":
+        """
+        Create a plan from any iterable of exclusions and a rename dictionary.
+
+        Raises
+        ------
+        ValueError
+            If depth is negative or collisions is not "raise" or "prefix".
+        """
+        if depth < 0:
+            raise ValueError("depth must be 0 or greater.")
+        if collisions not in ("raise", "prefix"):
+            raise ValueError(f'collisions must be "raise" or "prefix", not {collisions}')
+        return cls(frozenset(exclude or ()), depth, collisions, separator, tuple((rename or {}).items()))
+
+    def columns(self, record: Dict) -> List[Tuple[Tuple[Any, ...], Any]]:
+        """
+        Resolve the column names of a record's variables.
+
+        Parameters
+        ----------
+        record
+            Single row of generated data
+
+        Returns
+        -------
+        List of (path of keys to the variable, column name), in record order
+
+        Raises
+        ------
+        KeyError
+            If two columns would share a name.
+        """
+        paths: List[Tuple[Any, ...]] = []
+        self._paths(record, (), paths)
+
+        counts = collections.Counter(path[-1] for path in paths)
+        renames = dict(self.rename)
+
+        columns = []
+        names = set()
+        for path in paths:
+            full = self.separator.join(map(str, path))
+            if full in renames:
+                name = renames[full]
+            elif self.collisions == "prefix" and len(path) > 1 and counts[path[-1]] > 1:
+                name = full
+            else:
+                name = path[-1]
+            if name in names:
+                raise KeyError(f"{name} variable name already in variable dictionary")
+            names.add(name)
+            columns.append((path, name))
+        return columns
+
+    def unnest(self, record: Dict) -> Dict:
+        """
+        Unnest a single record, see columns.
+        """
+        if self.depth != 1 or self.collisions != "raise" or self.rename:
+            return {name: _lookup(record, path) for path, name in self.columns(record)}
+
+        # the default plan needs no paths
+        d: Dict[Any, Any] = {}
+        for k, v in record.items():
+            if isinstance(v, dict) and k not in self.exclude:
+                width = len(d) + len(v)
+                d.update(v)
+                if len(d) != width:
+                    raise KeyError(f"variable names of {k} already in variable dictionary")
+            elif k not in d:
+                d[k] = v
+            else:
+                raise KeyError(f"{k} variable name already in variable dictionary")
+        return d
+
+    def _paths(self, record: Dict, parents: Tuple[Any, ...], paths: List[Tuple[Any, ...]]) -> None:
+
+        for k, v in record.items():
+            if isinstance(v, dict) and len(parents) < self.depth and k not in self.exclude:
+                self._paths(v, parents + (k,), paths)
+            else:
+                paths.append(parents + (k,))
+
+
+def _as_plan(exclude: "_Exclusion") -> UnnestPlan:
+    """Resolve an exclusion list, or None, to an UnnestPlan."""
+    if isinstance(exclude, UnnestPlan):
+        return exclude
+    return UnnestPlan.create(exclude)
+
+
+def _lookup(record: Dict, path: Tuple[Any, ...]) -> Any:
+    """Fetch the value at a path of keys through nested dicts."""
+    for k in path:
+        record = record[k]
+    return record
+
+
+# Accepted by the exclude_from_unnesting arguments of StatsSchema
+_Exclusion = Optional[Union[Iterable[str], UnnestPlan]]
+
+
+class _UnnestLayout:
+    """
+    Flat column layout of records, inferred once from the first record.
+
+    Records are expected to keep the same shape, as provider output does,
+    so later records are unnested without checking the type of each value.
+    Any record that does not produce the expected number of columns is
+    passed to the full UnnestPlan.unnest instead, which raises on
+    variable name collisions.
+    """
+
+    __slots__ = ("steps", "width", "plan")
+
+    def __init__(self, record: Dict, plan: UnnestPlan) -> None:
+
+        self.plan = plan
+        # raises for collisions in the first record
+        columns = plan.columns(record)
+        self.width = len(columns)
+
+        # group columns by top level variable, in record order
+        groups: List[Any] = []
+        for path, name in columns:
+            if groups and groups[-1][0] == path[0]:
+                groups[-1][1].append((path, name))
+            else:
+                groups.append((path[0], [(path, name)]))
+
+        # runs of plain keys are copied together
+        runs: List[Any] = []
+        for k, group in groups:
+            if len(group) == 1 and group[0] == ((k,), k):
+                if runs and isinstance(runs[-1], list):
+                    runs[-1].append(k)
+                else:
+                    runs.append([k])
+            elif all(len(path) == 2 and path[1] == name for path, name in group):
+                runs.append(k)
+            else:
+                runs.append(tuple(group))
+
+        # (plain keys, getter), (nested key, None) or (columns, None) for renamed
+        # and deeper variables; None when there is nothing to unnest
+        self.steps = (
+            tuple((tuple(run), _getter(run)) if isinstance(run, list) else (run, None) for run in runs)
+            if any(not isinstance(run, list) for run in runs)
+            else None
+        )
+
+    def __call__(self, record: Dict) -> Dict:
+
+        if self.steps is None:
+            return record
+
+        d: Dict[str, Any] = {}
+        try:
+            for keys, getter in self.steps:
+                if getter is not None:
+                    d.update(zip(keys, getter(record)))
+                elif isinstance(keys, tuple):
+                    for path, name in keys:
+                        d[name] = _lookup(record, path)
+                else:
+                    d.update(record[keys])
+        except (KeyError, TypeError, ValueError):
+            return self.plan.unnest(record)
+
+        if len(d) != self.width:
+            return self.plan.unnest(record)
+        return d
+
+
+def _columnise(column: Any, plan: UnnestPlan, depth: int) -> Any:
+    """
+    Turn a column of dicts into nested dicts of columns, to plan.depth.
+    """
+    if depth >= plan.depth:
+        return column
+    if isinstance(column, dict):
+        return {k: v if k in plan.exclude else _columnise(v, plan, depth + 1) for k, v in column.items()}
+    if isinstance(column, (list, np.ndarray)) and len(column) and isinstance(column[0], dict):
+        return _columnise({k: [row[k] for row in column] for k in column[0]}, plan, depth)
+    return column
+
+
+def _rows(column: Dict[Any, Any]) -> List[Dict]:
+    """
+    Turn a dict of columns, as from multi-variable batch methods, into a list of dicts.
+    """
+    return [dict(zip(column, values)) for values in zip(*column.values())]
 
 
 class StatsField(Field):
@@ -15,12 +571,221 @@ class StatsField(Field):
     Class for generating single element data.
     Inherets from mimesis Field approach.
     Adds mimesis_stats providers by default.
+
+    Attributes
+    ----------
+    report
+        ProfileReport timing each provider method called, None (the default) to not profile
     """
 
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
+    report: Optional[ProfileReport] = None
+
+    def __init__(
+        self,
+        locale: str = "en",
+        seed: Any = None,
+        providers: Optional[Sequence[Type[BaseProvider]]] = None,
+        *,
+        buffer_size: int = 0,
+        max_buffers: int = 128,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        locale, seed, providers
+            Arguments of mimesis Field
+        buffer_size
+            When above 0, mimesis_stats provider methods draw up to this many values
+            at a time and return them one per call, see BaseStatsDataProvider.
+            Deterministic for a given seed and buffer_size.
+        max_buffers
+            Number of buffers (one per method and set of arguments) kept per provider
+
+        Notes
+        -----
+        Providers, including those of mimesis, are only imported and created
+        when one of their methods is first used.
+        """
+        # as mimesis Field.__init__, without creating every provider up front
+        self.locale = locale
+        self.seed = seed
+        self._gen = _LazyGeneric(locale, seed)
+        self._table: Dict[str, Callable] = {}
+
+        if providers:
+            self._gen.add_providers(*providers)
+        for name, module, class_name in _DEFAULT_PROVIDERS:
+            lazy = _LazyProvider(module, class_name, buffer_size=buffer_size, max_buffers=max_buffers)
+            setattr(self._gen, f"_{name}", lazy)
+
+        for provider in vars(self._gen).values():
+            if isinstance(provider, BaseStatsDataProvider):
+                provider.buffer_size = buffer_size
+                provider.max_buffers = max_buffers
+
+    def __call__(self, name: Optional[str] = None, key: Optional[Callable] = None, **kwargs: Any) -> Any:
+        """
+        Generate a value from the provider method called name.
+
+        Notes
+        -----
+        While a StatsSchema is capturing its blueprint for columnar generation
+        no value is generated, a deferred call is returned instead.
+        """
+        if getattr(_capture, "active", False):
+            call = _FieldCall(self, name, key, kwargs)  # type: ignore
+            _capture.calls.append(call)
+            return call
+
+        fields = getattr(_capture, "fields", None)
+        if fields is not None and not any(self is field for field in fields):
+            fields.append(self)
+
+        # looked up here so that only the provider used is created
+        if name not in self._table:
+            self._resolve(name)
+
+        if self.report is None:
+            return super().__call__(name, key=key, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            return super().__call__(name, key=key, **kwargs)
+        finally:
+            self.report.record(str(name), time.perf_counter() - start)
+
+    @contextlib.contextmanager
+    def profile(self, report: Optional[ProfileReport] = None) -> Iterator[ProfileReport]:
+        """
+        Time each provider method called within the context.
+
+        Parameters
+        ----------
+        report
+            ProfileReport to add to, a new one by default
+
+        Returns
+        -------
+        Context manager giving the ProfileReport
+
+        Examples
+        --------
+        >>>with field.profile() as report:
+        ...    schema.create(iterations=10000)
+        >>>report.fields()[0]
+        FieldProfile(name="person.full_name", calls=10000, values=10000, seconds=0.912)
+        """
+        previous = self.report
+        self.report = report if report is not None else ProfileReport()
+        try:
+            yield self.report
+        finally:
+            self.report = previous
+
+    def reseed(self, seed: Any = None) -> None:
+        """
+        Reseed the field and every provider it holds.
+
+        Parameters
+        ----------
+        seed
+            Seed for random, when None the current system time is used.
+        """
+        self.seed = seed
+        self._reseed_providers(seed)
+
+    def _reseed_providers(self, seed: Any) -> None:
+        """
+        Reseed every provider, leaving the field's own seed unchanged.
+        """
+        self._gen.reseed(seed)
+        # providers not yet created by mimesis are built later from self._gen.seed
+        for provider in list(vars(self._gen).values()):
+            if isinstance(provider, BaseProvider):
+                provider.reseed(seed)
 
-        super().__init__(*args, **kwargs)
-        self._gen.add_providers(*[Distribution, TimeDistribution, MultiVariable])
+    def _resolve(self, name: Optional[str]) -> Callable:
+        """
+        Find the provider method referred to by name, following the lookup
+        rules of mimesis Field (`provider.method` or a bare method name).
+        """
+        if name is None:
+            raise UndefinedField()
+
+        if name not in self._table:
+            if "." in name:
+                provider_name, method_name = name.split(".", 1)
+                if "." in method_name:
+                    raise UnacceptableField()
+                provider = getattr(self._gen, provider_name, None)
+                if provider is not None and hasattr(provider, method_name):
+                    self._table[name] = getattr(provider, method_name)
+            elif name == self._gen.choice.Meta.name:
+                self._table[name] = self._gen.choice
+            else:
+                # as mimesis, the last provider with the method is used
+                match = None
+                for provider_name in dir(self._gen):
+                    if name in dir(self._provider_type(provider_name)):
+                        match = provider_name
+                if match is not None:
+                    self._table[name] = getattr(getattr(self._gen, match), name)
+
+        try:
+            return self._table[name]
+        except KeyError:
+            raise UnsupportedField(name)
+
+    def _provider_type(self, provider_name: str) -> Any:
+        """
+        The provider called provider_name, or its class if not yet created.
+        """
+        attributes = vars(self._gen)
+        if provider_name in attributes:
+            return attributes[provider_name]
+
+        lazy = attributes.get(f"_{provider_name}")
+        if isinstance(lazy, _LazyProvider):
+            return lazy.provider
+        return lazy if inspect.isclass(lazy) else None
+
+    def _generate_batch(
+        self, call: _FieldCall, iterations: int, categorical: bool = False
+    ) -> Union[np.ndarray, CategoricalColumn, List[Any]]:
+        """
+        Generate iterations values for a deferred call in one go.
+
+        Uses the provider's `<method>_batch` counterpart where one exists,
+        otherwise the scalar method is called once per value. With categorical,
+        batch methods supporting it return CategoricalColumns.
+        """
+        try:
+            batch_method = self._resolve(f"{call.name}_batch")
+        except UnsupportedField:
+            batch_method = None
+
+        if batch_method is None or _contains_call(call.kwargs):
+            return [call() for _ in range(iterations)]
+
+        if self.report is None:
+            return self._call_batch(call, batch_method, iterations, categorical)
+
+        start = time.perf_counter()
+        try:
+            return self._call_batch(call, batch_method, iterations, categorical)
+        finally:
+            self.report.record(str(call.name), time.perf_counter() - start, values=iterations)
+
+    @staticmethod
+    def _call_batch(
+        call: _FieldCall, batch_method: Callable, iterations: int, categorical: bool
+    ) -> Union[np.ndarray, CategoricalColumn, List[Any]]:
+
+        if call.key and callable(call.key):
+            return [call.key(value) for value in batch_method(size=iterations, **call.kwargs)]
+        if categorical and "as_categorical" in inspect.signature(batch_method).parameters:
+            return batch_method(size=iterations, as_categorical=True, **call.kwargs)
+        return batch_method(size=iterations, **call.kwargs)
 
 
 class StatsSchema:
@@ -43,8 +808,93 @@ class StatsSchema:
             lambda: {variable_name: field(provider_method, **kwargs)}
         """
         self.schema = schema
+        # deferred calls of a compiled schema, see from_specs
+        self._blueprint: Optional[Dict[str, Any]] = None
+        # fields reseeded before each shard, found when the shards are planned
+        self._shard_fields: List[StatsField] = []
 
-    def _unnest(self, generated_results: Dict, exclude: List[str] = []) -> Dict:
+    @classmethod
+    def from_specs(cls, specs: Dict[str, Any], field: StatsField) -> "StatsSchema":
+        """
+        Create a schema from a declarative blueprint of FieldSpecs.
+
+        Provider methods are looked up and their arguments validated once,
+        here, rather than on every record.
+
+        Parameters
+        ----------
+        specs
+            Dictionary of variable_name: FieldSpec (or a constant value)
+        field
+            StatsField the FieldSpecs are generated with
+
+        Returns
+        -------
+        StatsSchema
+
+        Raises
+        ------
+        TypeError
+            If the arguments of a FieldSpec do not match its provider method.
+
+        Examples
+        --------
+        >>>schema = StatsSchema.from_specs(
+            {
+                "name": FieldSpec("person.full_name"),
+                "salary": FieldSpec("generic_distribution", func="pareto", a=3),
+            },
+            field=StatsField(seed=42),
+        )
+        >>>schema.create(iterations=2)
+        """
+        blueprint = _bind(specs, field)
+        steps = [(name, cls._compile_step(name, value)) for name, value in blueprint.items()]
+        # the field's report is checked once per record rather than per step
+        profiled_steps = [(name, _profiled(blueprint[name], generate)) for name, generate in steps]
+
+        def compiled_schema() -> Dict[str, Any]:
+            if field.report is not None:
+                return {name: generate() for name, generate in profiled_steps}
+            return {name: generate() for name, generate in steps}
+
+        schema = cls(schema=compiled_schema)
+        schema._blueprint = blueprint
+        return schema
+
+    @staticmethod
+    def _compile_step(name: str, value: Any) -> Callable[[], Any]:
+        """
+        Build the function producing one value of a compiled blueprint entry.
+        """
+        if not isinstance(value, _FieldCall):
+            if _contains_call(value):
+                return functools.partial(_materialise, value)
+            return lambda: value
+
+        # nested calls must be resolved per record
+        if _contains_call(value.kwargs):
+            return value
+
+        method = value.field._resolve(value.name)
+        try:
+            signature = inspect.signature(method)
+        except ValueError:
+            # no signature available for some builtins, left to fail when called
+            signature = None
+        if signature is not None:
+            try:
+                signature.bind(**value.kwargs)
+            except TypeError as error:
+                raise TypeError(f"Invalid arguments for {name} ({value.name}): {error}")
+
+        generate = functools.partial(method, **value.kwargs)
+        if value.key and callable(value.key):
+            key = value.key
+            return lambda: key(generate())
+        return generate
+
+    def _unnest(self, generated_results: Dict, exclude: _Exclusion = None) -> Dict:
         """
         For multi-variable generation unest the defined sub-variables
 
@@ -55,27 +905,307 @@ class StatsSchema:
         generated_results
             Single row of generated data to be unpacked
         exclude
-            Specify which results to not unnest even if a dictionary is found
+            Specify which results to not unnest even if a dictionary is found,
+            or an UnnestPlan
 
         Notes
         -----
-        Only unests to single level of depth.
+        Only unests to single level of depth, unless given an UnnestPlan.
         exclude will only be used if you want a dictionary in a column.
         The method by default checks whether the object is a dict, so
         non-dict variables can be given.
         """
-        # make more performant, can nested-ness be checked?
-        d = {}
-        for k, v in generated_results.items():
-            if isinstance(v, dict) and k not in exclude:
-                d.update(v)
-            elif k not in d:
-                d[k] = v
-            else:
-                raise KeyError(f"{k} variable name already in variable dictionary")
-        return d
+        return _as_plan(exclude).unnest(generated_results)
+
+    def _unnested_records(self, iterations: int, exclude: _Exclusion) -> Iterator[Dict]:
+        """
+        Generate unnested records, inferring the column layout from the first.
+        """
+        plan = _as_plan(exclude)
+        layout = None
+        for _ in range(iterations):
+            record = self.schema()
+            if layout is None:
+                layout = _UnnestLayout(record, plan)
+            yield layout(record)
 
-    def create(self, iterations: int = 1, exclude_from_unnesting: List[str] = []) -> List[Any]:
+    def _capture_blueprint(self) -> Optional[Dict]:
+        """
+        Evaluate the schema once, recording StatsField calls rather than
+        generating values from them.
+
+        None when a deferred call is used within an expression, such as an
+        f-string or arithmetic, so the schema cannot be generated by column.
+        """
+        if self._blueprint is not None:
+            return self._blueprint
+
+        previous = getattr(_capture, "active", False), getattr(_capture, "calls", None)
+        _capture.active, _capture.calls = True, []
+        try:
+            blueprint = self.schema()
+        except Exception:
+            # most likely an operation on a deferred call, any other error is raised again row by row
+            return None
+        else:
+            captured = {id(call) for value in blueprint.values() for call in _iter_calls(value)}
+            if any(id(call) not in captured for call in _capture.calls):
+                return None
+            return blueprint
+        finally:
+            _capture.active, _capture.calls = previous
+
+    def _used_fields(self) -> List[StatsField]:
+        """
+        Find the StatsFields used by the schema, in order of first use.
+
+        Read from the captured blueprint, without generating values, where the
+        fields' values are not used within expressions, such as f-strings.
+        Otherwise found by creating a record with every StatsField call
+        recording its field, which advances the fields' state.
+        """
+        blueprint = self._capture_blueprint()
+        if blueprint is not None:
+            fields: List[StatsField] = []
+            for value in blueprint.values():
+                for call in _iter_calls(value):
+                    if not any(call.field is field for field in fields):
+                        fields.append(call.field)
+            return fields
+
+        previous = getattr(_capture, "fields", None)
+        _capture.fields = []
+        try:
+            self.schema()
+            return _capture.fields
+        finally:
+            _capture.fields = previous
+
+    def _shard_seeds(self, iterations: int, shard_size: int) -> Iterator[Tuple[List[int], int]]:
+        """
+        Seeds for the schema's fields and number of records, of each shard in turn.
+
+        The fields are found, and kept to be reseeded by _create_shard, when called
+        rather than when first iterated, so that worker processes forked
+        afterwards inherit them.
+        """
+        self._shard_fields = self._used_fields()
+        # seeds as given to the fields' providers, see BaseStatsDataProvider._seed_generator
+        field_seeds: List[Any] = [field.seed for field in self._shard_fields]
+        # entropy is fixed here so unseeded fields are still consistent across shards
+        roots = [np.random.SeedSequence(seed) for seed in field_seeds]
+
+        def seeds(shard: int) -> List[int]:
+            # equivalent to root.spawn(n_shards)[shard] without spawning every shard up front
+            return [
+                int(np.random.SeedSequence(root.entropy, spawn_key=(shard,)).generate_state(1, np.uint64)[0])
+                for root in roots
+            ]
+
+        return (
+            (seeds(shard), min(shard_size, iterations - start))
+            for shard, start in enumerate(range(0, iterations, shard_size))
+        )
+
+    def _create_shard(self, seeds: Sequence[int], iterations: int, exclude: _Exclusion) -> List[Any]:
+        """
+        Reseed the schema's fields and create one shard of records.
+        """
+        for field, seed in zip(self._shard_fields, seeds):
+            field._reseed_providers(seed)
+        return self.create(iterations=iterations, exclude_from_unnesting=exclude)
+
+    def _create_column_shard(
+        self, seeds: Sequence[int], iterations: int, plan: UnnestPlan, categorical: bool
+    ) -> Dict[str, Any]:
+        """
+        Reseed the schema's fields and create one shard of columns.
+        """
+        for field, seed in zip(self._shard_fields, seeds):
+            field._reseed_providers(seed)
+        return self.create_columns(iterations, plan, categorical=categorical)
+
+    def _create_columns_sharded(
+        self, iterations: int, plan: UnnestPlan, categorical: bool, workers: int, shard_size: int
+    ) -> Dict[str, Union[np.ndarray, CategoricalColumn, List[Any]]]:
+        """
+        Create columns in independently seeded shards, across worker processes
+        writing numeric and categorical code columns into shared memory.
+        """
+        global _worker_schema, _worker_columns
+
+        if shard_size < 1 or workers < 1:
+            raise ValueError("shard_size and workers must be greater than 0.")
+
+        tasks = [
+            (shard, seeds, size, shard * shard_size, plan, categorical)
+            for shard, (seeds, size) in enumerate(self._shard_seeds(iterations, shard_size))
+        ]
+
+        # the first shard sets out the columns, their types and so the shared arrays
+        _, seeds, size, _, _, _ = tasks[0]
+        first = self._create_column_shard(seeds, size, plan, categorical)
+        shared = {}
+        for name, column in first.items():
+            codes = column.codes if isinstance(column, CategoricalColumn) else column
+            if isinstance(codes, np.ndarray) and codes.dtype.kind in _SHARED_KINDS:
+                shared[name] = (
+                    _shared_array((iterations,) + codes.shape[1:], codes.dtype),
+                    isinstance(column, CategoricalColumn),
+                )
+
+        results = [(0,) + _store_shard(first, 0, shared)]
+
+        import multiprocessing
+
+        if workers == 1 or len(tasks) == 1 or "fork" not in multiprocessing.get_all_start_methods():
+            for shard, seeds, size, start, _, _ in tasks[1:]:
+                columns = self._create_column_shard(seeds, size, plan, categorical)
+                results.append((shard,) + _store_shard(columns, start, shared))
+        else:
+            _worker_schema, _worker_columns = self, shared
+            try:
+                with multiprocessing.get_context("fork").Pool(workers) as pool:
+                    results.extend(pool.imap_unordered(_create_column_shard, tasks[1:]))
+            finally:
+                _worker_schema, _worker_columns = None, {}
+        results.sort(key=operator.itemgetter(0))
+
+        columns = {}
+        for name in first:
+            array, is_categorical = shared.get(name, (None, False))
+            if array is not None and not any(name in values for _, _, values in results):
+                # every shard was written to shared memory, so the array is the column
+                if not is_categorical:
+                    columns[name] = array
+                    continue
+                shard_categories = [categories[name] for _, categories, _ in results]
+                if all(categories == shard_categories[0] for categories in shard_categories):
+                    columns[name] = CategoricalColumn(array, shard_categories[0])
+                    continue
+
+            pieces = []
+            for (_, categories, values), (_, _, size, start, _, _) in zip(results, tasks):
+                if name in values:
+                    pieces.append(values[name])
+                    continue
+                # shards without their own values wrote them to the shared array
+                assert array is not None
+                stop = start + size
+                piece = array[start:stop]
+                pieces.append(CategoricalColumn(piece, categories[name]) if is_categorical else piece)
+            columns[name] = _concatenate(pieces)
+
+        return columns
+
+    @staticmethod
+    def _generate_column(
+        value: Any, iterations: int, categorical: bool = False
+    ) -> Union[np.ndarray, CategoricalColumn, List[Any]]:
+        """
+        Produce a column of iterations values for one captured blueprint entry.
+        """
+        if isinstance(value, _FieldCall):
+            return value.field._generate_batch(value, iterations, categorical)
+        if _contains_call(value):
+            return [_materialise(value) for _ in range(iterations)]
+        return [value] * iterations
+
+    def create_columns(
+        self,
+        iterations: int = 1,
+        exclude_from_unnesting: _Exclusion = None,
+        missingness: Optional[Missingness] = None,
+        categorical: bool = False,
+        workers: Optional[int] = None,
+        shard_size: int = 100000,
+    ) -> Dict[str, Union[np.ndarray, CategoricalColumn, List[Any]]]:
+        """
+        Creates a fulfilled schema column by column.
+
+        Each provider is asked for all iterations values at once, through
+        its `<method>_batch` method where it has one.
+
+        Parameters
+        ----------
+        iterations
+            How many records to create
+        exclude_from_unenesting
+            Which dict variables to not perform unnesting on, or an UnnestPlan
+        missingness
+            Null values to add to the columns in bulk after generation
+        categorical
+            Return categorical variables, from providers able to, as CategoricalColumns
+            of integer codes rather than one value per row
+        workers
+            Number of processes to generate with, in independently seeded shards
+            as with chunk_iterator. When None columns are generated in one batch
+            from the fields' current state.
+        shard_size
+            Records per independently seeded shard, only used with workers.
+
+        Returns
+        -------
+        Dictionary of variable name: array, CategoricalColumn or list of values
+
+        Notes
+        -----
+        The blueprint is evaluated only once, StatsField calls are deferred and
+        generated per column. Values computed directly in the blueprint, rather
+        than through a StatsField, are therefore repeated on every row.
+        Schemas using a StatsField's value within an expression, such as an
+        f-string, cannot be deferred and are created row by row into lists.
+        Providers are seeded as with create, although values are drawn in
+        a different order so the records will not match create for a given seed.
+
+        With workers, numeric, datetime and categorical code columns are written
+        by the worker processes straight into arrays in shared memory, allocated
+        once the first shard shows their types, and only other columns, such as
+        strings, are pickled back. Output for a given seed and shard_size is the
+        same whatever the number of workers.
+
+        Examples
+        --------
+        >>>pd.DataFrame(schema.create_columns(iterations=1000))
+        >>>columns = schema.create_columns(iterations=10**7, categorical=True)
+        >>>pd.DataFrame({k: v.to_pandas() if isinstance(v, CategoricalColumn) else v for k, v in columns.items()})
+        >>>columns = schema.create_columns(iterations=10**8, categorical=True, workers=8)
+        """
+        if iterations < 1:
+            raise ValueError("The number of iterations must be greater than 0.")
+
+        plan = _as_plan(exclude_from_unnesting)
+
+        blueprint = self._capture_blueprint() if workers is None else None
+        if workers is not None:
+            columns = self._create_columns_sharded(iterations, plan, categorical, workers, shard_size)
+        elif blueprint is None:
+            # field values are used within expressions, so create records and transpose them
+            records = self.create(iterations, plan)
+            columns = {name: [record[name] for record in records] for name in records[0]}
+        else:
+            columns = {}
+            for name, value in blueprint.items():
+                column = self._generate_column(value, iterations, categorical)
+                # multi-variable results become one column per variable, or a list of dicts if kept
+                if name in plan.exclude or not plan.depth:
+                    columns[name] = _rows(column) if isinstance(column, dict) else column
+                else:
+                    columns[name] = _columnise(column, plan, 0)
+
+            columns = plan.unnest(columns)
+
+        if missingness is not None:
+            columns = missingness.apply(columns)
+        return columns
+
+    def create(
+        self,
+        iterations: int = 1,
+        exclude_from_unnesting: _Exclusion = None,
+        workers: Optional[int] = None,
+        shard_size: int = 10000,
+    ) -> List[Any]:
         """
         Creates a list of a fulfilled schemas.
 
@@ -84,15 +1214,219 @@ class StatsSchema:
         iterations
             How many records to create
         exclude_from_unenesting
-            Which dict variables to not perform unnesting on
+            Which dict variables to not perform unnesting on, or an UnnestPlan
+        workers
+            Number of processes to generate with, see chunk_iterator.
+            When None records are generated in order from the fields' current state.
+        shard_size
+            Records per independently seeded shard, only used with workers.
 
         Notes
         -----
         Typical method used for generation for dataframes.
         """
-        return [self._unnest(self.schema(), exclude=exclude_from_unnesting) for _ in range(iterations)]
+        if workers is not None:
+            return [
+                record
+                for chunk in self.chunk_iterator(iterations, shard_size, exclude_from_unnesting, workers=workers)
+                for record in chunk
+            ]
+
+        return list(self._unnested_records(iterations, exclude_from_unnesting))
+
+    def chunk_iterator(
+        self,
+        iterations: int = 1,
+        shard_size: int = 10000,
+        exclude_from_unnesting: _Exclusion = None,
+        workers: int = 1,
+    ) -> Iterator[List[Any]]:
+        """
+        Fulfills schema in independently seeded shards, optionally across processes.
+
+        Parameters
+        ----------
+        iterations
+            How many records to create in total
+        shard_size
+            How many records in each shard, the last may be smaller
+        exclude_from_unenesting
+            Which dict variables to not perform unnesting on, or an UnnestPlan
+        workers
+            Number of processes generating shards
+
+        Returns
+        -------
+        Iterator of lists of records, one list per shard, in shard order
+
+        Notes
+        -----
+        Before each shard every StatsField used by the schema is reseeded with
+        a child of its seed, derived with numpy SeedSequence.spawn. Fields used
+        within expressions, such as f-strings, are found by first creating one
+        record. Output is therefore identical for a given seed and shard_size whatever the number
+        of workers. When run in this process (workers=1) the fields' providers
+        are left in the final shard's state.
+        Worker processes are forked so that the blueprint need not be
+        pickled; on platforms without fork shards are generated in this process.
+        At most 2 * workers shards are generated ahead of the consumer.
+        mimesis Field objects other than StatsField are not reseeded.
+
+        Examples
+        --------
+        >>>for chunk in schema.chunk_iterator(iterations=10**8, shard_size=10**5, workers=8):
+        ...    pd.DataFrame(chunk).to_csv(path, mode="a")
+        """
+        if iterations < 1:
+            raise ValueError("The number of iterations must be greater than 0.")
+        if shard_size < 1 or workers < 1:
+            raise ValueError("shard_size and workers must be greater than 0.")
+
+        plan = _as_plan(exclude_from_unnesting)
+        tasks = ((seeds, size, plan) for seeds, size in self._shard_seeds(iterations, shard_size))
+
+        with self._shard_pool(workers) as pool:
+            if pool is None:
+                for task in tasks:
+                    yield self._create_shard(*task)
+            else:
+                yield from _bounded_imap(pool, _create_shard, tasks, 2 * workers)
+
+    @contextlib.contextmanager
+    def _shard_pool(self, workers: int) -> Iterator[Any]:
+        """
+        Pool of forked worker processes creating shards of this schema,
+        or None when shards are to be created in this process.
+        """
+        global _worker_schema
+
+        import multiprocessing
+
+        if workers == 1 or "fork" not in multiprocessing.get_all_start_methods():
+            yield None
+            return
+
+        _worker_schema = self
+        try:
+            with multiprocessing.get_context("fork").Pool(workers) as pool:
+                yield pool
+        finally:
+            _worker_schema = None
+
+    def to_arrow_batches(
+        self,
+        iterations: int = 1,
+        batch_size: int = 100000,
+        exclude_from_unnesting: _Exclusion = None,
+        arrow_schema: Any = None,
+        missingness: Optional[Missingness] = None,
+        categorical: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Fulfills schema as a stream of pyarrow RecordBatches.
+
+        Parameters
+        ----------
+        iterations
+            How many records to create in total
+        batch_size
+            How many records in each batch, the last may be smaller
+        exclude_from_unenesting
+            Which dict variables to not perform unnesting on, or an UnnestPlan
+        arrow_schema
+            pyarrow.Schema for the batches, inferred from the first batch when None
+        missingness
+            Null values to add to each batch in bulk
+        categorical
+            Write categorical variables, from providers able to, as dictionary encoded arrays
+
+        Returns
+        -------
+        Iterator of pyarrow.RecordBatch
+
+        Notes
+        -----
+        Batches are generated with create_columns, only one batch is held in
+        memory at a time. Every batch is cast to the schema of the first, so give
+        arrow_schema if a column could be entirely null in the first batch.
+        Requires the optional pyarrow dependency.
+        """
+        pa = _import_pyarrow()
 
-    def iterator(self, iterations: int = 1, exclude_from_unnesting: List[str] = []) -> Iterator[Any]:
+        if iterations < 1:
+            raise ValueError("The number of iterations must be greater than 0.")
+
+        for start in range(0, iterations, batch_size):
+            columns = self.create_columns(
+                min(batch_size, iterations - start), exclude_from_unnesting, missingness, categorical
+            )
+            arrays = {
+                name: column.to_arrow() if isinstance(column, CategoricalColumn) else column
+                for name, column in columns.items()
+            }
+            batch = pa.RecordBatch.from_pydict(arrays, schema=arrow_schema)
+            arrow_schema = batch.schema
+            yield batch
+
+    def to_parquet(
+        self,
+        path: str,
+        iterations: int = 1,
+        batch_size: int = 100000,
+        exclude_from_unnesting: _Exclusion = None,
+        arrow_schema: Any = None,
+        missingness: Optional[Missingness] = None,
+        categorical: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Fulfills schema straight to a Parquet file, one row group per batch.
+
+        Parameters
+        ----------
+        path
+            File to write
+        iterations
+            How many records to create in total
+        batch_size
+            How many records to generate and write at a time
+        exclude_from_unenesting
+            Which dict variables to not perform unnesting on, or an UnnestPlan
+        arrow_schema
+            pyarrow.Schema for the file, inferred from the first batch when None
+        missingness
+            Null values to add to each batch in bulk
+        categorical
+            Write categorical variables, from providers able to, as dictionary encoded columns
+        **kwargs
+            Keyword arguments for pyarrow.parquet.ParquetWriter, e.g. compression
+
+        Notes
+        -----
+        Memory use is bounded by batch_size rather than iterations.
+        Requires the optional pyarrow dependency.
+
+        Examples
+        --------
+        >>>schema.to_parquet("survey.parquet", iterations=10**8, batch_size=10**6)
+        """
+        pa = _import_pyarrow()
+        import pyarrow.parquet as pq
+
+        writer = None
+        try:
+            batches = self.to_arrow_batches(
+                iterations, batch_size, exclude_from_unnesting, arrow_schema, missingness, categorical
+            )
+            for batch in batches:
+                if writer is None:
+                    writer = pq.ParquetWriter(path, batch.schema, **kwargs)
+                writer.write_table(pa.Table.from_batches([batch]))
+        finally:
+            if writer is not None:
+                writer.close()
+
+    def iterator(self, iterations: int = 1, exclude_from_unnesting: _Exclusion = None) -> Iterator[Any]:
         """
         Fulfills schema in a lazy way.
 
@@ -101,11 +1435,129 @@ class StatsSchema:
         iterations
             How many records to create
         exclude_from_unenesting
-            Which dict variables to not perform unnesting on
+            Which dict variables to not perform unnesting on, or an UnnestPlan
+        """
+
+        if iterations < 1:
+            raise ValueError("The number of iterations must be greater than 0.")
+
+        yield from self._unnested_records(iterations, exclude_from_unnesting)
+
+    async def aiter(
+        self,
+        iterations: int = 1,
+        batch_size: int = 10000,
+        exclude_from_unnesting: _Exclusion = None,
+        prefetch: int = 2,
+        workers: int = 1,
+    ) -> AsyncIterator[List[Any]]:
         """
+        Fulfills schema in batches without blocking the asyncio event loop.
+
+        Parameters
+        ----------
+        iterations
+            How many records to create in total
+        batch_size
+            How many records in each batch, the last may be smaller
+        exclude_from_unenesting
+            Which dict variables to not perform unnesting on, or an UnnestPlan
+        prefetch
+            Most batches generated ahead of the consumer, bounding memory use
+        workers
+            Number of processes generating batches, see chunk_iterator
+
+        Returns
+        -------
+        Async iterator of lists of records, one list per batch, in order
+
+        Notes
+        -----
+        Batches are produced as by chunk_iterator in a background thread, so output
+        is identical to chunk_iterator(iterations, batch_size, ...) for a given seed.
+        Generation pauses once prefetch batches are generated or waiting to be consumed,
+        so with workers > 1 a prefetch of at least workers keeps every process busy.
+        The worker processes are forked when iteration starts, from the calling
+        thread, before the background thread is started.
+        The schema's fields should not be used elsewhere while iterating. When
+        stopping early, close the iterator (aclose) to wait for a batch in progress.
 
+        Examples
+        --------
+        >>>async for batch in schema.aiter(iterations=10**6, batch_size=1000):
+        ...    await queue.put(batch)
+        """
+        if prefetch < 1:
+            raise ValueError("prefetch must be greater than 0.")
         if iterations < 1:
             raise ValueError("The number of iterations must be greater than 0.")
+        if workers < 1:
+            raise ValueError("workers must be greater than 0.")
+
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+
+        plan = _as_plan(exclude_from_unnesting)
+        tasks = ((seeds, size, plan) for seeds, size in self._shard_seeds(iterations, batch_size))
+
+        # worker processes are forked here, before the executor's thread exists
+        with self._shard_pool(workers) as pool:
+            # one thread keeps generation in this process, or collecting results, in order
+            executor = ThreadPoolExecutor(max_workers=1)
 
-        for item in range(iterations):
-            yield self._unnest(self.schema(), exclude=exclude_from_unnesting)
+            def submit(task: Tuple[Sequence[int], int, UnnestPlan]) -> Any:
+                if pool is None:
+                    return executor.submit(self._create_shard, *task)
+                return executor.submit(pool.apply_async(_create_shard, (task,)).get)
+
+            pending: collections.deque = collections.deque()
+            try:
+                pending.extend(submit(task) for _, task in zip(range(prefetch), tasks))
+                while pending:
+                    batch = await asyncio.wrap_future(pending.popleft())
+                    task = next(tasks, None)
+                    if task is not None:
+                        pending.append(submit(task))
+                    yield batch
+            finally:
+                # let a batch being generated finish, so the fields are free once iteration ends
+                running = [asyncio.wrap_future(future) for future in pending if not future.cancel()]
+                if running:
+                    await asyncio.wait(running)
+                executor.shutdown()
+
+    @contextlib.contextmanager
+    def profile(self, report: Optional[ProfileReport] = None) -> Iterator[ProfileReport]:
+        """
+        Time each provider method of the schema's fields within the context.
+
+        Parameters
+        ----------
+        report
+            ProfileReport to add to, a new one by default
+
+        Returns
+        -------
+        Context manager giving the ProfileReport, shared by all the schema's StatsFields
+
+        Notes
+        -----
+        create_columns records one call per column, producing iterations values.
+        Only generation in this process is recorded, not that of worker processes.
+        Where the schema uses fields' values within expressions, such as f-strings,
+        the fields are found by creating one record on entering the context.
+
+        Examples
+        --------
+        >>>with schema.profile() as report:
+        ...    schema.create(iterations=10000)
+        >>>print(report)
+        field                        calls     values   seconds  % time
+        person.full_name             10000      10000     0.912    81.4
+        discrete_distribution        10000      10000     0.208    18.6
+        """
+        report = report if report is not None else ProfileReport()
+        with contextlib.ExitStack() as stack:
+            for field in self._used_fields():
+                stack.enter_context(field.profile(report))
+            yield report
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from mimesis_stats.providers.base_stats import BaseStatsDataProvider
@@ -28,3 +29,59 @@ def test_base_stats_replace_multiple(values, proportions, null_values, return_va
     generator = BaseStatsDataProvider()
 
     assert generator._replace_multiple(values=values, proportions=proportions, replacements=null_values) == return_value
+
+
+@pytest.mark.parametrize(
+    "values, proportion, null_value, return_value",
+    [
+        (np.array([1, 2, 3]), 0, None, [1, 2, 3]),
+        (np.array([1, 2, 3]), 1, None, [None, None, None]),
+        (np.array(["A", "B"]), 1, "NULL", ["NULL", "NULL"]),
+        (np.array([1, 2]), 1, (0, 0), [(0, 0), (0, 0)]),
+        (np.array([1, 2, 3]), 1, (0, 0), [(0, 0), (0, 0), (0, 0)]),
+        (np.array([1, 2, 3]), 1, [], [[], [], []]),
+    ],
+)
+def test_base_stats_replace_batch(values, proportion, null_value, return_value):
+    """Test does not require seed setting for deterministic results"""
+
+    generator = BaseStatsDataProvider()
+
+    result = generator._replace_batch(values=values, proportion=proportion, replacement=null_value)
+
+    assert result.tolist() == return_value
+
+
+def test_base_stats_seeding(common_seed):
+    """Providers with a seed are reproducible and unaffected by other providers"""
+
+    generator = BaseStatsDataProvider(seed=common_seed)
+    first = generator.rng.random(size=3)
+
+    generator.reseed(common_seed)
+    BaseStatsDataProvider(seed=common_seed + 1)
+
+    assert generator.rng.random(size=3).tolist() == first.tolist()
+
+
+def test_base_stats_spawn(common_seed):
+
+    children = [child.random() for child in BaseStatsDataProvider(seed=common_seed).spawn(2)]
+    repeat_children = [child.random() for child in BaseStatsDataProvider(seed=common_seed).spawn(2)]
+
+    assert children[0] != children[1]
+    assert children == repeat_children
+
+
+def test_base_stats_sampler_cached():
+    """Samplers are found by the identity of the weights, or by their values"""
+
+    generator = BaseStatsDataProvider()
+    weights = [0.25, 0.75]
+
+    sampler = generator._get_sampler(weights)
+    generator._samplers.clear()
+
+    assert generator._get_sampler(weights) is sampler
+    assert generator._get_sampler([0.25, 0.75]) is not sampler
+    assert generator._get_sampler([0.25, 0.75]) is generator._get_sampler(list(weights))
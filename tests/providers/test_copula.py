@@ -0,0 +1,107 @@
+import sys
+
+import numpy as np
+import pytest
+from mimesis_stats.providers import copula
+from mimesis_stats.providers.copula import GaussianCopula
+from scipy.stats import expon
+from scipy.stats import norm
+from scipy.stats import spearmanr
+
+NAMES = ["age", "income"]
+CORRELATION = [[1, 0.7], [0.7, 1]]
+MARGINALS = [norm(40, 10).ppf, expon(scale=20000).ppf]
+
+
+def test_correlated_variables(common_seed):
+
+    provider = GaussianCopula(seed=common_seed)
+
+    samples = [provider.correlated_variables(NAMES, CORRELATION, MARGINALS) for _ in range(5000)]
+    ages = [sample["age"] for sample in samples]
+    incomes = [sample["income"] for sample in samples]
+
+    assert list(samples[0]) == NAMES
+    assert min(incomes) > 0
+    assert np.mean(ages) == pytest.approx(40, abs=0.5)
+    # rank correlation of a Gaussian copula is 6 / pi * arcsin(rho / 2)
+    assert spearmanr(ages, incomes)[0] == pytest.approx(6 / np.pi * np.arcsin(0.35), abs=0.03)
+
+
+def test_correlated_variables_batch(common_seed):
+
+    provider = GaussianCopula(seed=common_seed)
+
+    result = provider.correlated_variables_batch(NAMES, CORRELATION, MARGINALS, size=20000)
+
+    assert list(result) == NAMES
+    assert result["income"].shape == (20000,)
+    assert np.median(result["income"]) == pytest.approx(expon(scale=20000).median(), rel=0.05)
+    assert spearmanr(result["age"], result["income"])[0] == pytest.approx(6 / np.pi * np.arcsin(0.35), abs=0.02)
+
+
+def test_correlated_variables_batch_scalar_marginal(common_seed):
+
+    provider = GaussianCopula(seed=common_seed)
+
+    result = provider.correlated_variables_batch(
+        ["z", "band"], [[1, -0.99], [-0.99, 1]], [None, lambda u: "high" if u > 0.5 else "low"], size=1000
+    )
+
+    assert set(result["band"]) == {"high", "low"}
+    assert np.mean((result["z"] > 0) == (result["band"] == "low")) > 0.9
+
+
+def test_correlated_variables_batch_nulls(common_seed):
+
+    provider = GaussianCopula(seed=common_seed)
+
+    result = provider.correlated_variables_batch(
+        NAMES, CORRELATION, MARGINALS, size=100, null_props=[0, 1], null_values=[None, "Unknown"]
+    )
+
+    assert (result["income"] == "Unknown").all()
+    assert None not in result["age"]
+
+
+def test_normal_cdf_without_scipy(monkeypatch):
+
+    x = np.array([-3, 0, 1.5])
+    expected = norm.cdf(x)
+
+    copula._normal_cdf.cache_clear()
+    monkeypatch.setitem(sys.modules, "scipy.special", None)
+    try:
+        result = copula._normal_cdf()(x)
+    finally:
+        copula._normal_cdf.cache_clear()
+
+    assert result == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "correlation, message",
+    [
+        ([[1, 0.5]], "square"),
+        ([[1, 0.5], [0.4, 1]], "symmetric"),
+        ([[2, 0], [0, 1]], "unit diagonal"),
+        ([[1, 1.5], [1.5, 1]], "positive definite"),
+        ([[1, 0, 0], [0, 1, 0], [0, 0, 1]], "same size"),
+    ],
+)
+def test_correlated_variables_invalid(correlation, message):
+
+    provider = GaussianCopula()
+
+    with pytest.raises(ValueError, match=message):
+        provider.correlated_variables(NAMES, correlation, MARGINALS)
+
+
+def test_correlation_factorised_once():
+
+    provider = GaussianCopula()
+
+    provider.correlated_variables(NAMES, CORRELATION, MARGINALS)
+    provider.correlated_variables_batch(NAMES, CORRELATION, MARGINALS, size=3)
+
+    assert len(provider._compiled) == 1
@@ -1,6 +1,10 @@
+import numpy as np
 import pytest
 
+from mimesis_stats.categorical import CategoricalColumn
 from mimesis_stats.providers.distribution import Distribution
+from mimesis_stats.providers.distribution import EmpiricalDistribution
+from mimesis_stats.providers.distribution import EmpiricalTable
 
 
 @pytest.mark.parametrize(
@@ -39,3 +43,225 @@ def test_generic_distribution_fixed(population, return_value, return_max_functio
     generator = Distribution()
 
     assert generator.generic_distribution(func=return_max_function, population=population) == return_value
+
+
+@pytest.mark.parametrize(
+    "population, weights, null_prop, return_value",
+    [
+        (["A", "B"], [0, 1], 0, ["B", "B", "B"]),
+        ([1, 2, 3], [1, 0, 0], 0, [1, 1, 1]),
+        ([1, 2, 3], [1, 0, 0], 1, [None, None, None]),
+    ],
+)
+def test_discrete_distribution_batch_fixed(population, weights, null_prop, return_value):
+    """Test does not require seed setting for deterministic results"""
+
+    generator = Distribution()
+
+    result = generator.discrete_distribution_batch(population, weights, size=3, null_prop=null_prop)
+
+    assert result.tolist() == return_value
+
+
+@pytest.mark.parametrize(
+    "population, weights, return_value",
+    [
+        ([1, "1", 2.5], [1, 0, 0], [1, 1]),
+        ([(1, 2), (3, 4)], [0, 1], [(3, 4), (3, 4)]),
+    ],
+)
+def test_discrete_distribution_batch_mixed(population, weights, return_value):
+    """Mixed types are not coerced and tuples are kept as elements"""
+
+    generator = Distribution()
+
+    result = generator.discrete_distribution_batch(population, weights, size=2)
+
+    assert result.shape == (2,)
+    assert result.tolist() == return_value
+
+
+@pytest.mark.parametrize(
+    "func, kwargs, return_value",
+    [
+        (lambda: 1, {}, [1, 1, 1]),
+        (lambda size: np.full(size, 2), {}, [2, 2, 2]),
+        (lambda value, **kwargs: value, {"value": 3}, [3, 3, 3]),
+    ],
+)
+def test_generic_distribution_batch_fixed(func, kwargs, return_value):
+    """Test does not require seed setting for deterministic results"""
+
+    generator = Distribution()
+
+    assert generator.generic_distribution_batch(func, size=3, **kwargs).tolist() == return_value
+
+
+def test_generic_distribution_buffered(common_seed):
+    """Buffered values match batches up to buffer_size"""
+
+    buffered = Distribution(seed=common_seed)
+    batched = Distribution(seed=common_seed)
+
+    result = [buffered.generic_distribution("normal", loc=5, buffer_size=4) for _ in range(11)]
+    # buffer fills double from 1 up to buffer_size
+    expected_result = [
+        value for size in [1, 2, 4, 4] for value in batched.generic_distribution_batch("normal", size=size, loc=5)
+    ]
+
+    assert result == expected_result
+
+
+@pytest.mark.parametrize("null_value", [{}, set()])
+def test_generic_distribution_buffered_unhashable_null(null_value):
+    """Unhashable null values are frozen into the buffer key, or fall back to unbuffered calls"""
+
+    generator = Distribution()
+
+    result = generator.generic_distribution(lambda: 1, null_prop=1, null_value=null_value, buffer_size=4)
+
+    assert result == null_value
+
+
+def test_buffered_provider(common_seed):
+    """Provider wide buffering of scalar methods is reproducible"""
+
+    generator = Distribution(seed=common_seed)
+    generator.buffer_size = 16
+
+    population = ["A", "B", "C"]
+    result = [generator.discrete_distribution(population, [0.2, 0.3, 0.5]) for _ in range(50)]
+
+    generator.reseed(common_seed)
+
+    assert [generator.discrete_distribution(population, weights=[0.2, 0.3, 0.5]) for _ in range(50)] == result
+    assert set(result) == set(population)
+
+
+def test_discrete_distribution_batch_categorical(common_seed):
+
+    provider = Distribution(seed=common_seed)
+
+    result = provider.discrete_distribution_batch(
+        population=["A", "B", "A"], weights=[0.25, 0.5, 0.25], size=1000, null_prop=0.2, as_categorical=True
+    )
+
+    assert isinstance(result, CategoricalColumn)
+    assert result.categories == ["A", "B"]
+    assert set(result.tolist()) == set(["A", "B", None])
+    assert np.mean(result.codes == -1) == pytest.approx(0.2, abs=0.05)
+
+
+def test_empirical_table_categorical():
+
+    table = EmpiricalTable.fit(iter([np.array(["a", "b"]), np.array(["b", None, np.nan], dtype=object)]))
+
+    assert table.categorical
+    assert table.values == ["a", "b"]
+    assert table.counts.tolist() == [1, 2]
+    assert table.null_prop == pytest.approx(0.4)
+
+
+def test_empirical_table_numeric_distinct():
+    """Few distinct numeric values are held exactly, integers stay integers"""
+
+    table = EmpiricalTable.fit(np.array([3, 1, 1, 2, 3, 3]), chunk_size=4)
+
+    assert not table.categorical
+    assert table.values.tolist() == [1, 2, 3]
+    assert table.counts.tolist() == [2, 1, 3]
+    assert table.minimum is None
+    assert set(table.sample(np.random.default_rng(42), size=100).tolist()) == {1, 2, 3}
+
+
+def test_empirical_table_numeric_quantiles(common_seed):
+    """Many distinct values are compressed to quantiles, in any chunking"""
+
+    data = np.random.default_rng(common_seed).normal(size=20000)
+
+    table = EmpiricalTable.fit(data, resolution=200, chunk_size=3000)
+
+    assert len(table.values) == 200
+    assert (table.minimum, table.maximum) == (data.min(), data.max())
+    assert np.allclose(table.values[[10, 100, 190]], np.quantile(data, [0.0525, 0.5025, 0.9525]), atol=0.05)
+
+
+def test_empirical_table_update_leaves_table():
+
+    table = EmpiricalTable.fit(np.array([1.0, 2.0]))
+    updated = table.update(np.array([2.0, np.nan]))
+
+    assert table.counts.tolist() == [1, 1]
+    assert updated.counts.tolist() == [1, 2]
+    assert updated.nulls == 1
+
+
+def test_empirical_table_dataframe():
+    """Single column DataFrames, or chunks of them, are fitted as their column"""
+
+    pd = pytest.importorskip("pandas")
+    frame = pd.DataFrame({"fruit": ["a", "b", "b", None]})
+
+    table = EmpiricalTable.fit(frame)
+    chunked = EmpiricalTable.fit(iter([frame.iloc[:2], frame.iloc[2:]]))
+
+    assert table.values == chunked.values == ["a", "b"]
+    assert table.counts.tolist() == chunked.counts.tolist() == [1, 2]
+    assert table.nulls == chunked.nulls == 1
+    assert table._sampler is None
+
+
+def test_empirical_table_dataframe_columns():
+
+    pd = pytest.importorskip("pandas")
+
+    with pytest.raises(TypeError):
+        EmpiricalTable.fit(pd.DataFrame({"x": [1, 2], "y": [3, 4]}))
+
+
+@pytest.mark.parametrize("data", [np.array([]), iter([])])
+def test_empirical_table_empty(data):
+
+    with pytest.raises(ValueError):
+        EmpiricalTable.fit(data).sample(np.random.default_rng(), size=1)
+
+
+def test_empirical_distribution_batch(common_seed):
+    """Samples follow the fitted distribution and its null proportion"""
+
+    data = np.random.default_rng(common_seed).lognormal(size=50000)
+    data[::10] = np.nan
+
+    provider = EmpiricalDistribution(seed=common_seed)
+    table = provider.fit(data)
+
+    result = provider.empirical_distribution_batch(table, size=50000)
+    values = result[result != None].astype(float)  # noqa: E711
+
+    assert np.mean(result == None) == pytest.approx(0.1, abs=0.01)  # noqa: E711
+    assert np.allclose(np.quantile(values, [0.1, 0.5, 0.9]), np.nanquantile(data, [0.1, 0.5, 0.9]), rtol=0.05)
+    assert values.min() >= np.nanmin(data)
+    assert values.max() <= np.nanmax(data)
+
+
+def test_empirical_distribution_reproducible(common_seed):
+
+    table = EmpiricalTable.fit(np.array(["a", "b", "b", "c"]))
+
+    providers = [EmpiricalDistribution(seed=common_seed) for _ in range(2)]
+    results = [[provider.empirical_distribution(table, null_prop=0) for _ in range(20)] for provider in providers]
+
+    assert results[0] == results[1]
+    assert set(results[0]) == {"a", "b", "c"}
+
+
+def test_empirical_distribution_batch_categorical(common_seed):
+
+    provider = EmpiricalDistribution(seed=common_seed)
+    table = provider.fit(np.array(["a", "b", "b", None], dtype=object))
+
+    result = provider.empirical_distribution_batch(table, size=100, as_categorical=True)
+
+    assert isinstance(result, CategoricalColumn)
+    assert result.categories == ["a", "b"]
+    assert set(result.tolist()) == {"a", "b", None}
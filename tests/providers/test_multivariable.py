@@ -1,3 +1,6 @@
+import numpy as np
+import pytest
+from mimesis_stats.categorical import CategoricalColumn
 from mimesis_stats.providers.multivariable import MultiVariable
 
 
@@ -18,3 +21,73 @@ def test_dependent_variables():
     result = provider.dependent_variables(names, combinations, weights=list(reversed(weights)))
 
     assert result == expected_result
+
+
+def test_dependent_variables_lazy_options():
+
+    def not_selected():
+        raise AssertionError("Option should not be evaluated")
+
+    provider = MultiVariable()
+
+    result = provider.dependent_variables(
+        ["response", "count"], options=[("Yes", lambda: 123), ("No", not_selected)], weights=[1, 0]
+    )
+
+    assert result == {"response": "Yes", "count": 123}
+
+
+@pytest.mark.parametrize(
+    "options, weights, null_props, expected_result",
+    [
+        ([("Yes", 123), ("No", None)], [0, 1], 0, {"response": ["No"] * 3, "count": [None] * 3}),
+        ([("Yes", lambda: 123), ("No", None)], [1, 0], 0, {"response": ["Yes"] * 3, "count": [123] * 3}),
+        (
+            [("Yes", lambda size: np.full(size, 123)), ("No", None)],
+            [1, 0],
+            [1, 0],
+            {"response": [None] * 3, "count": [123] * 3},
+        ),
+    ],
+)
+def test_dependent_variables_batch(options, weights, null_props, expected_result):
+
+    provider = MultiVariable()
+
+    result = provider.dependent_variables_batch(
+        ["response", "count"], options=options, weights=weights, size=3, null_props=null_props
+    )
+
+    assert {k: v.tolist() for k, v in result.items()} == expected_result
+
+
+def test_dependent_variables_batch_groups(common_seed):
+
+    provider = MultiVariable(seed=common_seed)
+
+    result = provider.dependent_variables_batch(
+        ["response", "count"],
+        options=[("Yes", lambda size: np.full(size, 1)), ("No", lambda size: np.full(size, 0))],
+        weights=[0.5, 0.5],
+        size=1000,
+    )
+
+    assert set(result["response"]) == set(["Yes", "No"])
+    assert ((result["response"] == "Yes") == (result["count"] == 1)).all()
+
+
+def test_dependent_variables_batch_categorical():
+
+    provider = MultiVariable()
+
+    result = provider.dependent_variables_batch(
+        ["response", "count"],
+        options=[("Yes", lambda: 1), ("No", lambda: 0)],
+        weights=[1, 0],
+        size=3,
+        as_categorical=True,
+    )
+
+    assert isinstance(result["response"], CategoricalColumn)
+    assert result["response"].tolist() == ["Yes"] * 3
+    assert result["count"].tolist() == [1] * 3
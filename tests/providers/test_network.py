@@ -0,0 +1,144 @@
+import numpy as np
+import pytest
+from mimesis_stats.categorical import CategoricalColumn
+from mimesis_stats.providers.network import BayesianNetwork
+
+NETWORK = {
+    "income": {
+        "parents": ["employed", "region"],
+        "population": ["low", "high"],
+        "weights": {
+            (True, "north"): [0.5, 0.5],
+            (True, "south"): [0, 1],
+            (False, "north"): [1, 0],
+            (False, "south"): [1, 0],
+        },
+    },
+    "employed": {"population": [True, False], "weights": [0.6, 0.4]},
+    "region": {"population": ["north", "south"], "weights": [0.5, 0.5]},
+    "tax": {"parents": ["income"], "population": ["basic", "higher"], "weights": {"low": [1, 0], "high": [0, 1]}},
+}
+
+
+def test_network_variables(common_seed):
+
+    provider = BayesianNetwork(seed=common_seed)
+
+    for _ in range(100):
+        result = provider.network_variables(NETWORK)
+
+        assert list(result) == list(NETWORK)
+        if not result["employed"]:
+            assert result["income"] == "low"
+        if result["employed"] and result["region"] == "south":
+            assert result["income"] == "high"
+        assert result["tax"] == {"low": "basic", "high": "higher"}[result["income"]]
+
+
+def test_network_variables_nulls():
+
+    provider = BayesianNetwork()
+
+    result = provider.network_variables(NETWORK, null_props={"tax": 1}, null_values={"tax": "Unknown"})
+
+    assert result["tax"] == "Unknown"
+    assert result["income"] is not None
+
+
+def test_network_variables_batch(common_seed):
+
+    provider = BayesianNetwork(seed=common_seed)
+
+    result = provider.network_variables_batch(NETWORK, size=10000, null_props={"region": 0.5})
+
+    assert list(result) == list(NETWORK)
+    assert all(len(values) == 10000 for values in result.values())
+    assert (result["income"][~result["employed"].astype(bool)] == "low").all()
+    assert ((result["tax"] == "higher") == (result["income"] == "high")).all()
+    assert np.mean(result["employed"] == True) == pytest.approx(0.6, abs=0.02)  # noqa: E712
+    assert np.mean(result["region"] == None) == pytest.approx(0.5, abs=0.02)  # noqa: E711
+
+
+def test_network_variables_batch_mixed_population():
+    """Mixed types are not coerced and tuples are kept as elements"""
+
+    network = {
+        "answer": {"population": [1, "no"], "weights": [1, 0]},
+        "point": {"parents": ["answer"], "population": [(0, 0), (1, 1)], "weights": {1: [0, 1], "no": [1, 0]}},
+    }
+
+    result = BayesianNetwork().network_variables_batch(network, size=2)
+
+    assert result["answer"].tolist() == [1, 1]
+    assert result["point"].tolist() == [(1, 1), (1, 1)]
+
+
+def test_network_variables_batch_matches_scalar_distribution(common_seed):
+
+    provider = BayesianNetwork(seed=common_seed)
+
+    batch = provider.network_variables_batch(NETWORK, size=20000)
+    scalar = [provider.network_variables(NETWORK)["income"] for _ in range(20000)]
+
+    # P(high) = 0.6 * (0.5 * 0.5 + 0.5 * 1)
+    assert np.mean(batch["income"] == "high") == pytest.approx(0.45, abs=0.02)
+    assert np.mean(np.array(scalar) == "high") == pytest.approx(0.45, abs=0.02)
+
+
+@pytest.mark.parametrize(
+    "network, message",
+    [
+        (
+            {
+                "a": {"parents": ["b"], "population": [1], "weights": {1: [1]}},
+                "b": {"parents": ["a"], "population": [1], "weights": {1: [1]}},
+            },
+            "cycle",
+        ),
+        ({"a": {"parents": ["b"], "population": [1], "weights": {1: [1]}}}, "not in the network"),
+        ({"a": {"population": [1, 2], "weights": [1]}}, "same size"),
+    ],
+)
+def test_network_variables_invalid(network, message):
+
+    provider = BayesianNetwork()
+
+    with pytest.raises(ValueError, match=message):
+        provider.network_variables(network)
+
+
+def test_network_variables_missing_parent_values():
+
+    network = {
+        "a": {"population": [1, 2], "weights": [0, 1]},
+        "b": {"parents": ["a"], "population": [1], "weights": {1: [1]}},
+    }
+    provider = BayesianNetwork()
+
+    with pytest.raises(KeyError, match="no weights"):
+        provider.network_variables(network)
+    with pytest.raises(KeyError, match="no weights"):
+        provider.network_variables_batch(network, size=5)
+
+
+def test_network_compiled_once():
+
+    provider = BayesianNetwork()
+
+    provider.network_variables(NETWORK)
+    compiled = provider._compile(NETWORK, lambda network: None)
+    provider.network_variables_batch(NETWORK, size=5)
+
+    assert len(provider._compiled) == 2
+    assert compiled is None
+
+
+def test_network_variables_batch_categorical(common_seed):
+
+    provider = BayesianNetwork(seed=common_seed)
+
+    result = provider.network_variables_batch(NETWORK, size=100, null_props={"tax": 1}, as_categorical=True)
+
+    assert all(isinstance(column, CategoricalColumn) for column in result.values())
+    assert result["income"].categories == ["low", "high"]
+    assert (result["tax"].codes == -1).all()
@@ -97,3 +97,222 @@ def test_generate_time(start, end, output_format, output_type, distribution, ret
         )
         == return_value
     )
+
+
+@pytest.mark.parametrize(
+    "output_format, output_type, distribution, return_value",
+    [
+        (None, datetime.datetime, lambda size: np.zeros(size), datetime.datetime(1985, 10, 20)),
+        (None, datetime.datetime, lambda: 0.5, datetime.datetime(1985, 10, 21)),
+        ("%Y-%m-%d", str, lambda size: np.ones(size), "1985-10-22"),
+        ("%d/%m/%Y", str, lambda size: np.ones(size), "22/10/1985"),
+        (None, datetime.date, lambda size: np.full(size, 0.75), datetime.date(1985, 10, 21)),
+        (None, datetime.time, lambda size: np.full(size, 0.75), datetime.time(12)),
+    ],
+)
+def test_generate_time_batch(output_format, output_type, distribution, return_value):
+    """Test vectorised sampling and output formatting"""
+
+    generator = TimeDistribution()
+
+    result = generator.generate_time_batch(
+        datetime.datetime(1985, 10, 20),
+        datetime.datetime(1985, 10, 22),
+        size=3,
+        output_format=output_format,
+        output_type=output_type,
+        distribution=distribution,
+    )
+
+    assert result.tolist() == [return_value] * 3
+
+
+def test_generate_time_batch_nulls():
+
+    generator = TimeDistribution()
+
+    result = generator.generate_time_batch(
+        "20/10/1985", "22/10/1985", size=3, input_format="%d/%m/%Y", null_prop=1, null_value="NULL"
+    )
+
+    assert result.tolist() == ["NULL"] * 3
+
+
+@pytest.mark.parametrize("size, chunk_size, chunk_sizes", [(25, 10, [10, 10, 5]), (3, 10, [3]), (0, 10, [])])
+def test_time_sequence_size(common_seed, size, chunk_size, chunk_sizes):
+    """Test fixed size sequences are sorted, in range and chunked"""
+
+    generator = TimeDistribution(seed=common_seed)
+
+    chunks = list(
+        generator.time_sequence(
+            datetime.datetime(1985, 10, 20), datetime.datetime(1985, 10, 22), size=size, chunk_size=chunk_size
+        )
+    )
+    times = [time for chunk in chunks for time in chunk]
+
+    assert [len(chunk) for chunk in chunks] == chunk_sizes
+    assert times == sorted(times)
+    assert all(datetime.datetime(1985, 10, 20) <= time <= datetime.datetime(1985, 10, 22) for time in times)
+
+
+def test_time_sequence_size_uniform(common_seed):
+    """Test fixed size sequences are the sorted values of uniform draws"""
+
+    generator = TimeDistribution(seed=common_seed)
+
+    chunks = generator.time_sequence("20/10/1985", "24/10/1985", size=20000, chunk_size=999, input_format="%d/%m/%Y")
+    days = np.concatenate(list(chunks)).astype("datetime64[D]")
+
+    assert np.all(days[1:] >= days[:-1])
+    assert np.allclose(np.unique(days, return_counts=True)[1], 5000, rtol=0.05)
+
+
+def test_time_sequence_rate(common_seed):
+    """Test Poisson sequences have the expected number of times, reduced by seasonality"""
+
+    generator = TimeDistribution(seed=common_seed)
+
+    times = np.concatenate(
+        list(
+            generator.time_sequence(
+                datetime.datetime(1985, 10, 20),
+                datetime.datetime(1985, 10, 30),
+                rate=1000,
+                seasonality=lambda proportion: (proportion < 0.5).astype(float),
+                chunk_size=1000,
+                output_type=str,
+                output_format="%Y-%m-%d",
+            )
+        )
+    )
+
+    assert abs(len(times) - 5000) < 300
+    assert np.all(times[1:] >= times[:-1])
+    assert times[-1] < "1985-10-25"
+
+
+def test_time_sequence_reproducible(common_seed):
+
+    sequences = [
+        np.concatenate(
+            list(
+                TimeDistribution(seed=common_seed).time_sequence(
+                    datetime.datetime(1985, 10, 20), datetime.datetime(1985, 10, 22), rate=100, chunk_size=7
+                )
+            )
+        )
+        for _ in range(2)
+    ]
+
+    assert sequences[0].tolist() == sequences[1].tolist()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"size": 10, "rate": 1},
+        {"size": 10, "seasonality": lambda proportion: proportion},
+        {"size": 10, "chunk_size": 0},
+        {"rate": -1},
+        {"size": 10, "start": datetime.datetime(1985, 10, 23)},
+    ],
+)
+def test_time_sequence_invalid(kwargs):
+    """Test invalid arguments raise when called, before iteration"""
+
+    generator = TimeDistribution()
+
+    arguments = {"start": datetime.datetime(1985, 10, 20), "end": datetime.datetime(1985, 10, 22), **kwargs}
+
+    with pytest.raises(ValueError):
+        generator.time_sequence(**arguments)
+
+
+@pytest.mark.parametrize("granularity", ["Y", "M", "D", "h", "m", "s"])
+@pytest.mark.parametrize("output_type, output_format", [(str, "%d/%m/%Y %H:%M:%S"), (datetime.datetime, None)])
+def test_generate_time_granularity(common_seed, granularity, output_type, output_format):
+    """Test granular times match truncating the times of the default sampling"""
+
+    start, end = datetime.datetime(1969, 6, 1), datetime.datetime(1970, 6, 1)
+    units = {
+        "Y": "%Y",
+        "M": "%Y-%m",
+        "D": "%Y-%m-%d",
+        "h": "%Y-%m-%d %H",
+        "m": "%Y-%m-%d %H:%M",
+        "s": "%Y-%m-%d %H:%M:%S",
+    }
+
+    def truncate(time):
+        time = datetime.datetime.strptime(time.strftime(units[granularity]), units[granularity])
+        return time.strftime(output_format) if output_type == str else time
+
+    generator = TimeDistribution(seed=common_seed)
+    expected = [truncate(generator.generate_time(start, end)) for _ in range(20)]
+    expected_batch = [truncate(time) for time in generator.generate_time_batch(start, end, size=20)]
+
+    generator = TimeDistribution(seed=common_seed)
+    kwargs = {"output_type": output_type, "output_format": output_format, "granularity": granularity}
+    result = [generator.generate_time(start, end, **kwargs) for _ in range(20)]
+    result_batch = generator.generate_time_batch(start, end, size=20, **kwargs)
+
+    assert result == expected
+    assert result_batch.tolist() == expected_batch
+
+
+def test_generate_time_granularity_varying_range(common_seed):
+    """Test ranges changing every call, over many units, convert only the units sampled"""
+
+    generator = TimeDistribution(seed=common_seed)
+    start = datetime.datetime(1985, 10, 20, 12)
+
+    result = [
+        generator.generate_time(
+            start + datetime.timedelta(seconds=i),
+            datetime.datetime(2085, 10, 30),
+            granularity="m",
+            output_type=str,
+            output_format="%d/%m/%Y %H:%M",
+        )
+        for i in range(50)
+    ]
+    batch = generator.generate_time_batch(start, datetime.datetime(2085, 10, 30), size=5, granularity="D")
+
+    assert all(
+        start <= datetime.datetime.strptime(value, "%d/%m/%Y %H:%M") < datetime.datetime(2085, 10, 30)
+        for value in result
+    )
+    assert all(value == datetime.datetime(value.year, value.month, value.day) for value in batch.tolist())
+
+
+def test_generate_time_batch_granularity_categorical(common_seed):
+
+    generator = TimeDistribution(seed=common_seed)
+
+    result = generator.generate_time_batch(
+        datetime.datetime(1985, 10, 20),
+        datetime.datetime(1985, 10, 22, 23),
+        size=50,
+        output_type=datetime.date,
+        granularity="D",
+        as_categorical=True,
+        null_prop=0.5,
+    )
+
+    assert result.categories == [datetime.date(1985, 10, day) for day in (20, 21, 22)]
+    assert set(result.tolist()) == {
+        None,
+        datetime.date(1985, 10, 20),
+        datetime.date(1985, 10, 21),
+        datetime.date(1985, 10, 22),
+    }
+
+
+def test_generate_time_granularity_invalid():
+
+    generator = TimeDistribution()
+
+    with pytest.raises(ValueError):
+        generator.generate_time(datetime.datetime(1985, 10, 20), datetime.datetime(1985, 10, 22), granularity="W")
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+from mimesis_stats.categorical import CategoricalColumn
+
+
+def test_from_population():
+
+    column = CategoricalColumn.from_population(np.array([0, 1, 2, 3, 0]), ["Yes", "No", "Yes", None])
+
+    assert column.categories == ["Yes", "No"]
+    assert column.codes.tolist() == [0, 1, 0, -1, 0]
+    assert column.codes.dtype == np.int8
+    assert column.tolist() == ["Yes", "No", "Yes", None, "Yes"]
+    assert len(column) == 5
+    assert column[1] == "No"
+    assert column[3] is None
+    assert column[1:3].tolist() == ["No", "Yes"]
+
+
+@pytest.mark.parametrize(
+    "population, expected_result",
+    [
+        ([[1, 2], [3, 4], [1, 2]], [[1, 2], [3, 4], [1, 2], [1, 2]]),
+        ([1, True, None], [1, True, None, 1]),
+    ],
+)
+def test_from_population_positional(population, expected_result):
+    """Unhashable values, and equal values of different types, are not merged"""
+
+    column = CategoricalColumn.from_population(np.array([0, 1, 2, 0]), population)
+    joined = CategoricalColumn.concatenate([column, CategoricalColumn([0], [1.0])])
+
+    assert column.categories == population
+    assert column.tolist() == expected_result
+    assert joined.tolist() == expected_result + [1.0]
+    assert [type(value) for value in joined.tolist()] == [type(value) for value in expected_result + [1.0]]
+
+
+@pytest.mark.parametrize(
+    "value, expected_result, expected_categories",
+    [
+        (None, [None, "No", None], ["Yes", "No"]),
+        ("No", ["No", "No", "No"], ["Yes", "No"]),
+        ("Unknown", ["Unknown", "No", "Unknown"], ["Yes", "No", "Unknown"]),
+    ],
+)
+def test_replace(value, expected_result, expected_categories):
+
+    column = CategoricalColumn([0, 1, 0], ["Yes", "No"])
+
+    result = column.replace(np.array([True, False, True]), value)
+
+    assert result.tolist() == expected_result
+    assert result.categories == expected_categories
+    assert column.tolist() == ["Yes", "No", "Yes"]
+
+
+def test_code_dtype():
+
+    assert CategoricalColumn([0, 299], range(300)).codes.dtype == np.int16
+
+
+def test_to_pandas():
+
+    pd = pytest.importorskip("pandas")
+    result = CategoricalColumn([1, -1, 0], ["Yes", "No"]).to_pandas()
+
+    assert isinstance(result, pd.Categorical)
+    assert list(result.categories) == ["Yes", "No"]
+    assert result.codes.tolist() == [1, -1, 0]
+
+
+def test_to_arrow():
+
+    pa = pytest.importorskip("pyarrow")
+    result = CategoricalColumn([1, -1, 0], ["Yes", "No"]).to_arrow()
+
+    assert isinstance(result, pa.DictionaryArray)
+    assert result.to_pylist() == ["No", None, "Yes"]
+
+
+def test_concatenate():
+
+    result = CategoricalColumn.concatenate(
+        [CategoricalColumn([1, -1, 0], ["Yes", "No"]), CategoricalColumn([0, 1], ["Maybe", "Yes"])]
+    )
+
+    assert result.categories == ["Yes", "No", "Maybe"]
+    assert result.tolist() == ["No", None, "Yes", "Maybe", "Yes"]
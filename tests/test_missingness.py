@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from mimesis_stats.missingness import Missingness
+
+
+@pytest.mark.parametrize(
+    "null_props, null_values, row_prop, expected_result",
+    [
+        ({}, None, 0, {"a": [1, 2], "b": ["x", "y"]}),
+        ({"a": 1}, None, 0, {"a": [None, None], "b": ["x", "y"]}),
+        ({"a": 1, "b": 1}, {"b": "NULL"}, 0, {"a": [None, None], "b": ["NULL", "NULL"]}),
+        ({"a": 1, "b": 1}, {"a": (0, 0), "b": (0, 0)}, 0, {"a": [(0, 0), (0, 0)], "b": [(0, 0), (0, 0)]}),
+        ({}, None, 1, {"a": [None, None], "b": [None, None]}),
+    ],
+)
+def test_missingness_apply_fixed(null_props, null_values, row_prop, expected_result):
+    """Test does not require seed setting for deterministic results"""
+
+    missingness = Missingness(null_props, null_values, row_prop=row_prop)
+
+    result = missingness.apply({"a": np.array([1, 2]), "b": ["x", "y"]})
+
+    assert {k: list(v) for k, v in result.items()} == expected_result
+
+
+@pytest.mark.parametrize("correlation", [0, 0.5, 1])
+def test_missingness_proportions(correlation, common_seed):
+
+    masks = Missingness({"a": 0.2, "b": 0.4}, correlation=correlation, seed=common_seed).masks(100000)
+
+    np.testing.assert_allclose([masks["a"].mean(), masks["b"].mean()], [0.2, 0.4], atol=0.01)
+    # both cells share the row draw with probability correlation ** 2, rising from independent 0.08 to nested 0.2
+    np.testing.assert_allclose((masks["a"] & masks["b"]).mean(), 0.08 + correlation ** 2 * 0.12, atol=0.01)
+
+
+def test_missingness_invalid():
+
+    with pytest.raises(ValueError):
+        Missingness({"a": 1.5})
+
+    with pytest.raises(KeyError):
+        Missingness({"a": 0.5}).apply({"b": [1]})
@@ -0,0 +1,31 @@
+import pytest
+from mimesis_stats.profiling import FieldProfile
+from mimesis_stats.profiling import ProfileReport
+
+
+def test_profile_report():
+
+    report = ProfileReport()
+    report.record("fast", 0.25)
+    report.record("slow", 1.0, values=100)
+    report.record("fast", 0.25)
+
+    assert report.fields() == [FieldProfile("slow", 1, 100, 1.0), FieldProfile("fast", 2, 2, 0.5)]
+    assert report["fast"] == FieldProfile("fast", 2, 2, 0.5)
+    assert report["slow"].seconds_per_value == pytest.approx(0.01)
+    assert report.seconds == pytest.approx(1.5)
+    assert "fast" in report
+    assert report.to_dict()["slow"] == {"name": "slow", "calls": 1, "values": 100, "seconds": 1.0}
+
+
+def test_profile_report_str():
+
+    report = ProfileReport()
+    report.record("discrete_distribution", 0.75)
+    report.record("person.full_name", 0.25)
+
+    lines = str(report).splitlines()
+
+    assert lines[0].split() == ["field", "calls", "values", "seconds", "%", "time"]
+    assert lines[1].split() == ["discrete_distribution", "1", "1", "0.750", "75.0"]
+    assert lines[2].split() == ["person.full_name", "1", "1", "0.250", "25.0"]
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+from mimesis_stats.sampling import AliasSampler
+
+
+@pytest.mark.parametrize(
+    "weights, return_value",
+    [
+        ([0, 1], 1),
+        ([1, 0, 0], 0),
+        ([0, 0, 1, 0], 2),
+    ],
+)
+def test_alias_sampler_fixed(weights, return_value):
+    """Test does not require seed setting for deterministic results"""
+
+    sampler = AliasSampler(weights)
+    rng = np.random.default_rng()
+
+    assert sampler.sample(rng) == return_value
+    assert set(sampler.sample(rng, size=100)) == set([return_value])
+
+
+def test_alias_sampler_proportions(common_seed):
+
+    rng = np.random.default_rng(common_seed)
+    weights = [0.1, 0.2, 0.3, 0.4]
+
+    counts = np.bincount(AliasSampler(weights).sample(rng, size=100000), minlength=len(weights))
+
+    np.testing.assert_allclose(counts / counts.sum(), weights, atol=0.01)
+
+
+@pytest.mark.parametrize("weights", [[], [0.5, 0.6], [-0.5, 1.5], [[0.5, 0.5]]])
+def test_alias_sampler_invalid_weights(weights):
+
+    with pytest.raises(ValueError):
+        AliasSampler(weights)
@@ -1,5 +1,22 @@
+import asyncio
+import importlib
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
 import pytest
+from mimesis.providers.base import BaseProvider
+from mimesis_stats import stats_schema
+from mimesis_stats.categorical import CategoricalColumn
+from mimesis_stats.missingness import Missingness
+from mimesis_stats.stats_schema import FieldSpec
+from mimesis_stats.stats_schema import StatsField
 from mimesis_stats.stats_schema import StatsSchema
+from mimesis_stats.stats_schema import UnnestPlan
+from mimesis_stats.stats_schema import _DEFAULT_PROVIDERS
+from mimesis_stats.stats_schema import _UnnestLayout
 
 
 @pytest.mark.parametrize(
@@ -88,3 +105,496 @@ def test_nested_generation_deterministic(dummy_field):
     values = [variable["nest"] for variable in result]
 
     assert set(values) == set(["A", "B", "hard"])
+
+
+@pytest.mark.parametrize(
+    "inputs, iterations, expected_result",
+    [
+        ({"v1": {"name": "dummy_number", "provider_method": "dummy.one"}}, 2, {"dummy_number": [1, 1]}),
+        ({"v1": {"name": "dummy_dict", "provider_method": "dummy.dictionary"}}, 2, {"collins": ["defines", "defines"]}),
+        (
+            {
+                "v1": {"name": "dummy_number", "provider_method": "dummy.one"},
+                "v2": {"name": "dummy_string", "provider_method": "dummy.characters"},
+            },
+            1,
+            {"dummy_number": [1], "dummy_string": ["ABC"]},
+        ),
+    ],
+)
+def test_stats_schema_create_columns(dummy_field, inputs, iterations, expected_result):
+
+    schema = lambda: {  # noqa: E731
+        variable["name"]: dummy_field(variable["provider_method"]) for variable in inputs.values()
+    }
+    s_schema = StatsSchema(schema=schema)
+
+    result = s_schema.create_columns(iterations=iterations)
+
+    assert {k: list(v) for k, v in result.items()} == expected_result
+
+
+def test_create_columns_uses_batch_method(dummy_field):
+
+    s_schema = StatsSchema(schema=lambda: {"dummy_number": dummy_field("dummy.one")})
+
+    result = s_schema.create_columns(iterations=3)
+
+    assert isinstance(result["dummy_number"], np.ndarray)
+    assert result["dummy_number"].tolist() == [1, 1, 1]
+
+
+def test_create_columns_nested_and_constant(dummy_field):
+
+    schema = lambda: {  # noqa: E731
+        "nest": dummy_field("choice", items=["hard", dummy_field("dummy.characters")]),
+        "constant": "fixed",
+    }
+    s_schema = StatsSchema(schema=schema)
+
+    result = s_schema.create_columns(iterations=1000)
+
+    assert set(result["nest"]) == set(["ABC", "hard"])
+    assert result["constant"] == ["fixed"] * 1000
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_create_columns_field_in_expression(dummy_field, workers):
+    """Fields used within expressions cannot be deferred, so records are created row by row"""
+
+    schema = lambda: {  # noqa: E731
+        "id": f"ID-{dummy_field('dummy.one')}",
+        "plus_one": dummy_field("dummy.one") + 1,
+        "dummy_number": dummy_field("dummy.one"),
+    }
+    s_schema = StatsSchema(schema=schema)
+
+    result = s_schema.create_columns(iterations=3, workers=workers, shard_size=2)
+
+    assert {name: list(column) for name, column in result.items()} == {
+        "id": ["ID-1"] * 3,
+        "plus_one": [2] * 3,
+        "dummy_number": [1] * 3,
+    }
+
+
+def test_create_columns_exclude(dummy_field):
+
+    s_schema = StatsSchema(schema=lambda: {"dummy_dict": dummy_field("dummy.dictionary")})
+
+    result = s_schema.create_columns(iterations=2, exclude_from_unnesting=["dummy_dict"])
+
+    assert result == {"dummy_dict": [{"collins": "defines"}, {"collins": "defines"}]}
+
+
+def test_create_workers_reproducible(common_seed):
+
+    field = StatsField(seed=common_seed)
+    schema = lambda: {  # noqa: E731
+        "name": field("person.full_name"),
+        "choice": field("discrete_distribution", population=["A", "B", "C"], weights=[0.2, 0.3, 0.5]),
+    }
+    s_schema = StatsSchema(schema=schema)
+
+    single = s_schema.create(iterations=250, workers=1, shard_size=100)
+    multiple = s_schema.create(iterations=250, workers=3, shard_size=100)
+
+    assert len(single) == 250
+    assert single == multiple
+    assert [len(chunk) for chunk in s_schema.chunk_iterator(iterations=250, shard_size=100)] == [100, 100, 50]
+
+
+def test_workers_reseed_fields_in_expressions(common_seed):
+    """Fields used only within expressions are found and reseeded for each shard"""
+
+    field = StatsField(seed=common_seed)
+    schema = lambda: {  # noqa: E731
+        "text": f"{field('generic_distribution', func='integers', low=0, high=10 ** 9)}",
+        "number": field("generic_distribution", func="integers", low=0, high=10 ** 9) + 1,
+    }
+    s_schema = StatsSchema(schema=schema)
+
+    chunks = list(s_schema.chunk_iterator(iterations=6, shard_size=2, workers=3))
+    records = [record for chunk in chunks for record in chunk]
+
+    assert len(set(record["text"] for record in records)) == 6
+    assert len(set(record["number"] for record in records)) == 6
+    assert s_schema.create(iterations=6, workers=1, shard_size=2) == records
+
+
+def test_chunk_iterator_releases_worker_schema(dummy_field):
+
+    s_schema = StatsSchema(schema=lambda: {"dummy_number": dummy_field("dummy.one")})
+
+    assert len(list(s_schema.chunk_iterator(iterations=4, shard_size=2, workers=2))) == 2
+    assert stats_schema._worker_schema is None
+
+
+def test_chunk_iterator_bounded_read_ahead(dummy_field):
+    """Workers generate at most 2 * workers shards ahead of a slow consumer"""
+
+    import multiprocessing
+
+    calls = multiprocessing.Value("i", 0)
+
+    def count():
+        with calls.get_lock():
+            calls.value += 1
+
+    s_schema = StatsSchema(schema=lambda: {"dummy_number": dummy_field("dummy.one"), "count": count()})
+
+    chunks = s_schema.chunk_iterator(iterations=200, shard_size=10, workers=2)
+    next(chunks)
+    time.sleep(0.5)
+    chunks.close()
+
+    # one record finds the fields, then at most four shards of ten
+    assert calls.value <= 41
+
+
+def test_create_columns_workers_reproducible(common_seed):
+
+    field = StatsField(seed=common_seed)
+    schema = lambda: {  # noqa: E731
+        "name": field("person.full_name"),
+        "number": field("generic_distribution", func="normal"),
+        "choice": field("discrete_distribution", population=["A", "B", "C"], weights=[0.2, 0.3, 0.5]),
+        # nulls in only some shards make those shards object arrays
+        "maybe": field("generic_distribution", func="integers", low=0, high=5, null_prop=0.005),
+        "answers": field(
+            "dependent_variables",
+            variable_names=["consent", "count"],
+            options=[("Yes", 1), ("No", 0)],
+            weights=[0.5, 0.5],
+        ),
+    }
+    s_schema = StatsSchema(schema=schema)
+
+    single = s_schema.create_columns(iterations=250, categorical=True, workers=1, shard_size=100)
+    multiple = s_schema.create_columns(iterations=250, categorical=True, workers=3, shard_size=100)
+
+    assert list(single) == ["name", "number", "choice", "maybe", "consent", "count"]
+    assert isinstance(multiple["number"], np.ndarray)
+    assert isinstance(multiple["choice"], CategoricalColumn)
+    assert multiple["maybe"].dtype == object
+    assert all(len(column) == 250 for column in multiple.values())
+    assert {name: list(column) for name, column in single.items()} == {
+        name: list(column) for name, column in multiple.items()
+    }
+
+
+def test_create_columns_workers_merges_categories(common_seed):
+    """Shards adding a null value as a category are merged"""
+
+    field = StatsField(seed=common_seed)
+    schema = lambda: {  # noqa: E731
+        "choice": field(
+            "discrete_distribution", population=["A", "B"], weights=[0.5, 0.5], null_prop=0.01, null_value="N"
+        )
+    }
+    s_schema = StatsSchema(schema=schema)
+
+    result = s_schema.create_columns(iterations=300, categorical=True, workers=2, shard_size=20)
+
+    assert result["choice"].categories == ["A", "B", "N"]
+    assert set(result["choice"].tolist()) == {"A", "B", "N"}
+
+
+def test_to_parquet(dummy_field, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    schema = lambda: {  # noqa: E731
+        "dummy_number": dummy_field("dummy.one"),
+        "dummy_dict": dummy_field("dummy.dictionary"),
+    }
+    s_schema = StatsSchema(schema=schema)
+    path = tmp_path / "schema.parquet"
+
+    s_schema.to_parquet(str(path), iterations=25, batch_size=10)
+
+    result = pq.ParquetFile(str(path))
+
+    assert result.metadata.num_row_groups == 3
+    assert result.read().to_pydict() == {"dummy_number": [1] * 25, "collins": ["defines"] * 25}
+
+
+def test_from_specs(dummy_field):
+
+    specs = {
+        "dummy_number": FieldSpec("dummy.one", key=lambda x: x + 1),
+        "dummy_dict": FieldSpec("dummy.dictionary"),
+        "nest": FieldSpec("choice", items=[FieldSpec("dummy.characters")]),
+        "constant": "fixed",
+    }
+    s_schema = StatsSchema.from_specs(specs, field=dummy_field)
+
+    expected_record = {"dummy_number": 2, "collins": "defines", "nest": "ABC", "constant": "fixed"}
+
+    assert s_schema.create(iterations=2) == [expected_record, expected_record]
+    assert s_schema.create_columns(iterations=2) == {k: [v, v] for k, v in expected_record.items()}
+
+
+def test_from_specs_invalid_arguments(dummy_field):
+
+    with pytest.raises(TypeError):
+        StatsSchema.from_specs({"dummy_number": FieldSpec("dummy.one", missing=1)}, field=dummy_field)
+
+
+def test_unnest_layout():
+
+    first = {"level0.1": {"level1.0": 1, "level1.1": 2}, "level0.0": "example1"}
+
+    layout = _UnnestLayout(first, UnnestPlan())
+
+    assert layout(first) == {"level1.0": 1, "level1.1": 2, "level0.0": "example1"}
+    assert layout({"level0.1": {"level1.0": 3}, "level0.0": "example2"}) == {"level1.0": 3, "level0.0": "example2"}
+    with pytest.raises(KeyError):
+        layout({"level0.1": {"level0.0": 1, "level1.1": 2}, "level0.0": "example1"})
+
+
+@pytest.mark.parametrize(
+    "plan, expected_result",
+    [
+        (UnnestPlan(), {"id": 1, "count": 2, "address": {"count": 3, "town": "A"}}),
+        (UnnestPlan.create(depth=0), {"id": 1, "household": {"count": 2, "address": {"count": 3, "town": "A"}}}),
+        (UnnestPlan.create(exclude=["address"], depth=2), {"id": 1, "count": 2, "address": {"count": 3, "town": "A"}}),
+        (
+            UnnestPlan.create(depth=2, collisions="prefix"),
+            {"id": 1, "household.count": 2, "household.address.count": 3, "town": "A"},
+        ),
+        (
+            UnnestPlan.create(depth=2, separator="_", rename={"household_address_count": "address_count"}),
+            {"id": 1, "count": 2, "address_count": 3, "town": "A"},
+        ),
+    ],
+)
+def test_unnest_plan(plan, expected_result):
+
+    record = {"id": 1, "household": {"count": 2, "address": {"count": 3, "town": "A"}}}
+
+    assert plan.unnest(record) == expected_result
+    assert list(_UnnestLayout(record, plan)(record).items()) == list(expected_result.items())
+
+
+def test_unnest_plan_collisions():
+
+    with pytest.raises(KeyError):
+        UnnestPlan.create(depth=2).unnest({"household": {"count": 2, "address": {"count": 3}}})
+    with pytest.raises(ValueError):
+        UnnestPlan.create(collisions="ignore")
+
+
+def test_unnest_plan_schema(dummy_field):
+
+    s_schema = StatsSchema(
+        schema=lambda: {
+            "a": dummy_field("dummy.dictionary"),
+            "b": dummy_field("dummy.dictionary"),
+            "nest": {"inner": dummy_field("dummy.dictionary")},
+        }
+    )
+    plan = UnnestPlan.create(depth=2, collisions="prefix")
+    expected_result = {"a.collins": "defines", "b.collins": "defines", "nest.inner.collins": "defines"}
+
+    assert s_schema.create(iterations=2, exclude_from_unnesting=plan) == [expected_result] * 2
+    assert s_schema.create_columns(iterations=2, exclude_from_unnesting=plan) == {
+        k: [v] * 2 for k, v in expected_result.items()
+    }
+    with pytest.raises(KeyError):
+        s_schema.create(iterations=1)
+
+
+def test_create_columns_missingness(dummy_field):
+
+    s_schema = StatsSchema(schema=lambda: {"dummy_number": dummy_field("dummy.one")})
+
+    result = s_schema.create_columns(iterations=2, missingness=Missingness({"dummy_number": 1}))
+
+    assert result["dummy_number"].tolist() == [None, None]
+
+
+def test_buffered_field(common_seed):
+
+    field = StatsField(seed=common_seed, buffer_size=64)
+    schema = lambda: {  # noqa: E731
+        "choice": field("discrete_distribution", population=["A", "B", "C"], weights=[0.2, 0.3, 0.5]),
+        "number": field("generic_distribution", func="normal"),
+    }
+    s_schema = StatsSchema(schema=schema)
+
+    result = s_schema.create(iterations=100)
+    field.reseed(common_seed)
+
+    assert s_schema.create(iterations=100) == result
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_aiter(common_seed, workers):
+
+    field = StatsField(seed=common_seed)
+    s_schema = StatsSchema(
+        schema=lambda: {"choice": field("discrete_distribution", population=["A", "B"], weights=[0.5, 0.5])}
+    )
+
+    async def consume(limit=None):
+        batches = []
+        iterator = s_schema.aiter(iterations=250, batch_size=100, prefetch=2, workers=workers)
+        async for batch in iterator:
+            batches.append(batch)
+            if len(batches) == limit:
+                break
+        await iterator.aclose()
+        return batches
+
+    loop = asyncio.new_event_loop()
+    try:
+        batches = loop.run_until_complete(consume())
+        first = loop.run_until_complete(consume(limit=1))
+    finally:
+        loop.close()
+
+    assert [len(batch) for batch in batches] == [100, 100, 50]
+    assert batches == list(s_schema.chunk_iterator(iterations=250, shard_size=100))
+    assert first == batches[:1]
+    assert stats_schema._worker_schema is None
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_aiter_backpressure(dummy_field, workers):
+    """Generation stops at prefetch batches ahead, and when the iterator is closed"""
+
+    import multiprocessing
+
+    calls = multiprocessing.Value("i", 0)
+
+    def count():
+        with calls.get_lock():
+            calls.value += 1
+
+    s_schema = StatsSchema(schema=lambda: {"dummy_number": dummy_field("dummy.one"), "count": count()})
+
+    async def consume_one():
+        iterator = s_schema.aiter(iterations=200, batch_size=10, prefetch=1, workers=workers)
+        async for _ in iterator:
+            await asyncio.sleep(0.2)
+            break
+        await iterator.aclose()
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(consume_one())
+    finally:
+        loop.close()
+    generated = calls.value
+    time.sleep(0.2)
+
+    # one record finds the fields, then the batch consumed and the one prefetched
+    assert generated == calls.value == 21
+
+
+def test_create_columns_categorical(common_seed, tmp_path):
+
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    field = StatsField(seed=common_seed)
+    s_schema = StatsSchema(
+        schema=lambda: {
+            "choice": field("discrete_distribution", population=["A", "B"], weights=[0.5, 0.5]),
+            "number": field("generic_distribution", func="normal"),
+        }
+    )
+
+    result = s_schema.create_columns(iterations=10, categorical=True, missingness=Missingness({"choice": 0.5}, seed=1))
+
+    assert isinstance(result["choice"], CategoricalColumn)
+    assert isinstance(result["number"], np.ndarray)
+
+    path = tmp_path / "categorical.parquet"
+    s_schema.to_parquet(str(path), iterations=10, batch_size=5, categorical=True)
+    table = pq.read_table(str(path))
+
+    assert pa.types.is_dictionary(table.schema.field("choice").type)
+
+
+def test_profile(common_seed):
+
+    field = StatsField(seed=common_seed)
+    s_schema = StatsSchema(
+        schema=lambda: {
+            "name": field("person.full_name"),
+            "choice": field("discrete_distribution", population=["A", "B"], weights=[0.5, 0.5]),
+        }
+    )
+
+    with s_schema.profile() as report:
+        s_schema.create(iterations=10)
+        s_schema.create_columns(iterations=10)
+    s_schema.create(iterations=10)
+
+    assert field.report is None
+    assert report["person.full_name"].calls == 20
+    assert (report["discrete_distribution"].calls, report["discrete_distribution"].values) == (11, 20)
+
+
+def test_profile_field_in_expression(dummy_field):
+
+    s_schema = StatsSchema(
+        schema=lambda: {"id": f"ID-{dummy_field('dummy.characters')}", "plus_one": dummy_field("dummy.one") + 1}
+    )
+
+    with s_schema.profile() as report:
+        s_schema.create(iterations=5)
+
+    assert [(profile.name, profile.calls) for profile in sorted(report.fields())] == [
+        ("dummy.characters", 5),
+        ("dummy.one", 5),
+    ]
+
+
+def test_profile_compiled(dummy_field):
+
+    s_schema = StatsSchema.from_specs(
+        {"number": FieldSpec("dummy.one"), "nest": FieldSpec("choice", items=[FieldSpec("dummy.one")])}, dummy_field
+    )
+
+    with s_schema.profile() as report:
+        s_schema.create(iterations=5)
+
+    assert [(profile.name, profile.calls) for profile in sorted(report.fields())] == [
+        ("choice", 5),
+        ("dummy.one", 10),
+    ]
+
+
+def test_stats_field_lazy_providers(common_seed):
+
+    field = StatsField(seed=common_seed, buffer_size=8)
+
+    assert not any(isinstance(value, BaseProvider) for value in vars(field._gen).values())
+
+    field("multi_variable.dependent_variables", variable_names=["a"], options=[(1,)], weights=[1])
+    field("person.full_name")
+
+    assert [name for name, value in vars(field._gen).items() if isinstance(value, BaseProvider)] == [
+        "multi_variable",
+        "person",
+    ]
+    assert field._gen.multi_variable.buffer_size == 8
+    assert "distribution" in dir(field._gen)
+
+
+def test_default_providers_names():
+
+    for name, module, class_name in _DEFAULT_PROVIDERS:
+        assert getattr(importlib.import_module(module), class_name).Meta.name == name
+
+
+def test_stats_schema_import_defers_providers():
+
+    code = "import sys, mimesis_stats.stats_schema; print(sorted(sys.modules))"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+
+    modules = subprocess.run([sys.executable, "-c", code], env=env, stdout=subprocess.PIPE, check=True).stdout
+
+    assert b"mimesis_stats.providers.distribution" not in modules
+    assert b"'asyncio'" not in modules